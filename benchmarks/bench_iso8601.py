@@ -0,0 +1,96 @@
+# coding: utf-8
+
+"""
+Benchmark of the ISO 8601 parser on full transaction pages.
+
+Builds 90 days of ``getTransactionList`` pages (100 transactions each,
+from ``payloads/transaction.json``) and times parsing their
+``bookingDate`` and ``valueDate`` strings with ``dateutil`` and with
+:func:`rbczpremiumapi.iso8601.parse_datetime` (memo cleared before every
+run), and building a :class:`~rbczpremiumapi.TransactionFrame` from the
+pages (needs NumPy) with either parser.
+
+Run from the repository root (or with the package installed)::
+
+    PYTHONPATH=. python benchmarks/bench_iso8601.py [--number N]
+"""
+
+import argparse
+import datetime
+import timeit
+from unittest import mock
+
+from dateutil.parser import isoparse, parse
+
+from bench_json_codec import transaction_page
+from rbczpremiumapi.iso8601 import parse_datetime
+
+
+def pages(days=90, per_day=40, size=100):
+    template = transaction_page(size)["transactions"]
+    transactions = []
+    start = datetime.date(2024, 1, 1)
+    for n in range(days * per_day):
+        day = start + datetime.timedelta(days=n // per_day)
+        transaction = dict(template[n % size])
+        transaction["entryReference"] = str(n)
+        transaction["bookingDate"] = f"{day}T{8 + n % 10:02d}:{n % 60:02d}:00.0+01:00"
+        transaction["valueDate"] = f"{day}T00:00:00.0+01:00"
+        transactions.append(transaction)
+    return [
+        {"lastPage": n + size >= len(transactions), "transactions": transactions[n:n + size]}
+        for n in range(0, len(transactions), size)
+    ]
+
+
+def _time(func, number):
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--number", type=int, default=3, help="runs per measurement")
+    args = parser.parse_args()
+
+    history = pages()
+    strings = [t[key] for page in history for t in page["transactions"]
+               for key in ("bookingDate", "valueDate")]
+    print(f"{len(history)} pages, {len(strings)} date strings, {len(set(strings))} distinct")
+
+    def cold():
+        parse_datetime.cache_clear()
+        for string in strings:
+            parse_datetime(string)
+
+    baseline = _time(lambda: [parse(s) for s in strings], args.number)
+    print(f"{'parse':<32}{'ms':>9}{'speedup':>10}")
+    for name, func in (
+        ("dateutil.parser.parse", lambda: [parse(s) for s in strings]),
+        ("dateutil.parser.isoparse", lambda: [isoparse(s) for s in strings]),
+        ("parse_datetime, cold memo", cold),
+        ("parse_datetime, warm memo", lambda: [parse_datetime(s) for s in strings]),
+    ):
+        elapsed = _time(func, args.number)
+        print(f"{name:<32}{elapsed:>9.1f}{baseline / elapsed:>9.1f}x")
+
+    try:
+        from rbczpremiumapi.transaction_frame import TransactionFrame
+        TransactionFrame.from_pages(history[:1])
+    except ImportError:
+        print("NumPy is not installed, TransactionFrame skipped")
+        return
+
+    def frame():
+        parse_datetime.cache_clear()
+        TransactionFrame.from_pages(history)
+
+    with mock.patch("rbczpremiumapi.transaction_frame.parse_datetime", isoparse):
+        before = _time(frame, args.number)
+    after = _time(frame, args.number)
+    print(f"{'TransactionFrame.from_pages':<32}{'ms':>9}{'speedup':>10}")
+    print(f"{'with dateutil isoparse':<32}{before:>9.1f}{1:>9.1f}x")
+    print(f"{'with parse_datetime':<32}{after:>9.1f}{before / after:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
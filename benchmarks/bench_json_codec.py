@@ -0,0 +1,85 @@
+# coding: utf-8
+
+"""
+Benchmark of the JSON codecs on transaction and FX-rate payloads.
+
+The payloads are built from the bodies recorded in ``payloads/``:
+
+* ``transactions``: a ``getTransactionList`` page of 100 transactions,
+* ``fx_rates``: a ``getFxRates`` exchange rate list.
+
+Decoding is compared against what ``ApiClient`` did before codecs were
+pluggable, ``json.loads(body.decode("utf-8"))``.  Codecs whose package is
+not installed are skipped.
+
+Run from the repository root (or with the package installed)::
+
+    PYTHONPATH=. python benchmarks/bench_json_codec.py [--number N]
+"""
+
+import argparse
+import copy
+import json
+import os
+import timeit
+
+from rbczpremiumapi.json_codec import JsonCodec, MsgspecCodec, OrjsonCodec
+
+PAYLOADS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "payloads")
+
+
+def _load(name):
+    with open(os.path.join(PAYLOADS, name), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def transaction_page(size=100):
+    transaction = _load("transaction.json")
+    transactions = []
+    for n in range(size):
+        item = copy.deepcopy(transaction)
+        item["entryReference"] = str(int(transaction["entryReference"]) + n)
+        item["amount"]["value"] = round(transaction["amount"]["value"] + n * 10.01, 2)
+        transactions.append(item)
+    return {"lastPage": False, "transactions": transactions}
+
+
+def fx_rates():
+    return _load("fx_rates.json")
+
+
+def _codecs():
+    codecs = [JsonCodec()]
+    for codec in (OrjsonCodec, MsgspecCodec):
+        try:
+            codecs.append(codec())
+        except ImportError:
+            pass
+    return codecs
+
+
+def _time(func, number):
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--number", type=int, default=500, help="calls per measurement")
+    args = parser.parse_args()
+
+    print(f"{'payload':<14}{'codec':<10}{'size':>9}{'loads µs':>11}{'speedup':>9}{'dumps µs':>11}")
+    for name, document in (("transactions", transaction_page()), ("fx_rates", fx_rates())):
+        body = json.dumps(document, ensure_ascii=False).encode("utf-8")
+        baseline = _time(lambda: json.loads(body.decode("utf-8")), args.number)
+        print(f"{name:<14}{'baseline':<10}{len(body):>9}{baseline:>11.1f}{1:>8.2f}x"
+              f"{_time(lambda: json.dumps(document), args.number):>11.1f}")
+        for codec in _codecs():
+            assert codec.loads(body) == document
+            loads = _time(lambda: codec.loads(body), args.number)
+            dumps = _time(lambda: codec.dumps(document), args.number)
+            print(f"{name:<14}{codec.name:<10}{len(body):>9}{loads:>11.1f}"
+                  f"{baseline / loads:>8.2f}x{dumps:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# coding: utf-8
+
+"""
+Benchmark of lazily validated transaction entry details.
+
+Measures the time to decode a 1000-entry ``getTransactionList`` page as
+``ApiClient`` does in the ``"model"`` response mode (``from_json``) and
+in the ``"lazy"`` one (decoded by the configured JSON codec, then
+validated with ``entry_details`` left for first use), and read, from
+every transaction, increasingly more of it: nothing, the amount and
+booking date, the variable symbol (four levels into ``entry_details``),
+and everything (``model_dump``).
+
+Run from the repository root (or with the package installed)::
+
+    PYTHONPATH=. python benchmarks/bench_lazy.py
+"""
+
+import json
+import timeit
+
+from bench_json_codec import transaction_page
+from rbczpremiumapi.json_codec import default_codec
+from rbczpremiumapi.lazy import lazy_converter
+from rbczpremiumapi.Model import GetTransactionList200Response
+
+SIZE = 1000
+
+
+def _nothing(transaction):
+    pass
+
+
+def _amount(transaction):
+    return transaction.amount.value, transaction.booking_date
+
+
+def _variable_symbol(transaction):
+    details = transaction.entry_details.transaction_details
+    return (transaction.amount.value, transaction.booking_date,
+            details.remittance_information.creditor_reference_information.variable)
+
+
+def _everything(transaction):
+    return transaction.model_dump()
+
+
+def main():
+    codec = default_codec()
+    body = json.dumps(transaction_page(SIZE)).encode("utf-8")
+    to_lazy = lazy_converter(GetTransactionList200Response)
+    modes = (
+        ("model", lambda: GetTransactionList200Response.from_json(body)),
+        ("lazy", lambda: to_lazy(codec.loads(body))),
+    )
+    print(f"{SIZE} transactions per page, codec {codec.name}, ms/page")
+    print(f"{'read':<18}" + "".join(f"{mode:>10}" for mode, _ in modes))
+    for name, read in (
+        ("nothing", _nothing),
+        ("amount, date", _amount),
+        ("variable symbol", _variable_symbol),
+        ("everything", _everything),
+    ):
+        row = f"{name:<18}"
+        for _, build in modes:
+            def run():
+                for transaction in build().transactions:
+                    read(transaction)
+
+            row += f"{min(timeit.repeat(run, number=5, repeat=3)) / 5 * 1e3:>10.1f}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# coding: utf-8
+
+"""
+Benchmark of memory use of models and records for transaction pages.
+
+Measures the memory retained per transaction by a decoded 1000-entry
+``getTransactionList`` page, as models (``GetTransactionList200Response``)
+and as records (``_response_mode="records"``), and the time to build
+each.  Two pages are used: copies of ``payloads/transaction.json``, and
+the same with a distinct counterparty, IBAN and message per transaction.
+
+Run from the repository root (or with the package installed)::
+
+    PYTHONPATH=. python benchmarks/bench_records.py
+"""
+
+import gc
+import json
+import timeit
+import tracemalloc
+
+from bench_json_codec import transaction_page
+from rbczpremiumapi.json_codec import default_codec
+from rbczpremiumapi.Model import GetTransactionList200Response
+from rbczpremiumapi.records import record_converter
+
+SIZE = 1000
+
+
+def distinct_page():
+    page = transaction_page(SIZE)
+    for n, transaction in enumerate(page["transactions"]):
+        details = transaction["entryDetails"]["transactionDetails"]
+        counter_party = details["relatedParties"]["counterParty"]
+        counter_party["name"] = f"Firma {n} s.r.o."
+        counter_party["account"]["iban"] = f"CZ08{n:020d}"
+        details["remittanceInformation"]["unstructured"] = f"Faktura {n}"
+    return page
+
+
+def _retained(func):
+    gc.collect()
+    tracemalloc.start()
+    result = func()  # noqa: F841 (kept alive while measuring)
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size
+
+
+def main():
+    codec = default_codec()
+    to_record = record_converter(GetTransactionList200Response)
+    print(f"{SIZE} transactions per page, codec {codec.name}")
+    print(f"{'page':<10}{'mode':<9}{'bytes/tx':>10}{'ratio':>8}{'ms/page':>10}")
+    for name, page in (("copies", transaction_page(SIZE)), ("distinct", distinct_page())):
+        body = json.dumps(page).encode("utf-8")
+        modes = (
+            ("model", lambda: GetTransactionList200Response.from_json(body)),
+            ("records", lambda: to_record(codec.loads(body))),
+        )
+        baseline = None
+        for mode, build in modes:
+            size = _retained(build) / SIZE
+            baseline = baseline or size
+            elapsed = min(timeit.repeat(build, number=5, repeat=3)) / 5 * 1e3
+            print(f"{name:<10}{mode:<9}{size:>10.0f}{baseline / size:>7.1f}x{elapsed:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -60,3 +60,10 @@ from rbczpremiumapi.Model.import_payments200_response import ImportPayments200Re
 from rbczpremiumapi.Model.import_payments400_response import ImportPayments400Response
 from rbczpremiumapi.Model.import_payments413_response import ImportPayments413Response
 from rbczpremiumapi.Model.import_payments415_response import ImportPayments415Response
+
+# resolve the forward references between the models once, at import
+from rbczpremiumapi.model_base import ApiModel as _ApiModel
+for _model in list(globals().values()):
+    if isinstance(_model, type) and issubclass(_model, _ApiModel) and _model is not _ApiModel:
+        _model.model_rebuild()
+del _model
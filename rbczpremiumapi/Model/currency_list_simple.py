@@ -18,11 +18,12 @@ from typing import Dict, List, Optional, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .exchange_rate_list import ExchangeRateList
-from pydantic import BaseModel, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from pydantic import Field, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from rbczpremiumapi.model_base import ApiModel
 
 
-class CurrencyListSimple(BaseModel):
+class CurrencyListSimple(ApiModel):
 
-    exchange_rate_lists: List['ExchangeRateList']
+    exchange_rate_lists: List['ExchangeRateList'] = Field(alias='exchangeRateLists')
 
 
@@ -15,24 +15,25 @@
 
 from datetime import date, datetime
 from typing import Dict, List, Optional, Union
-from pydantic import BaseModel, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from pydantic import Field, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from rbczpremiumapi.model_base import ApiModel
 
 """
 Request values for the statement download.
 """
 
-class DownloadStatementRequest(BaseModel):
+class DownloadStatementRequest(ApiModel):
     """
     Request values for the statement download.
     """
 
     # Number of the account without prefix and bank code.
-    account_number: str
+    account_number: str = Field(alias='accountNumber')
     # Currency of the requested currency folder.
-    currency: Optional[str] = None
+    currency: Optional[str] = Field(default=None, alias='currency')
     # Public id of the statement.
-    statement_id: str
+    statement_id: str = Field(alias='statementId')
     # The format of the statement.
-    statement_format: str
+    statement_format: str = Field(alias='statementFormat')
 
 
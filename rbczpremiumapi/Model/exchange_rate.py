@@ -15,29 +15,30 @@
 
 from datetime import date, datetime
 from typing import Dict, List, Optional, Union
-from pydantic import BaseModel, StrictBool, StrictFloat, StrictInt, StrictStr, validator
-
-
-class ExchangeRate(BaseModel):
-
-    country_flag_path: Optional[str] = None
-    currency_from: str
-    currency_to: str
-    exchange_rate_buy: float
-    exchange_rate_buy_cash: float
-    exchange_rate_center: float
-    exchange_rate_center_change: float
-    exchange_rate_sell: float
-    exchange_rate_sell_cash: float
-    exchange_rate_sell_center: float
-    exchange_rate_sell_center_previous: float
-    exchange_rate_ecb_rate: Optional[float] = None
-    exchange_rate_ecb_variation: Optional[float] = None
-    fixed_country_code: Optional[str] = None
-    fixed_country_name: Optional[str] = None
-    quotation_type: str
-    units_from: int
-    variable_country_code: Optional[str] = None
-    variable_country_name: Optional[str] = None
+from pydantic import Field, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from rbczpremiumapi.model_base import ApiModel
+
+
+class ExchangeRate(ApiModel):
+
+    country_flag_path: Optional[str] = Field(default=None, alias='countryFlagPath')
+    currency_from: str = Field(alias='currencyFrom')
+    currency_to: str = Field(alias='currencyTo')
+    exchange_rate_buy: float = Field(alias='exchangeRateBuy')
+    exchange_rate_buy_cash: float = Field(alias='exchangeRateBuyCash')
+    exchange_rate_center: float = Field(alias='exchangeRateCenter')
+    exchange_rate_center_change: float = Field(alias='exchangeRateCenterChange')
+    exchange_rate_sell: float = Field(alias='exchangeRateSell')
+    exchange_rate_sell_cash: float = Field(alias='exchangeRateSellCash')
+    exchange_rate_sell_center: float = Field(alias='exchangeRateSellCenter')
+    exchange_rate_sell_center_previous: float = Field(alias='exchangeRateSellCenterPrevious')
+    exchange_rate_ecb_rate: Optional[float] = Field(default=None, alias='exchangeRateEcbRate')
+    exchange_rate_ecb_variation: Optional[float] = Field(default=None, alias='exchangeRateEcbVariation')
+    fixed_country_code: Optional[str] = Field(default=None, alias='fixedCountryCode')
+    fixed_country_name: Optional[str] = Field(default=None, alias='fixedCountryName')
+    quotation_type: str = Field(alias='quotationType')
+    units_from: int = Field(alias='unitsFrom')
+    variable_country_code: Optional[str] = Field(default=None, alias='variableCountryCode')
+    variable_country_name: Optional[str] = Field(default=None, alias='variableCountryName')
 
 
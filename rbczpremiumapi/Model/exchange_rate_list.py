@@ -18,16 +18,17 @@ from typing import Dict, List, Optional, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .exchange_rate import ExchangeRate
-from pydantic import BaseModel, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from pydantic import Field, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from rbczpremiumapi.model_base import ApiModel
 
 
-class ExchangeRateList(BaseModel):
+class ExchangeRateList(ApiModel):
 
-    effective_date_from: datetime
-    effective_date_to: Optional[datetime] = None
-    trading_date: datetime
-    ordinal_number: int
-    last_rates: bool
-    exchange_rates: List['ExchangeRate']
+    effective_date_from: datetime = Field(alias='effectiveDateFrom')
+    effective_date_to: Optional[datetime] = Field(default=None, alias='effectiveDateTo')
+    trading_date: datetime = Field(alias='tradingDate')
+    ordinal_number: int = Field(alias='ordinalNumber')
+    last_rates: bool = Field(alias='lastRates')
+    exchange_rates: List['ExchangeRate'] = Field(alias='exchangeRates')
 
 
@@ -18,24 +18,25 @@ from typing import Dict, List, Optional, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .get_accounts200_response_accounts_inner import GetAccounts200ResponseAccountsInner
-from pydantic import BaseModel, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from pydantic import Field, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from rbczpremiumapi.model_base import ApiModel
 
 
-class GetAccounts200Response(BaseModel):
+class GetAccounts200Response(ApiModel):
 
     # An array of accounts.
-    accounts: Optional[List['GetAccounts200ResponseAccountsInner']] = None
+    accounts: Optional[List['GetAccounts200ResponseAccountsInner']] = Field(default=None, alias='accounts')
     # actual returned page
-    page: Optional[int] = None
+    page: Optional[int] = Field(default=None, alias='page')
     # Number of items on the page
-    size: Optional[int] = None
+    size: Optional[int] = Field(default=None, alias='size')
     # true for first page
-    first: Optional[bool] = None
+    first: Optional[bool] = Field(default=None, alias='first')
     # true for last page
-    last: Optional[bool] = None
+    last: Optional[bool] = Field(default=None, alias='last')
     # total number of pages
-    total_pages: Optional[int] = None
+    total_pages: Optional[int] = Field(default=None, alias='totalPages')
     # total number of items
-    total_size: Optional[int] = None
+    total_size: Optional[int] = Field(default=None, alias='totalSize')
 
 
@@ -15,30 +15,31 @@
 
 from datetime import date, datetime
 from typing import Dict, List, Optional, Union
-from pydantic import BaseModel, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from pydantic import Field, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from rbczpremiumapi.model_base import ApiModel
 
 
-class GetAccounts200ResponseAccountsInner(BaseModel):
+class GetAccounts200ResponseAccountsInner(ApiModel):
 
     # The unique internal account id
-    account_id: int
+    account_id: int = Field(alias='accountId')
     # The account name
-    account_name: Optional[str] = None
+    account_name: Optional[str] = Field(default=None, alias='accountName')
     # The account nick name
-    friendly_name: Optional[str] = None
+    friendly_name: Optional[str] = Field(default=None, alias='friendlyName')
     # The account number without prefix
-    account_number: str
+    account_number: str = Field(alias='accountNumber')
     # The account number prefix
-    account_number_prefix: Optional[str] = None
+    account_number_prefix: Optional[str] = Field(default=None, alias='accountNumberPrefix')
     # The account number in IBAN format
-    iban: Optional[str] = None
+    iban: Optional[str] = Field(default=None, alias='iban')
     # The bank clearing code
-    bank_code: str
+    bank_code: str = Field(alias='bankCode')
     # The bank BIC (SWIFT) code
-    bank_bic_code: Optional[str] = None
+    bank_bic_code: Optional[str] = Field(default=None, alias='bankBicCode')
     # The main currency of the account
-    main_currency: Optional[str] = None
+    main_currency: Optional[str] = Field(default=None, alias='mainCurrency')
     # The account type
-    account_type_id: Optional[str] = None
+    account_type_id: Optional[str] = Field(default=None, alias='accountTypeId')
 
 
@@ -18,24 +18,25 @@ from typing import Dict, List, Optional, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .get_balance200_response_currency_folders_inner import GetBalance200ResponseCurrencyFoldersInner
-from pydantic import BaseModel, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from pydantic import Field, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from rbczpremiumapi.model_base import ApiModel
 
 """
 Account with balances
 """
 
-class GetBalance200Response(BaseModel):
+class GetBalance200Response(ApiModel):
     """
     Account with balances
     """
 
     # The prefix of the account number
-    number_part1: Optional[str] = None
+    number_part1: Optional[str] = Field(default=None, alias='numberPart1')
     # The account number without prefix
-    number_part2: str
+    number_part2: str = Field(alias='numberPart2')
     # The bank clearing code
-    bank_code: str
+    bank_code: str = Field(alias='bankCode')
     # The available currency folders information.
-    currency_folders: Optional[List['GetBalance200ResponseCurrencyFoldersInner']] = None
+    currency_folders: Optional[List['GetBalance200ResponseCurrencyFoldersInner']] = Field(default=None, alias='currencyFolders')
 
 
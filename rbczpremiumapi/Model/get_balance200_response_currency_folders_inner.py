@@ -18,16 +18,17 @@ from typing import Dict, List, Optional, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .get_balance200_response_currency_folders_inner_balances_inner import GetBalance200ResponseCurrencyFoldersInnerBalancesInner
-from pydantic import BaseModel, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from pydantic import Field, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from rbczpremiumapi.model_base import ApiModel
 
 
-class GetBalance200ResponseCurrencyFoldersInner(BaseModel):
+class GetBalance200ResponseCurrencyFoldersInner(ApiModel):
 
     # The currency of the currency folder
-    currency: str
+    currency: str = Field(alias='currency')
     # The status of the currency folder (CATALOG: CURRENCYFOLDERSTATUS)
-    status: str
+    status: str = Field(alias='status')
     # the balances of the currencyFolder
-    balances: Optional[List['GetBalance200ResponseCurrencyFoldersInnerBalancesInner']] = None
+    balances: Optional[List['GetBalance200ResponseCurrencyFoldersInnerBalancesInner']] = Field(default=None, alias='balances')
 
 
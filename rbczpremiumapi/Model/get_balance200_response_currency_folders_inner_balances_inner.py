@@ -15,16 +15,17 @@
 
 from datetime import date, datetime
 from typing import Dict, List, Optional, Union
-from pydantic import BaseModel, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from pydantic import Field, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from rbczpremiumapi.model_base import ApiModel
 
 
-class GetBalance200ResponseCurrencyFoldersInnerBalancesInner(BaseModel):
+class GetBalance200ResponseCurrencyFoldersInnerBalancesInner(ApiModel):
 
     # the balance type (CODEBOOK: AccountBalanceTypes)
-    balance_type: str
+    balance_type: str = Field(alias='balanceType')
     # The currency of the balance
-    currency: str
+    currency: str = Field(alias='currency')
     # The balance amount
-    value: float
+    value: float = Field(alias='value')
 
 
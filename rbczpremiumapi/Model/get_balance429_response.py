@@ -15,12 +15,13 @@
 
 from datetime import date, datetime
 from typing import Dict, List, Optional, Union
-from pydantic import BaseModel, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from pydantic import Field, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from rbczpremiumapi.model_base import ApiModel
 
 
-class GetBalance429Response(BaseModel):
+class GetBalance429Response(ApiModel):
 
-    error: Optional[str] = None
-    error_description: Optional[str] = None
+    error: Optional[str] = Field(default=None, alias='error')
+    error_description: Optional[str] = Field(default=None, alias='error_description')
 
 
@@ -18,17 +18,18 @@ from typing import Dict, List, Optional, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .get_batch_detail200_response_batch_items_inner import GetBatchDetail200ResponseBatchItemsInner
-from pydantic import BaseModel, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from pydantic import Field, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from rbczpremiumapi.model_base import ApiModel
 
 
-class GetBatchDetail200Response(BaseModel):
+class GetBatchDetail200Response(ApiModel):
 
     # Batch name
-    batch_name: Optional[str] = None
+    batch_name: Optional[str] = Field(default=None, alias='batchName')
     # Status of batch file import
-    batch_file_status: Optional[str] = None
+    batch_file_status: Optional[str] = Field(default=None, alias='batchFileStatus')
     # The date when the batch was created
-    create_date: Optional[date] = None
-    batch_items: Optional[List['GetBatchDetail200ResponseBatchItemsInner']] = None
+    create_date: Optional[date] = Field(default=None, alias='createDate')
+    batch_items: Optional[List['GetBatchDetail200ResponseBatchItemsInner']] = Field(default=None, alias='batchItems')
 
 
@@ -18,25 +18,26 @@ from typing import Dict, List, Optional, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .get_batch_detail200_response_batch_items_inner_account_info import GetBatchDetail200ResponseBatchItemsInnerAccountInfo
-from pydantic import BaseModel, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from pydantic import Field, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from rbczpremiumapi.model_base import ApiModel
 
 
-class GetBatchDetail200ResponseBatchItemsInner(BaseModel):
+class GetBatchDetail200ResponseBatchItemsInner(ApiModel):
 
-    account_info: Optional['GetBatchDetail200ResponseBatchItemsInnerAccountInfo'] = None
+    account_info: Optional['GetBatchDetail200ResponseBatchItemsInnerAccountInfo'] = Field(default=None, alias='accountInfo')
     # Number of payments within the batch
-    number_of_payments: Optional[int] = None
+    number_of_payments: Optional[int] = Field(default=None, alias='numberOfPayments')
     # Sum amount
-    sum_amount: Optional[float] = None
+    sum_amount: Optional[float] = Field(default=None, alias='sumAmount')
     # The currency folder identification (CATALOG: CURRENCIES)
-    sum_amount_currency_id: Optional[str] = None
+    sum_amount_currency_id: Optional[str] = Field(default=None, alias='sumAmountCurrencyId')
     # Batch transaction package payment type
-    batch_type: Optional[str] = None
+    batch_type: Optional[str] = Field(default=None, alias='batchType')
     # Bacth transaction package status
-    status: Optional[str] = None
+    status: Optional[str] = Field(default=None, alias='status')
     # Name of user assigned to batch transaction package
-    assigned_user_name: Optional[str] = None
+    assigned_user_name: Optional[str] = Field(default=None, alias='assignedUserName')
     # Date and time of last change of batch transaction package
-    last_change_date_time: Optional[datetime] = None
+    last_change_date_time: Optional[datetime] = Field(default=None, alias='lastChangeDateTime')
 
 
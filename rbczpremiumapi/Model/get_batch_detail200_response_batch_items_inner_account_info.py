@@ -15,24 +15,25 @@
 
 from datetime import date, datetime
 from typing import Dict, List, Optional, Union
-from pydantic import BaseModel, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from pydantic import Field, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from rbczpremiumapi.model_base import ApiModel
 
 """
 Account info detail
 """
 
-class GetBatchDetail200ResponseBatchItemsInnerAccountInfo(BaseModel):
+class GetBatchDetail200ResponseBatchItemsInnerAccountInfo(ApiModel):
     """
     Account info detail
     """
 
     # Account Id.
-    account_id: int
+    account_id: int = Field(alias='accountId')
     # Charged account number prefix
-    account_number_prefix: Optional[str] = None
+    account_number_prefix: Optional[str] = Field(default=None, alias='accountNumberPrefix')
     # Charged account number
-    account_number: str
+    account_number: str = Field(alias='accountNumber')
     # The currency folder identification (CATALOG: CURRENCIES)
-    main_currency_id: str
+    main_currency_id: str = Field(alias='mainCurrencyId')
 
 
@@ -18,24 +18,25 @@ from typing import Dict, List, Optional, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .get_statements200_response_statements_inner import GetStatements200ResponseStatementsInner
-from pydantic import BaseModel, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from pydantic import Field, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from rbczpremiumapi.model_base import ApiModel
 
 
-class GetStatements200Response(BaseModel):
+class GetStatements200Response(ApiModel):
 
     # An array of statements.
-    statements: List['GetStatements200ResponseStatementsInner']
+    statements: List['GetStatements200ResponseStatementsInner'] = Field(alias='statements')
     # Page number.
-    page: int
+    page: int = Field(alias='page')
     # Page size.
-    size: int
+    size: int = Field(alias='size')
     # Is this the first page?
-    first: bool
+    first: bool = Field(alias='first')
     # Is this the last page?
-    last: bool
+    last: bool = Field(alias='last')
     # Total number of pages.
-    total_pages: int
+    total_pages: int = Field(alias='totalPages')
     # Total number of items.
-    total_size: int
+    total_size: int = Field(alias='totalSize')
 
 
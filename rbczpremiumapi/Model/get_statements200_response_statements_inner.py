@@ -15,24 +15,25 @@
 
 from datetime import date, datetime
 from typing import Dict, List, Optional, Union
-from pydantic import BaseModel, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from pydantic import Field, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from rbczpremiumapi.model_base import ApiModel
 
 
-class GetStatements200ResponseStatementsInner(BaseModel):
+class GetStatements200ResponseStatementsInner(ApiModel):
 
     # public id of the statement
-    statement_id: str
+    statement_id: str = Field(alias='statementId')
     # account id
-    account_id: int
+    account_id: int = Field(alias='accountId')
     # number of the statement
-    statement_number: str
+    statement_number: str = Field(alias='statementNumber')
     # valid date from for statement
-    date_from: date
+    date_from: date = Field(alias='dateFrom')
     # valid date to for statement
-    date_to: date
+    date_to: date = Field(alias='dateTo')
     # currency of the statement
-    currency: Optional[str] = None
+    currency: Optional[str] = Field(default=None, alias='currency')
     # set of document available formats (always in upper case notation).
-    statement_formats: List[str]
+    statement_formats: List[str] = Field(alias='statementFormats')
 
 
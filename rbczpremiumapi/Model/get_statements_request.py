@@ -15,25 +15,26 @@
 
 from datetime import date, datetime
 from typing import Dict, List, Optional, Union
-from pydantic import BaseModel, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from pydantic import Field, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from rbczpremiumapi.model_base import ApiModel
 
 """
 Request values for list of a statements.
 """
 
-class GetStatementsRequest(BaseModel):
+class GetStatementsRequest(ApiModel):
     """
     Request values for list of a statements.
     """
 
-    account_number: str
+    account_number: str = Field(alias='accountNumber')
     # Currency of the requested currency folder.
-    currency: Optional[str] = None
+    currency: Optional[str] = Field(default=None, alias='currency')
     # Statement line identification.
-    statement_line: Optional[str] = None
+    statement_line: Optional[str] = Field(default=None, alias='statementLine')
     # Date limit from.
-    date_from: Optional[date] = None
+    date_from: Optional[date] = Field(default=None, alias='dateFrom')
     # Date limit to.
-    date_to: Optional[date] = None
+    date_to: Optional[date] = Field(default=None, alias='dateTo')
 
 
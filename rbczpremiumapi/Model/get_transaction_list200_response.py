@@ -18,14 +18,15 @@ from typing import Dict, List, Optional, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .get_transaction_list200_response_transactions_inner import GetTransactionList200ResponseTransactionsInner
-from pydantic import BaseModel, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from pydantic import Field, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from rbczpremiumapi.model_base import ApiModel
 
 
-class GetTransactionList200Response(BaseModel):
+class GetTransactionList200Response(ApiModel):
 
     # Indication wheter the page is last - default false
-    last_page: Optional[bool] = None
+    last_page: Optional[bool] = Field(default=None, alias='lastPage')
     # An array of transactions.
-    transactions: Optional[List['GetTransactionList200ResponseTransactionsInner']] = None
+    transactions: Optional[List['GetTransactionList200ResponseTransactionsInner']] = Field(default=None, alias='transactions')
 
 
@@ -20,20 +20,21 @@ if TYPE_CHECKING:
     from .get_transaction_list200_response_transactions_inner_amount import GetTransactionList200ResponseTransactionsInnerAmount
     from .get_transaction_list200_response_transactions_inner_entry_details import GetTransactionList200ResponseTransactionsInnerEntryDetails
     from .get_transaction_list200_response_transactions_inner_bank_transaction_code import GetTransactionList200ResponseTransactionsInnerBankTransactionCode
-from pydantic import BaseModel, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from pydantic import Field, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from rbczpremiumapi.model_base import ApiModel
 
 
-class GetTransactionList200ResponseTransactionsInner(BaseModel):
+class GetTransactionList200ResponseTransactionsInner(ApiModel):
 
     # Unique identification of the realized transaction.
-    entry_reference: str
-    amount: 'GetTransactionList200ResponseTransactionsInnerAmount'
-    credit_debit_indication: str
+    entry_reference: str = Field(alias='entryReference')
+    amount: 'GetTransactionList200ResponseTransactionsInnerAmount' = Field(alias='amount')
+    credit_debit_indication: str = Field(alias='creditDebitIndication')
     # Date of payment processing/posting by the bank.
-    booking_date: Optional[datetime] = None
+    booking_date: Optional[datetime] = Field(default=None, alias='bookingDate')
     # Transaction date; value date; date which is used to count interest; e.g. date when money were withdrawn from ATM.
-    value_date: Optional[datetime] = None
-    bank_transaction_code: 'GetTransactionList200ResponseTransactionsInnerBankTransactionCode'
-    entry_details: Optional['GetTransactionList200ResponseTransactionsInnerEntryDetails'] = None
+    value_date: Optional[datetime] = Field(default=None, alias='valueDate')
+    bank_transaction_code: 'GetTransactionList200ResponseTransactionsInnerBankTransactionCode' = Field(alias='bankTransactionCode')
+    entry_details: Optional['GetTransactionList200ResponseTransactionsInnerEntryDetails'] = Field(default=None, alias='entryDetails')
 
 
@@ -15,14 +15,15 @@
 
 from datetime import date, datetime
 from typing import Dict, List, Optional, Union
-from pydantic import BaseModel, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from pydantic import Field, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from rbczpremiumapi.model_base import ApiModel
 
 
-class GetTransactionList200ResponseTransactionsInnerAmount(BaseModel):
+class GetTransactionList200ResponseTransactionsInnerAmount(ApiModel):
 
     # Amount of money
-    value: float
+    value: float = Field(alias='value')
     # Currency code of the amount
-    currency: str
+    currency: str = Field(alias='currency')
 
 
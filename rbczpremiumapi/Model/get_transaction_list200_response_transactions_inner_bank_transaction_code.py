@@ -15,12 +15,13 @@
 
 from datetime import date, datetime
 from typing import Dict, List, Optional, Union
-from pydantic import BaseModel, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from pydantic import Field, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from rbczpremiumapi.model_base import ApiModel
 
 
-class GetTransactionList200ResponseTransactionsInnerBankTransactionCode(BaseModel):
+class GetTransactionList200ResponseTransactionsInnerBankTransactionCode(ApiModel):
 
     # Transaction code in ISO20022 camt.53 format (e.g. 10000101000 - Odchozi tuzemska platba).
-    code: str
+    code: str = Field(alias='code')
 
 
@@ -18,11 +18,12 @@ from typing import Dict, List, Optional, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .get_transaction_list200_response_transactions_inner_entry_details_transaction_details import GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetails
-from pydantic import BaseModel, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from pydantic import Field, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from rbczpremiumapi.model_base import ApiModel
 
 
-class GetTransactionList200ResponseTransactionsInnerEntryDetails(BaseModel):
+class GetTransactionList200ResponseTransactionsInnerEntryDetails(ApiModel):
 
-    transaction_details: Optional['GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetails'] = None
+    transaction_details: Optional['GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetails'] = Field(default=None, alias='transactionDetails')
 
 
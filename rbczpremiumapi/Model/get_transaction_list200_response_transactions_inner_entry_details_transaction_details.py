@@ -21,17 +21,18 @@ if TYPE_CHECKING:
     from .get_transaction_list200_response_transactions_inner_entry_details_transaction_details_instructed_amount import GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsInstructedAmount
     from .get_transaction_list200_response_transactions_inner_entry_details_transaction_details_references import GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsReferences
     from .get_transaction_list200_response_transactions_inner_entry_details_transaction_details_remittance_information import GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsRemittanceInformation
-from pydantic import BaseModel, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from pydantic import Field, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from rbczpremiumapi.model_base import ApiModel
 
 
-class GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetails(BaseModel):
+class GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetails(ApiModel):
 
-    references: Optional['GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsReferences'] = None
-    instructed_amount: Optional['GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsInstructedAmount'] = None
-    charge_bearer: Optional[str] = None
+    references: Optional['GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsReferences'] = Field(default=None, alias='references')
+    instructed_amount: Optional['GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsInstructedAmount'] = Field(default=None, alias='instructedAmount')
+    charge_bearer: Optional[str] = Field(default=None, alias='chargeBearer')
     # Masked payment card number, if the transaction is related to debit card.
-    payment_card_number: Optional[str] = None
-    related_parties: Optional['GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsRelatedParties'] = None
-    remittance_information: Optional['GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsRemittanceInformation'] = None
+    payment_card_number: Optional[str] = Field(default=None, alias='paymentCardNumber')
+    related_parties: Optional['GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsRelatedParties'] = Field(default=None, alias='relatedParties')
+    remittance_information: Optional['GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsRemittanceInformation'] = Field(default=None, alias='remittanceInformation')
 
 
@@ -15,21 +15,22 @@
 
 from datetime import date, datetime
 from typing import Dict, List, Optional, Union
-from pydantic import BaseModel, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from pydantic import Field, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from rbczpremiumapi.model_base import ApiModel
 
 """
 Original amount in original currency - before currency conversion.
 """
 
-class GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsInstructedAmount(BaseModel):
+class GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsInstructedAmount(ApiModel):
     """
     Original amount in original currency - before currency conversion.
     """
 
     # Amount of money
-    value: float
+    value: float = Field(alias='value')
     # Currency code of the amount
-    currency: str
-    exchange_rate: Optional[float] = None
+    currency: str = Field(alias='currency')
+    exchange_rate: Optional[float] = Field(default=None, alias='exchangeRate')
 
 
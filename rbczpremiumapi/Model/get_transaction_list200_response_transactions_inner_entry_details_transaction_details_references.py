@@ -15,12 +15,13 @@
 
 from datetime import date, datetime
 from typing import Dict, List, Optional, Union
-from pydantic import BaseModel, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from pydantic import Field, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from rbczpremiumapi.model_base import ApiModel
 
 
-class GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsReferences(BaseModel):
+class GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsReferences(ApiModel):
 
     # Originator reference ID - End to End ID; The Originator&#39;s reference of the transaction
-    end_to_end_identification: Optional[str] = None
+    end_to_end_identification: Optional[str] = Field(default=None, alias='endToEndIdentification')
 
 
@@ -20,13 +20,14 @@ if TYPE_CHECKING:
     from .get_transaction_list200_response_transactions_inner_entry_details_transaction_details_related_parties_intermediary_institution import GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsRelatedPartiesIntermediaryInstitution
     from .get_transaction_list200_response_transactions_inner_entry_details_transaction_details_related_parties_ultimate_counter_party import GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsRelatedPartiesUltimateCounterParty
     from .get_transaction_list200_response_transactions_inner_entry_details_transaction_details_related_parties_counter_party import GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsRelatedPartiesCounterParty
-from pydantic import BaseModel, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from pydantic import Field, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from rbczpremiumapi.model_base import ApiModel
 
 
-class GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsRelatedParties(BaseModel):
+class GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsRelatedParties(ApiModel):
 
-    counter_party: Optional['GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsRelatedPartiesCounterParty'] = None
-    intermediary_institution: Optional['GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsRelatedPartiesIntermediaryInstitution'] = None
-    ultimate_counter_party: Optional['GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsRelatedPartiesUltimateCounterParty'] = None
+    counter_party: Optional['GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsRelatedPartiesCounterParty'] = Field(default=None, alias='counterParty')
+    intermediary_institution: Optional['GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsRelatedPartiesIntermediaryInstitution'] = Field(default=None, alias='intermediaryInstitution')
+    ultimate_counter_party: Optional['GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsRelatedPartiesUltimateCounterParty'] = Field(default=None, alias='ultimateCounterParty')
 
 
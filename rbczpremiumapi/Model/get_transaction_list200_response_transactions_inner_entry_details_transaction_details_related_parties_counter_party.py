@@ -20,21 +20,22 @@ if TYPE_CHECKING:
     from .get_transaction_list200_response_transactions_inner_entry_details_transaction_details_related_parties_counter_party_account import GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsRelatedPartiesCounterPartyAccount
     from .get_transaction_list200_response_transactions_inner_entry_details_transaction_details_related_parties_counter_party_postal_address import GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsRelatedPartiesCounterPartyPostalAddress
     from .get_transaction_list200_response_transactions_inner_entry_details_transaction_details_related_parties_counter_party_organisation_identification import GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsRelatedPartiesCounterPartyOrganisationIdentification
-from pydantic import BaseModel, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from pydantic import Field, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from rbczpremiumapi.model_base import ApiModel
 
 """
 Information about counter party (debtor or creditor) - always the other side of the transaction.
 """
 
-class GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsRelatedPartiesCounterParty(BaseModel):
+class GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsRelatedPartiesCounterParty(ApiModel):
     """
     Information about counter party (debtor or creditor) - always the other side of the transaction.
     """
 
     # Bank account name
-    name: Optional[str] = None
-    postal_address: Optional['GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsRelatedPartiesCounterPartyPostalAddress'] = None
-    organisation_identification: Optional['GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsRelatedPartiesCounterPartyOrganisationIdentification'] = None
-    account: Optional['GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsRelatedPartiesCounterPartyAccount'] = None
+    name: Optional[str] = Field(default=None, alias='name')
+    postal_address: Optional['GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsRelatedPartiesCounterPartyPostalAddress'] = Field(default=None, alias='postalAddress')
+    organisation_identification: Optional['GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsRelatedPartiesCounterPartyOrganisationIdentification'] = Field(default=None, alias='organisationIdentification')
+    account: Optional['GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsRelatedPartiesCounterPartyAccount'] = Field(default=None, alias='account')
 
 
@@ -15,16 +15,17 @@
 
 from datetime import date, datetime
 from typing import Dict, List, Optional, Union
-from pydantic import BaseModel, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from pydantic import Field, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from rbczpremiumapi.model_base import ApiModel
 
 
-class GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsRelatedPartiesCounterPartyAccount(BaseModel):
+class GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsRelatedPartiesCounterPartyAccount(ApiModel):
 
     # IBAN code of the bank account if available
-    iban: Optional[str] = None
+    iban: Optional[str] = Field(default=None, alias='iban')
     # Prefix part of the bank account number (only for czech accounts)
-    account_number_prefix: Optional[str] = None
+    account_number_prefix: Optional[str] = Field(default=None, alias='accountNumberPrefix')
     # Base part of the bank account number in czech fromat or in foreign format
-    account_number: Optional[str] = None
+    account_number: Optional[str] = Field(default=None, alias='accountNumber')
 
 
@@ -18,16 +18,17 @@ from typing import Dict, List, Optional, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .get_transaction_list200_response_transactions_inner_entry_details_transaction_details_related_parties_counter_party_organisation_identification_postal_address import GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsRelatedPartiesCounterPartyOrganisationIdentificationPostalAddress
-from pydantic import BaseModel, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from pydantic import Field, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from rbczpremiumapi.model_base import ApiModel
 
 
-class GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsRelatedPartiesCounterPartyOrganisationIdentification(BaseModel):
+class GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsRelatedPartiesCounterPartyOrganisationIdentification(ApiModel):
 
-    name: Optional[str] = None
+    name: Optional[str] = Field(default=None, alias='name')
     # SWIFT/BIC code of the bank.
-    bic_or_bei: Optional[str] = None
+    bic_or_bei: Optional[str] = Field(default=None, alias='bicOrBei')
     # Proprietary bank code in local format (e.g. 5500) or in foreign format.
-    bank_code: Optional[str] = None
-    postal_address: Optional['GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsRelatedPartiesCounterPartyOrganisationIdentificationPostalAddress'] = None
+    bank_code: Optional[str] = Field(default=None, alias='bankCode')
+    postal_address: Optional['GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsRelatedPartiesCounterPartyOrganisationIdentificationPostalAddress'] = Field(default=None, alias='postalAddress')
 
 
@@ -15,18 +15,19 @@
 
 from datetime import date, datetime
 from typing import Dict, List, Optional, Union
-from pydantic import BaseModel, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from pydantic import Field, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from rbczpremiumapi.model_base import ApiModel
 
 
-class GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsRelatedPartiesIntermediaryInstitutionPostalAddress(BaseModel):
+class GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsRelatedPartiesIntermediaryInstitutionPostalAddress(ApiModel):
 
     # Street or 2nd line of the address
-    street: Optional[str] = None
+    street: Optional[str] = Field(default=None, alias='street')
     # City or 3nd line of the address
-    city: Optional[str] = None
+    city: Optional[str] = Field(default=None, alias='city')
     # Short address
-    short_address: Optional[str] = None
+    short_address: Optional[str] = Field(default=None, alias='shortAddress')
     # Country code - 4th line of the address.
-    country: Optional[str] = None
+    country: Optional[str] = Field(default=None, alias='country')
 
 
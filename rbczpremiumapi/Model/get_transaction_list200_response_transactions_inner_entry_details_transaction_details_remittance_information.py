@@ -18,21 +18,22 @@ from typing import Dict, List, Optional, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .get_transaction_list200_response_transactions_inner_entry_details_transaction_details_remittance_information_creditor_reference_information import GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsRemittanceInformationCreditorReferenceInformation
-from pydantic import BaseModel, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from pydantic import Field, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from rbczpremiumapi.model_base import ApiModel
 
 """
 Information that allow match and pairing transactions or further identifies it.
 """
 
-class GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsRemittanceInformation(BaseModel):
+class GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsRemittanceInformation(ApiModel):
     """
     Information that allow match and pairing transactions or further identifies it.
     """
 
     # Information from or for counter party. Information for creditor.
-    unstructured: Optional[str] = None
-    creditor_reference_information: Optional['GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsRemittanceInformationCreditorReferenceInformation'] = None
+    unstructured: Optional[str] = Field(default=None, alias='unstructured')
+    creditor_reference_information: Optional['GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsRemittanceInformationCreditorReferenceInformation'] = Field(default=None, alias='creditorReferenceInformation')
     # Private description of the transaction. Only available to account holder.
-    originator_message: Optional[str] = None
+    originator_message: Optional[str] = Field(default=None, alias='originatorMessage')
 
 
@@ -15,16 +15,17 @@
 
 from datetime import date, datetime
 from typing import Dict, List, Optional, Union
-from pydantic import BaseModel, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from pydantic import Field, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from rbczpremiumapi.model_base import ApiModel
 
 
-class GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsRemittanceInformationCreditorReferenceInformation(BaseModel):
+class GetTransactionList200ResponseTransactionsInnerEntryDetailsTransactionDetailsRemittanceInformationCreditorReferenceInformation(ApiModel):
 
     # Variable symbol
-    variable: Optional[str] = None
+    variable: Optional[str] = Field(default=None, alias='variable')
     # Constant symbol
-    constant: Optional[str] = None
+    constant: Optional[str] = Field(default=None, alias='constant')
     # Specific symbol
-    specific: Optional[str] = None
+    specific: Optional[str] = Field(default=None, alias='specific')
 
 
@@ -15,12 +15,13 @@
 
 from datetime import date, datetime
 from typing import Dict, List, Optional, Union
-from pydantic import BaseModel, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from pydantic import Field, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from rbczpremiumapi.model_base import ApiModel
 
 
-class ImportPayments200Response(BaseModel):
+class ImportPayments200Response(ApiModel):
 
     # ID of created batch file
-    batch_file_id: Optional[int] = None
+    batch_file_id: Optional[int] = Field(default=None, alias='batchFileId')
 
 
@@ -15,13 +15,14 @@
 
 from datetime import date, datetime
 from typing import Dict, List, Optional, Union
-from pydantic import BaseModel, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from pydantic import Field, StrictBool, StrictFloat, StrictInt, StrictStr, validator
+from rbczpremiumapi.model_base import ApiModel
 
 
-class ImportPayments400Response(BaseModel):
+class ImportPayments400Response(ApiModel):
 
     # * INVALID_BATCH_IMPORT_FORMAT - Batch-Import-Format unsupported * BATCH_CONTENT_INVALID - Batch content doesn&#39;t match to declared Batch-Import-Format * BATCH_ALREADY_IMPORTED - Batch has already been imported (based on checksum) 
-    error: Optional[str] = None
-    error_description: Optional[str] = None
+    error: Optional[str] = Field(default=None, alias='error')
+    error_description: Optional[str] = Field(default=None, alias='error_description')
 
 
@@ -13,17 +13,10 @@
     Do not edit the class manually.
 """
 
-from typing import Dict, List, Optional, Union, Any, TYPE_CHECKING
-import requests
-import json
-from urllib.parse import urljoin
+from typing import TYPE_CHECKING
 
-# Import necessary dependencies for API operations  
-from pydantic import Field, StrictBytes, StrictStr, field_validator
-from typing_extensions import Annotated
-
-# Import models and API client
-from ..api_client import ApiClient
+# Import API client
+from ..api_client import ApiClient, ApiOperation
 
 # Import models for type hints
 if TYPE_CHECKING:
@@ -49,6 +42,23 @@ if TYPE_CHECKING:
 
 class DownloadStatementApi:
 
+    _download_statement_operation = ApiOperation(
+        operation_id="downloadStatement",
+        method="POST",
+        resource_path="/rbcz/premium/api/accounts/statements/download",
+        response_types_map={
+            "200": "bytearray",
+            "204": None,
+            "400": "GetStatements400Response",
+            "401": "GetBalance401Response",
+            "403": "GetBalance403Response",
+            "404": "GetBalance404Response",
+            "429": "GetBalance429Response",
+        },
+        content_type="application/json",
+        accept="*/*",
+    )
+
     def __init__(self, api_client=None):
         if api_client is None:
             api_client = ApiClient()
@@ -89,8 +99,8 @@ class DownloadStatementApi:
         if request_body is None:
             raise ValueError("Missing the required parameter `request_body` when calling `download_statement`")
 
-        # Construct URL
-        url = self.api_client.configuration.host + "/rbcz/premium/api/accounts/statements/download"
+        # Prepare path parameters
+        path_params = {}
 
         # Prepare headers
         headers = {}
@@ -112,15 +122,11 @@ class DownloadStatementApi:
             body = request_body
 
         # Make request
-        response = self.api_client.call_api(
-            resource_path="/rbcz/premium/api/accounts/statements/download",
-            method="POST",
-            headers=headers,
+        return self.api_client.call_operation(
+            self._download_statement_operation,
+            path_params=path_params,
             query_params=query_params,
+            header_params=headers,
             body=body,
-            response_type="bytearray",
             **kwargs
         )
-
-        return response
-
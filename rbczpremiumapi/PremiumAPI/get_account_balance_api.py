@@ -13,17 +13,10 @@
     Do not edit the class manually.
 """
 
-from typing import Dict, List, Optional, Union, Any, TYPE_CHECKING
-import requests
-import json
-from urllib.parse import urljoin
+from typing import TYPE_CHECKING
 
-# Import necessary dependencies for API operations  
-from pydantic import Field, StrictBytes, StrictStr, field_validator
-from typing_extensions import Annotated
-
-# Import models and API client
-from ..api_client import ApiClient
+# Import API client
+from ..api_client import ApiClient, ApiOperation
 
 # Import models for type hints
 if TYPE_CHECKING:
@@ -49,6 +42,21 @@ if TYPE_CHECKING:
 
 class GetAccountBalanceApi:
 
+    _get_balance_operation = ApiOperation(
+        operation_id="getBalance",
+        method="GET",
+        resource_path="/rbcz/premium/api/accounts/{accountNumber}/balance",
+        response_types_map={
+            "200": "GetBalance200Response",
+            "401": "GetBalance401Response",
+            "403": "GetBalance403Response",
+            "404": "GetBalance404Response",
+            "429": "GetBalance429Response",
+        },
+        content_type=None,
+        accept="application/json",
+    )
+
     def __init__(self, api_client=None):
         if api_client is None:
             api_client = ApiClient()
@@ -85,9 +93,9 @@ class GetAccountBalanceApi:
         if account_number is None:
             raise ValueError("Missing the required parameter `account_number` when calling `get_balance`")
 
-        # Construct URL
-        url = self.api_client.configuration.host + "/rbcz/premium/api/accounts/{accountNumber}/balance"
-        url = url.replace("{" + "account_number" + "}", str(account_number))
+        # Prepare path parameters
+        path_params = {}
+        path_params["accountNumber"] = account_number
 
         # Prepare headers
         headers = {}
@@ -105,15 +113,11 @@ class GetAccountBalanceApi:
         body = None
 
         # Make request
-        response = self.api_client.call_api(
-            resource_path="/rbcz/premium/api/accounts/{accountNumber}/balance",
-            method="GET",
-            headers=headers,
+        return self.api_client.call_operation(
+            self._get_balance_operation,
+            path_params=path_params,
             query_params=query_params,
+            header_params=headers,
             body=body,
-            response_type="GetBalance200Response",
             **kwargs
         )
-
-        return response
-
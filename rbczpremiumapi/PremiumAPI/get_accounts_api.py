@@ -13,17 +13,10 @@
     Do not edit the class manually.
 """
 
-from typing import Dict, List, Optional, Union, Any, TYPE_CHECKING
-import requests
-import json
-from urllib.parse import urljoin
+from typing import TYPE_CHECKING
 
-# Import necessary dependencies for API operations  
-from pydantic import Field, StrictBytes, StrictStr, field_validator
-from typing_extensions import Annotated
-
-# Import models and API client
-from ..api_client import ApiClient
+# Import API client
+from ..api_client import ApiClient, ApiOperation
 
 # Import models for type hints
 if TYPE_CHECKING:
@@ -49,6 +42,22 @@ if TYPE_CHECKING:
 
 class GetAccountsApi:
 
+    _get_accounts_operation = ApiOperation(
+        operation_id="getAccounts",
+        method="GET",
+        resource_path="/rbcz/premium/api/accounts",
+        response_types_map={
+            "200": "GetAccounts200Response",
+            "204": None,
+            "401": "GetBalance401Response",
+            "403": "GetBalance403Response",
+            "429": "GetBalance429Response",
+        },
+        content_type=None,
+        accept="application/json",
+        response_modes=("model", "records", "lazy"),
+    )
+
     def __init__(self, api_client=None):
         if api_client is None:
             api_client = ApiClient()
@@ -77,6 +86,8 @@ class GetAccountsApi:
         :type _preload_content: bool, optional
         :param _request_auth: set to override the auth_settings for an request.
         :type _request_auth: dict, optional
+        :param _response_mode: "records" to return read-only records, built without validation, instead of models; "lazy" to validate nested models such as entry details on first use.
+        :type _response_mode: str, optional
         :return: Returns the result object.
         :rtype: GetAccounts200Response
         """
@@ -85,8 +96,8 @@ class GetAccountsApi:
         if x_request_id is None:
             raise ValueError("Missing the required parameter `x_request_id` when calling `get_accounts`")
 
-        # Construct URL
-        url = self.api_client.configuration.host + "/rbcz/premium/api/accounts"
+        # Prepare path parameters
+        path_params = {}
 
         # Prepare headers
         headers = {}
@@ -108,15 +119,11 @@ class GetAccountsApi:
         body = None
 
         # Make request
-        response = self.api_client.call_api(
-            resource_path="/rbcz/premium/api/accounts",
-            method="GET",
-            headers=headers,
+        return self.api_client.call_operation(
+            self._get_accounts_operation,
+            path_params=path_params,
             query_params=query_params,
+            header_params=headers,
             body=body,
-            response_type="GetAccounts200Response",
             **kwargs
         )
-
-        return response
-
@@ -13,17 +13,10 @@
     Do not edit the class manually.
 """
 
-from typing import Dict, List, Optional, Union, Any, TYPE_CHECKING
-import requests
-import json
-from urllib.parse import urljoin
+from typing import TYPE_CHECKING
 
-# Import necessary dependencies for API operations  
-from pydantic import Field, StrictBytes, StrictStr, field_validator
-from typing_extensions import Annotated
-
-# Import models and API client
-from ..api_client import ApiClient
+# Import API client
+from ..api_client import ApiClient, ApiOperation
 
 # Import models for type hints
 if TYPE_CHECKING:
@@ -49,6 +42,22 @@ if TYPE_CHECKING:
 
 class GetBatchDetailApi:
 
+    _get_batch_detail_operation = ApiOperation(
+        operation_id="getBatchDetail",
+        method="GET",
+        resource_path="/rbcz/premium/api/payments/batches/{batchFileId}",
+        response_types_map={
+            "200": "GetBatchDetail200Response",
+            "400": "GetBatchDetail400Response",
+            "401": "GetBalance401Response",
+            "403": "GetBalance403Response",
+            "404": "GetBalance404Response",
+            "429": "GetBalance429Response",
+        },
+        content_type=None,
+        accept="application/json",
+    )
+
     def __init__(self, api_client=None):
         if api_client is None:
             api_client = ApiClient()
@@ -85,9 +94,9 @@ class GetBatchDetailApi:
         if batch_file_id is None:
             raise ValueError("Missing the required parameter `batch_file_id` when calling `get_batch_detail`")
 
-        # Construct URL
-        url = self.api_client.configuration.host + "/rbcz/premium/api/payments/batches/{batchFileId}"
-        url = url.replace("{" + "batch_file_id" + "}", str(batch_file_id))
+        # Prepare path parameters
+        path_params = {}
+        path_params["batchFileId"] = batch_file_id
 
         # Prepare headers
         headers = {}
@@ -105,15 +114,11 @@ class GetBatchDetailApi:
         body = None
 
         # Make request
-        response = self.api_client.call_api(
-            resource_path="/rbcz/premium/api/payments/batches/{batchFileId}",
-            method="GET",
-            headers=headers,
+        return self.api_client.call_operation(
+            self._get_batch_detail_operation,
+            path_params=path_params,
             query_params=query_params,
+            header_params=headers,
             body=body,
-            response_type="GetBatchDetail200Response",
             **kwargs
         )
-
-        return response
-
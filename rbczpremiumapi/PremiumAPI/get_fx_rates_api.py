@@ -13,17 +13,10 @@
     Do not edit the class manually.
 """
 
-from typing import Dict, List, Optional, Union, Any, TYPE_CHECKING
-import requests
-import json
-from urllib.parse import urljoin
+from typing import TYPE_CHECKING
 
-# Import necessary dependencies for API operations  
-from pydantic import Field, StrictBytes, StrictStr, field_validator
-from typing_extensions import Annotated
-
-# Import models and API client
-from ..api_client import ApiClient
+# Import API client
+from ..api_client import ApiClient, ApiOperation
 
 # Import models for type hints
 if TYPE_CHECKING:
@@ -49,6 +42,18 @@ if TYPE_CHECKING:
 
 class GetFxRatesApi:
 
+    _get_fx_rates_operation = ApiOperation(
+        operation_id="getFxRates",
+        method="GET",
+        resource_path="/rbcz/premium/api/fxrates/{currencyCode}",
+        response_types_map={
+            "200": "CurrencyListSimple",
+            "429": "GetBalance429Response",
+        },
+        content_type=None,
+        accept="application/json",
+    )
+
     def __init__(self, api_client=None):
         if api_client is None:
             api_client = ApiClient()
@@ -87,9 +92,9 @@ class GetFxRatesApi:
         if currency_code is None:
             raise ValueError("Missing the required parameter `currency_code` when calling `get_fx_rates`")
 
-        # Construct URL
-        url = self.api_client.configuration.host + "/rbcz/premium/api/fxrates/{currencyCode}"
-        url = url.replace("{" + "currency_code" + "}", str(currency_code))
+        # Prepare path parameters
+        path_params = {}
+        path_params["currencyCode"] = currency_code
 
         # Prepare headers
         headers = {}
@@ -109,15 +114,11 @@ class GetFxRatesApi:
         body = None
 
         # Make request
-        response = self.api_client.call_api(
-            resource_path="/rbcz/premium/api/fxrates/{currencyCode}",
-            method="GET",
-            headers=headers,
+        return self.api_client.call_operation(
+            self._get_fx_rates_operation,
+            path_params=path_params,
             query_params=query_params,
+            header_params=headers,
             body=body,
-            response_type="CurrencyListSimple",
             **kwargs
         )
-
-        return response
-
@@ -13,17 +13,10 @@
     Do not edit the class manually.
 """
 
-from typing import Dict, List, Optional, Union, Any, TYPE_CHECKING
-import requests
-import json
-from urllib.parse import urljoin
+from typing import TYPE_CHECKING
 
-# Import necessary dependencies for API operations  
-from pydantic import Field, StrictBytes, StrictStr, field_validator
-from typing_extensions import Annotated
-
-# Import models and API client
-from ..api_client import ApiClient
+# Import API client
+from ..api_client import ApiClient, ApiOperation
 
 # Import models for type hints
 if TYPE_CHECKING:
@@ -49,6 +42,24 @@ if TYPE_CHECKING:
 
 class GetStatementListApi:
 
+    _get_statements_operation = ApiOperation(
+        operation_id="getStatements",
+        method="POST",
+        resource_path="/rbcz/premium/api/accounts/statements",
+        response_types_map={
+            "200": "GetStatements200Response",
+            "204": None,
+            "400": "GetStatements400Response",
+            "401": "GetBalance401Response",
+            "403": "GetBalance403Response",
+            "404": "GetBalance404Response",
+            "429": "GetBalance429Response",
+        },
+        content_type="application/json",
+        accept="application/json",
+        response_modes=("model", "records", "lazy"),
+    )
+
     def __init__(self, api_client=None):
         if api_client is None:
             api_client = ApiClient()
@@ -79,6 +90,8 @@ class GetStatementListApi:
         :type _preload_content: bool, optional
         :param _request_auth: set to override the auth_settings for an request.
         :type _request_auth: dict, optional
+        :param _response_mode: "records" to return read-only records, built without validation, instead of models; "lazy" to validate nested models such as entry details on first use.
+        :type _response_mode: str, optional
         :return: Returns the result object.
         :rtype: GetStatements200Response
         """
@@ -89,8 +102,8 @@ class GetStatementListApi:
         if request_body is None:
             raise ValueError("Missing the required parameter `request_body` when calling `get_statements`")
 
-        # Construct URL
-        url = self.api_client.configuration.host + "/rbcz/premium/api/accounts/statements"
+        # Prepare path parameters
+        path_params = {}
 
         # Prepare headers
         headers = {}
@@ -114,15 +127,11 @@ class GetStatementListApi:
             body = request_body
 
         # Make request
-        response = self.api_client.call_api(
-            resource_path="/rbcz/premium/api/accounts/statements",
-            method="POST",
-            headers=headers,
+        return self.api_client.call_operation(
+            self._get_statements_operation,
+            path_params=path_params,
             query_params=query_params,
+            header_params=headers,
             body=body,
-            response_type="GetStatements200Response",
             **kwargs
         )
-
-        return response
-
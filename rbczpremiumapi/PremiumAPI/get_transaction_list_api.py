@@ -13,17 +13,10 @@
     Do not edit the class manually.
 """
 
-from typing import Dict, List, Optional, Union, Any, TYPE_CHECKING
-import requests
-import json
-from urllib.parse import urljoin
+from typing import TYPE_CHECKING
 
-# Import necessary dependencies for API operations  
-from pydantic import Field, StrictBytes, StrictStr, field_validator
-from typing_extensions import Annotated
-
-# Import models and API client
-from ..api_client import ApiClient
+# Import API client
+from ..api_client import ApiClient, ApiOperation
 
 # Import models for type hints
 if TYPE_CHECKING:
@@ -49,6 +42,24 @@ if TYPE_CHECKING:
 
 class GetTransactionListApi:
 
+    _get_transaction_list_operation = ApiOperation(
+        operation_id="getTransactionList",
+        method="GET",
+        resource_path="/rbcz/premium/api/accounts/{accountNumber}/{currencyCode}/transactions",
+        response_types_map={
+            "200": "GetTransactionList200Response",
+            "204": None,
+            "400": "GetTransactionList400Response",
+            "401": "GetBalance401Response",
+            "403": "GetBalance403Response",
+            "404": "GetBalance404Response",
+            "429": "GetBalance429Response",
+        },
+        content_type=None,
+        accept="application/json",
+        response_modes=("model", "records", "lazy"),
+    )
+
     def __init__(self, api_client=None):
         if api_client is None:
             api_client = ApiClient()
@@ -83,6 +94,8 @@ class GetTransactionListApi:
         :type _preload_content: bool, optional
         :param _request_auth: set to override the auth_settings for an request.
         :type _request_auth: dict, optional
+        :param _response_mode: "records" to return read-only records, built without validation, instead of models; "lazy" to validate nested models such as entry details on first use.
+        :type _response_mode: str, optional
         :return: Returns the result object.
         :rtype: GetTransactionList200Response
         """
@@ -99,10 +112,10 @@ class GetTransactionListApi:
         if to is None:
             raise ValueError("Missing the required parameter `to` when calling `get_transaction_list`")
 
-        # Construct URL
-        url = self.api_client.configuration.host + "/rbcz/premium/api/accounts/{accountNumber}/{currencyCode}/transactions"
-        url = url.replace("{" + "account_number" + "}", str(account_number))
-        url = url.replace("{" + "currency_code" + "}", str(currency_code))
+        # Prepare path parameters
+        path_params = {}
+        path_params["accountNumber"] = account_number
+        path_params["currencyCode"] = currency_code
 
         # Prepare headers
         headers = {}
@@ -126,15 +139,11 @@ class GetTransactionListApi:
         body = None
 
         # Make request
-        response = self.api_client.call_api(
-            resource_path="/rbcz/premium/api/accounts/{accountNumber}/{currencyCode}/transactions",
-            method="GET",
-            headers=headers,
+        return self.api_client.call_operation(
+            self._get_transaction_list_operation,
+            path_params=path_params,
             query_params=query_params,
+            header_params=headers,
             body=body,
-            response_type="GetTransactionList200Response",
             **kwargs
         )
-
-        return response
-
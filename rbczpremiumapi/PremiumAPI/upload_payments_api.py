@@ -13,17 +13,10 @@
     Do not edit the class manually.
 """
 
-from typing import Dict, List, Optional, Union, Any, TYPE_CHECKING
-import requests
-import json
-from urllib.parse import urljoin
+from typing import TYPE_CHECKING
 
-# Import necessary dependencies for API operations  
-from pydantic import Field, StrictBytes, StrictStr, field_validator
-from typing_extensions import Annotated
-
-# Import models and API client
-from ..api_client import ApiClient
+# Import API client
+from ..api_client import ApiClient, ApiOperation
 
 # Import models for type hints
 if TYPE_CHECKING:
@@ -49,6 +42,24 @@ if TYPE_CHECKING:
 
 class UploadPaymentsApi:
 
+    _import_payments_operation = ApiOperation(
+        operation_id="importPayments",
+        method="POST",
+        resource_path="/rbcz/premium/api/payments/batches",
+        response_types_map={
+            "200": "ImportPayments200Response",
+            "400": "ImportPayments400Response",
+            "401": "GetBalance401Response",
+            "403": "GetBalance403Response",
+            "413": "ImportPayments413Response",
+            "415": "ImportPayments415Response",
+            "429": "GetBalance429Response",
+            "500": "ImportPayments415Response",
+        },
+        content_type="text/plain",
+        accept="application/json",
+    )
+
     def __init__(self, api_client=None):
         if api_client is None:
             api_client = ApiClient()
@@ -95,8 +106,8 @@ class UploadPaymentsApi:
         if request_body is None:
             raise ValueError("Missing the required parameter `request_body` when calling `import_payments`")
 
-        # Construct URL
-        url = self.api_client.configuration.host + "/rbcz/premium/api/payments/batches"
+        # Prepare path parameters
+        path_params = {}
 
         # Prepare headers
         headers = {}
@@ -124,15 +135,11 @@ class UploadPaymentsApi:
             body = request_body
 
         # Make request
-        response = self.api_client.call_api(
-            resource_path="/rbcz/premium/api/payments/batches",
-            method="POST",
-            headers=headers,
+        return self.api_client.call_operation(
+            self._import_payments_operation,
+            path_params=path_params,
             query_params=query_params,
+            header_params=headers,
             body=body,
-            response_type="ImportPayments200Response",
             **kwargs
         )
-
-        return response
-
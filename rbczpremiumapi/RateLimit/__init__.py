@@ -9,16 +9,27 @@ via a common storage backend (e.g. shared SQLite/MySQL/PostgreSQL database).
 
 from rbczpremiumapi.RateLimit.rate_limit_store_interface import RateLimitStoreInterface
 from rbczpremiumapi.RateLimit.rate_limiter import RateLimiter
+from rbczpremiumapi.RateLimit.async_rate_limiter import AsyncRateLimiter
+from rbczpremiumapi.RateLimit.sliding_window_log import SlidingWindowLog
 from rbczpremiumapi.RateLimit.rate_limit_exceeded_exception import RateLimitExceededException
-from rbczpremiumapi.RateLimit.sql_dialect import SqlDialect
+from rbczpremiumapi.RateLimit.sql_dialect import SqlDialect, SqliteDialect, PostgresDialect, MySqlDialect
 from rbczpremiumapi.RateLimit.json_rate_limit_store import JsonRateLimitStore
 from rbczpremiumapi.RateLimit.db_rate_limit_store import DbRateLimitStore
+from rbczpremiumapi.RateLimit.in_memory_rate_limit_store import InMemoryRateLimitStore
+from rbczpremiumapi.RateLimit.shared_memory_rate_limit_store import SharedMemoryRateLimitStore
 
 __all__ = [
     "RateLimitStoreInterface",
     "RateLimiter",
+    "AsyncRateLimiter",
+    "SlidingWindowLog",
     "RateLimitExceededException",
     "SqlDialect",
+    "SqliteDialect",
+    "PostgresDialect",
+    "MySqlDialect",
     "JsonRateLimitStore",
     "DbRateLimitStore",
+    "InMemoryRateLimitStore",
+    "SharedMemoryRateLimitStore",
 ]
@@ -0,0 +1,155 @@
+# coding: utf-8
+
+"""
+asyncio flavour of :class:`RateLimiter`.
+
+Waiting for a window is an ``asyncio.sleep`` instead of ``time.sleep``,
+so a throttled client (even one waiting for the day window) never blocks
+the event loop serving the others.  Callers of one client and operation
+wait in a FIFO queue and are woken in the order they arrived.
+
+Store calls that may block (file locks, SQL round-trips) run in a worker
+thread; the in-memory and shared-memory stores answer in
+microseconds and are called directly.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from rbczpremiumapi.RateLimit.in_memory_rate_limit_store import InMemoryRateLimitStore
+from rbczpremiumapi.RateLimit.rate_limit_exceeded_exception import RateLimitExceededException
+from rbczpremiumapi.RateLimit.rate_limit_store_interface import RateLimitStoreInterface
+from rbczpremiumapi.RateLimit.rate_limiter import RateLimiter
+from rbczpremiumapi.RateLimit.shared_memory_rate_limit_store import SharedMemoryRateLimitStore
+
+logger = logging.getLogger(__name__)
+
+_NON_BLOCKING_STORES = (InMemoryRateLimitStore, SharedMemoryRateLimitStore)
+
+
+class AsyncRateLimiter(RateLimiter):
+    """Rate limiter for asyncio applications.
+
+    :param store: storage backend for per-client rate-limit state
+    :param wait_mode: if ``True`` the limiter waits until the window resets;
+        if ``False`` it raises :class:`RateLimitExceededException`
+    :param spacing: if ``True`` requests of one client and operation are
+        spread evenly over the second instead of being sent in bursts
+    :param offload: run store calls in a thread; by default only for
+        stores that may block
+    """
+
+    def __init__(
+        self,
+        store: RateLimitStoreInterface,
+        wait_mode: bool = True,
+        spacing: bool = False,
+        offload: Optional[bool] = None,
+    ) -> None:
+        super().__init__(store, wait_mode=wait_mode, spacing=spacing)
+        if offload is None:
+            offload = not isinstance(store, _NON_BLOCKING_STORES)
+        self._offload = offload
+        # asyncio.Lock wakes its waiters in FIFO order
+        self._queues: Dict[Tuple[str, str], asyncio.Lock] = {}
+
+    async def handle_rate_limits(
+        self,
+        client_id: str,
+        remaining_second: int,
+        remaining_day: int,
+        timestamp: float,
+        operation: Optional[str] = None,
+    ) -> None:
+        """See :meth:`RateLimiter.handle_rate_limits`."""
+        await self._call(
+            super().handle_rate_limits,
+            client_id, remaining_second, remaining_day, timestamp, operation,
+        )
+
+    async def handle_response_headers(
+        self,
+        client_id: str,
+        headers: Mapping[str, Any],
+        operation: Optional[str] = None,
+        timestamp: Optional[float] = None,
+        status: Optional[int] = None,
+    ) -> None:
+        """See :meth:`RateLimiter.handle_response_headers`."""
+        if timestamp is None:
+            timestamp = time.time()
+        remaining_by_window = self._reconcile(client_id, headers, operation, status)
+        if remaining_by_window:
+            await self._call(
+                self._set_many, client_id, remaining_by_window, timestamp, operation
+            )
+
+    async def check_before_request(self, client_id: str, operation: Optional[str] = None) -> None:
+        """Wait until :meth:`acquire` would reserve a request, without reserving it."""
+        async with self._queue(client_id, operation):
+            await self._wait_for(client_id, operation, reserve=False)
+            wait = self._log(client_id, operation).reserve()
+        if wait > 0:
+            logger.debug("Spacing request by %.3f seconds", wait)
+            await asyncio.sleep(wait)
+
+    async def acquire(self, client_id: str, operation: Optional[str] = None, n: int = 1) -> None:
+        """Reserve *n* requests before sending them.
+
+        See :meth:`RateLimiter.acquire`; waiting does not block the loop and
+        concurrent callers are served first come, first served.
+        """
+        async with self._queue(client_id, operation):
+            await self._wait_for(client_id, operation, n=n)
+            self._start(client_id, operation, n)
+            wait = self._log(client_id, operation).reserve(n)
+        if wait > 0:
+            logger.debug("Spacing request by %.3f seconds", wait)
+            await asyncio.sleep(wait)
+
+    # -- private helpers -----------------------------------------------------
+
+    def _queue(self, client_id: str, operation: Optional[str]) -> asyncio.Lock:
+        key = (client_id, operation or "")
+        queue = self._queues.get(key)
+        if queue is None:
+            queue = self._queues[key] = asyncio.Lock()
+        return queue
+
+    async def _wait_for(
+        self, client_id: str, operation: Optional[str], n: int = 1, reserve: bool = True
+    ) -> None:
+        while True:
+            reservations = self._reservations(n, operation)
+            if reserve:
+                await self._call(self._update, client_id, reservations)
+            else:
+                # evaluate against the stored records without writing them back
+                records = await self._call(self._get_raw, client_id, list(reservations.windows))
+                reservations(records)
+            if reservations.wait <= 0:
+                return
+            if reservations.window == "day" and not self._wait_mode:
+                raise RateLimitExceededException("Rate-limit (day window) exceeded")
+            logger.warning(
+                "Rate-limit (%s window) exceeded. Waiting %.3f seconds",
+                reservations.window, reservations.wait,
+            )
+            await asyncio.sleep(reservations.wait)
+
+    def _get_raw(self, client_id: str, keys: List[str]) -> Dict[str, Optional[Dict[str, int]]]:
+        records = {}
+        for key in keys:
+            operation, _, window = key.rpartition(":")
+            if operation:
+                records[key] = self._store.get(client_id, window, operation=operation)
+            else:
+                records[key] = self._store.get(client_id, window)
+        return records
+
+    async def _call(self, fn: Callable[..., Any], *args: Any) -> Any:
+        if self._offload:
+            return await asyncio.to_thread(fn, *args)
+        return fn(*args)
@@ -16,83 +16,312 @@ Table schema::
         timestamp INTEGER NOT NULL,
         PRIMARY KEY (client_id, window)
     )
+
+Operation-scoped records use ``window = '<operation>:<window>'``.
+
+With a :class:`SqlDialect` writes are ``INSERT ... ON CONFLICT DO UPDATE``
+upserts, and :meth:`DbRateLimitStore.set_many` writes all windows in one
+transaction.  Pass a *connection_factory* to give every thread its own
+connection; a single shared connection is serialised with a lock.
+:meth:`DbRateLimitStore.close` closes the connections the factory opened.
+``sqlite3`` connections are switched to WAL journaling with
+``synchronous=NORMAL`` (one fsync per checkpoint instead of per commit);
+a connection passed in must not be inside a transaction for that.
 """
 
 import sqlite3
-from typing import Any, Dict, List, Optional, Union
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
 
-from rbczpremiumapi.RateLimit.rate_limit_store_interface import RateLimitStoreInterface
+from rbczpremiumapi.RateLimit.rate_limit_store_interface import RateLimitStoreInterface, Record
+from rbczpremiumapi.RateLimit.sql_dialect import SqlDialect, SqliteDialect
 
 # Accept any DB-API 2.0 connection object.  sqlite3.Connection is the most
 # common one and the only one we type-hint explicitly, but any PEP 249
 # compliant connection will work.
 Connection = Union[sqlite3.Connection, Any]
 
+_COLUMNS = ("client_id", "window", "remaining", "timestamp")
+
 
 class DbRateLimitStore(RateLimitStoreInterface):
     """Rate-limit store backed by a SQL database (DB-API 2.0).
 
     Compatible with ``sqlite3``, ``psycopg2``, ``mysql-connector-python``, etc.
 
-    :param connection: an open DB-API 2.0 connection
+    :param connection: an open DB-API 2.0 connection shared by all threads,
+        left open by :meth:`close`
     :param placeholder: parameter placeholder style (``"?"`` for sqlite3,
-        ``"%s"`` for psycopg2 / mysql-connector, etc.)
+        ``"%s"`` for psycopg2 / mysql-connector, etc.), used when no
+        *dialect* is given
+    :param dialect: SQL dialect of the database; detected for ``sqlite3``
+    :param connection_factory: callable opening a new connection, used
+        instead of *connection* to open one connection per thread; the
+        connections must be closable from the thread calling :meth:`close`
+        (``check_same_thread=False`` for ``sqlite3``)
     """
 
-    def __init__(self, connection: Connection, placeholder: str = "?") -> None:
-        self._conn = connection
+    def __init__(
+        self,
+        connection: Optional[Connection] = None,
+        placeholder: str = "?",
+        dialect: Optional[SqlDialect] = None,
+        connection_factory: Optional[Callable[[], Connection]] = None,
+    ) -> None:
+        if (connection is None) == (connection_factory is None):
+            raise ValueError("Pass either connection or connection_factory")
         self._ph = placeholder
+        self._factory = connection_factory
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._opened: List[Connection] = []
+        self._conn = connection
+        if connection is not None:
+            _tune(connection)
+        else:
+            connection = self._thread_connection()
+        if dialect is None and _supports_sqlite_upsert(connection):
+            dialect = SqliteDialect()
+        self._dialect = dialect
+        self._upsert_sql = self._build_upsert()
         self._init_table()
 
+    @classmethod
+    def sqlite(cls, database: str, **kwargs: Any) -> "DbRateLimitStore":
+        """Store on the SQLite file *database* with one connection per thread.
+
+        *kwargs* are passed to :func:`sqlite3.connect`.
+        """
+        kwargs.setdefault("check_same_thread", False)
+        return cls(connection_factory=lambda: sqlite3.connect(database, **kwargs))
+
     # -- public interface ----------------------------------------------------
 
-    def get(self, client_id: str, window: str) -> Optional[Dict[str, int]]:
-        ph = self._ph
-        cur = self._conn.cursor()
-        cur.execute(
-            f"SELECT remaining, timestamp FROM rate_limits"
-            f" WHERE client_id = {ph} AND window = {ph}",
-            (client_id, window),
-        )
-        row = cur.fetchone()
+    def get(
+        self, client_id: str, window: str, operation: Optional[str] = None
+    ) -> Optional[Dict[str, int]]:
+        with self._connection() as conn:
+            cur = conn.cursor()
+            cur.execute(
+                f"SELECT remaining, timestamp FROM rate_limits"
+                f" WHERE client_id = {self._p('client_id')} AND window = {self._p('window')}",
+                self._params(client_id=client_id, window=self.window_key(window, operation)),
+            )
+            row = cur.fetchone()
         if row is None:
             return None
         return {"remaining": int(row[0]), "timestamp": int(row[1])}
 
-    def set(self, client_id: str, window: str, remaining: int, timestamp: int) -> None:
-        ph = self._ph
-        cur = self._conn.cursor()
-        cur.execute(
-            f"REPLACE INTO rate_limits (client_id, window, remaining, timestamp)"
-            f" VALUES ({ph}, {ph}, {ph}, {ph})",
-            (client_id, window, remaining, timestamp),
+    def set(
+        self,
+        client_id: str,
+        window: str,
+        remaining: int,
+        timestamp: int,
+        operation: Optional[str] = None,
+    ) -> None:
+        self.set_many(client_id, {window: (remaining, timestamp)}, operation)
+
+    def set_many(
+        self,
+        client_id: str,
+        records: Mapping[str, Tuple[int, int]],
+        operation: Optional[str] = None,
+    ) -> None:
+        self.set_records(
+            client_id,
+            {self.window_key(window, operation): record for window, record in records.items()},
         )
-        self._conn.commit()
+
+    def set_records(self, client_id: str, records: Mapping[str, Tuple[int, int]]) -> None:
+        rows = [
+            self._params(client_id=client_id, window=key, remaining=remaining, timestamp=timestamp)
+            for key, (remaining, timestamp) in records.items()
+        ]
+        with self._connection() as conn:
+            try:
+                conn.cursor().executemany(self._upsert_sql, rows)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+    def update_records(
+        self,
+        client_id: str,
+        keys: Sequence[str],
+        fn: Callable[[Dict[str, Optional[Record]]], Optional[Mapping[str, Record]]],
+    ) -> Optional[Mapping[str, Record]]:
+        with self._connection() as conn:
+            try:
+                cur = conn.cursor()
+                lock = self._begin_update(conn, cur)
+                current: Dict[str, Optional[Record]] = {}
+                for key in keys:
+                    cur.execute(
+                        f"SELECT remaining, timestamp FROM rate_limits"
+                        f" WHERE client_id = {self._p('client_id')}"
+                        f" AND window = {self._p('window')}" + lock,
+                        self._params(client_id=client_id, window=key),
+                    )
+                    row = cur.fetchone()
+                    current[key] = (
+                        {"remaining": int(row[0]), "timestamp": int(row[1])}
+                        if row is not None else None
+                    )
+                records = fn(current)
+                if records:
+                    cur.executemany(self._upsert_sql, [
+                        self._params(
+                            client_id=client_id,
+                            window=key,
+                            remaining=record["remaining"],
+                            timestamp=record["timestamp"],
+                        )
+                        for key, record in records.items()
+                    ])
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+        return records
+
+    def update(
+        self,
+        client_id: str,
+        window: str,
+        fn: Callable[[Optional[Dict[str, int]]], Optional[Dict[str, int]]],
+        operation: Optional[str] = None,
+    ) -> Optional[Dict[str, int]]:
+        key = self.window_key(window, operation)
+        with self._connection() as conn:
+            try:
+                cur = conn.cursor()
+                lock = self._begin_update(conn, cur)
+                cur.execute(
+                    f"SELECT remaining, timestamp FROM rate_limits"
+                    f" WHERE client_id = {self._p('client_id')} AND window = {self._p('window')}"
+                    + lock,
+                    self._params(client_id=client_id, window=key),
+                )
+                row = cur.fetchone()
+                current = None
+                if row is not None:
+                    current = {"remaining": int(row[0]), "timestamp": int(row[1])}
+                record = fn(current)
+                if record is not None:
+                    cur.execute(
+                        self._upsert_sql,
+                        self._params(
+                            client_id=client_id,
+                            window=key,
+                            remaining=record["remaining"],
+                            timestamp=record["timestamp"],
+                        ),
+                    )
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+        return record
 
     def all_for_client(self, client_id: str) -> Dict[str, Dict[str, int]]:
-        ph = self._ph
-        cur = self._conn.cursor()
-        cur.execute(
-            f"SELECT window, remaining, timestamp FROM rate_limits"
-            f" WHERE client_id = {ph}",
-            (client_id,),
-        )
+        with self._connection() as conn:
+            cur = conn.cursor()
+            cur.execute(
+                f"SELECT window, remaining, timestamp FROM rate_limits"
+                f" WHERE client_id = {self._p('client_id')}",
+                self._params(client_id=client_id),
+            )
+            rows = cur.fetchall()
         results: Dict[str, Dict[str, int]] = {}
-        for row in cur.fetchall():
+        for row in rows:
             results[row[0]] = {"remaining": int(row[1]), "timestamp": int(row[2])}
         return results
 
+    def close(self) -> None:
+        """Close the connections opened by the connection factory."""
+        with self._lock:
+            opened, self._opened = self._opened, []
+            self._local = threading.local()
+        for conn in opened:
+            conn.close()
+
     # -- private helpers -----------------------------------------------------
 
-    def _init_table(self) -> None:
-        cur = self._conn.cursor()
-        cur.execute(
-            "CREATE TABLE IF NOT EXISTS rate_limits ("
-            "  client_id TEXT NOT NULL,"
-            "  window TEXT NOT NULL,"
-            "  remaining INTEGER NOT NULL,"
-            "  timestamp INTEGER NOT NULL,"
-            "  PRIMARY KEY (client_id, window)"
-            ")"
+    def _thread_connection(self) -> Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._factory()
+            _tune(conn)
+            with self._lock:
+                self._opened.append(conn)
+                self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _begin_update(conn: Connection, cur: Any) -> str:
+        """Start a read-modify-write; return the clause locking the rows read."""
+        if isinstance(conn, sqlite3.Connection):
+            # take the write lock before reading
+            if not conn.in_transaction:
+                cur.execute("BEGIN IMMEDIATE")
+            return ""
+        return " FOR UPDATE"
+
+    @contextmanager
+    def _connection(self) -> Iterator[Connection]:
+        if self._factory is not None:
+            yield self._thread_connection()
+        else:
+            with self._lock:
+                yield self._conn
+
+    def _p(self, name: str) -> str:
+        if self._dialect is not None:
+            return self._dialect.placeholder(name)
+        return self._ph
+
+    def _params(self, **values: Any) -> Union[Dict[str, Any], Tuple[Any, ...]]:
+        # named parameters for dialects, positional (in order) otherwise
+        if self._dialect is not None:
+            return values
+        return tuple(values.values())
+
+    def _build_upsert(self) -> str:
+        if self._dialect is not None:
+            return self._dialect.upsert("rate_limits", _COLUMNS[:2], _COLUMNS[2:])
+        return (
+            f"REPLACE INTO rate_limits ({', '.join(_COLUMNS)})"
+            f" VALUES ({', '.join(self._ph for _ in _COLUMNS)})"
         )
-        self._conn.commit()
+
+    def _init_table(self) -> None:
+        with self._connection() as conn:
+            cur = conn.cursor()
+            cur.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limits ("
+                "  client_id TEXT NOT NULL,"
+                "  window TEXT NOT NULL,"
+                "  remaining INTEGER NOT NULL,"
+                "  timestamp INTEGER NOT NULL,"
+                "  PRIMARY KEY (client_id, window)"
+                ")"
+            )
+            conn.commit()
+
+
+def _supports_sqlite_upsert(conn: Connection) -> bool:
+    return isinstance(conn, sqlite3.Connection) and sqlite3.sqlite_version_info >= (3, 24, 0)
+
+
+def _tune(conn: Connection) -> None:
+    """Enable WAL journaling with relaxed fsync on sqlite3 connections.
+
+    Both pragmas fail inside a transaction, so such connections are left as
+    they are.
+    """
+    if isinstance(conn, sqlite3.Connection) and not conn.in_transaction:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
@@ -0,0 +1,92 @@
+# coding: utf-8
+
+"""
+In-process rate-limit store.
+
+Keeps the records in a dictionary guarded by a lock.  Suitable when a
+single process (with any number of threads) talks to the API and the
+counters do not have to survive a restart or be shared with PHP.
+"""
+
+import threading
+from typing import Callable, Dict, Mapping, Optional, Sequence, Tuple
+
+from rbczpremiumapi.RateLimit.rate_limit_store_interface import RateLimitStoreInterface, Record
+
+
+class InMemoryRateLimitStore(RateLimitStoreInterface):
+    """Thread-safe rate-limit store living in process memory."""
+
+    def __init__(self) -> None:
+        self._data: Dict[str, Dict[str, Dict[str, int]]] = {}
+        self._lock = threading.Lock()
+
+    # -- public interface ----------------------------------------------------
+
+    def get(
+        self, client_id: str, window: str, operation: Optional[str] = None
+    ) -> Optional[Dict[str, int]]:
+        with self._lock:
+            record = self._data.get(client_id, {}).get(self.window_key(window, operation))
+            return dict(record) if record is not None else None
+
+    def set(
+        self,
+        client_id: str,
+        window: str,
+        remaining: int,
+        timestamp: int,
+        operation: Optional[str] = None,
+    ) -> None:
+        self.set_many(client_id, {window: (remaining, timestamp)}, operation)
+
+    def set_many(
+        self,
+        client_id: str,
+        records: Mapping[str, Tuple[int, int]],
+        operation: Optional[str] = None,
+    ) -> None:
+        self.set_records(
+            client_id,
+            {self.window_key(window, operation): record for window, record in records.items()},
+        )
+
+    def set_records(self, client_id: str, records: Mapping[str, Tuple[int, int]]) -> None:
+        with self._lock:
+            windows = self._data.setdefault(client_id, {})
+            for key, (remaining, timestamp) in records.items():
+                windows[key] = {"remaining": remaining, "timestamp": timestamp}
+
+    def update_records(
+        self,
+        client_id: str,
+        keys: Sequence[str],
+        fn: Callable[[Dict[str, Optional[Record]]], Optional[Mapping[str, Record]]],
+    ) -> Optional[Mapping[str, Record]]:
+        with self._lock:
+            windows = self._data.setdefault(client_id, {})
+            current = {key: windows.get(key) for key in keys}
+            records = fn({key: dict(r) if r is not None else None for key, r in current.items()})
+            for key, record in (records or {}).items():
+                windows[key] = {"remaining": record["remaining"], "timestamp": record["timestamp"]}
+            return records
+
+    def update(
+        self,
+        client_id: str,
+        window: str,
+        fn: Callable[[Optional[Dict[str, int]]], Optional[Dict[str, int]]],
+        operation: Optional[str] = None,
+    ) -> Optional[Dict[str, int]]:
+        key = self.window_key(window, operation)
+        with self._lock:
+            windows = self._data.setdefault(client_id, {})
+            current = windows.get(key)
+            record = fn(dict(current) if current is not None else None)
+            if record is not None:
+                windows[key] = {"remaining": record["remaining"], "timestamp": record["timestamp"]}
+            return record
+
+    def all_for_client(self, client_id: str) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {window: dict(r) for window, r in self._data.get(client_id, {}).items()}
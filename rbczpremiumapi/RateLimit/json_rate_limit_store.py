@@ -12,18 +12,31 @@ JSON layout::
     {
         "<client_id>": {
             "second": {"remaining": 9, "timestamp": 1714780000},
-            "day":    {"remaining": 4999, "timestamp": 1714780000}
+            "day":    {"remaining": 4999, "timestamp": 1714780000},
+            "downloadStatement:second": {"remaining": 4, "timestamp": 1714780000}
         }
     }
+
+Locking follows the PHP store: writers hold an exclusive ``flock`` of the
+JSON file itself while they re-read it, merge their records and rewrite it
+in place, and readers hold a shared one while they read it, so neither
+Python nor PHP processes see a partial file or lose each other's counters.
+(Renaming a new file into place would hand a PHP writer waiting for the
+lock the replaced, unlinked file.)  Writers always re-read the file under
+the lock; readers re-parse it only when its inode, size or mtime changed.
 """
 
 import fcntl
 import json
 import logging
 import os
-from typing import Any, Dict, List, Optional
+import threading
+from contextlib import contextmanager
+from typing import (
+    Any, BinaryIO, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+)
 
-from rbczpremiumapi.RateLimit.rate_limit_store_interface import RateLimitStoreInterface
+from rbczpremiumapi.RateLimit.rate_limit_store_interface import RateLimitStoreInterface, Record
 
 logger = logging.getLogger(__name__)
 
@@ -37,53 +50,168 @@ class JsonRateLimitStore(RateLimitStoreInterface):
     def __init__(self, filename: str) -> None:
         self._filename = filename
         self._data: Dict[str, Any] = {}
-        if os.path.exists(filename):
-            self._load()
+        # (st_ino, st_size, st_mtime_ns) of the file self._data was read from
+        self._signature: Optional[Tuple[int, int, int]] = None
+        # the file held by _locked()
+        self._fh: Optional[BinaryIO] = None
+        self._lock = threading.Lock()
+        self._refresh()
 
     # -- public interface ----------------------------------------------------
 
-    def get(self, client_id: str, window: str) -> Optional[Dict[str, int]]:
-        return self._data.get(client_id, {}).get(window)
+    def get(
+        self, client_id: str, window: str, operation: Optional[str] = None
+    ) -> Optional[Dict[str, int]]:
+        with self._lock:
+            self._refresh()
+            return self._data.get(client_id, {}).get(self.window_key(window, operation))
+
+    def set(
+        self,
+        client_id: str,
+        window: str,
+        remaining: int,
+        timestamp: int,
+        operation: Optional[str] = None,
+    ) -> None:
+        self.set_many(client_id, {window: (remaining, timestamp)}, operation)
+
+    def set_many(
+        self,
+        client_id: str,
+        records: Mapping[str, Tuple[int, int]],
+        operation: Optional[str] = None,
+    ) -> None:
+        self.set_records(
+            client_id,
+            {self.window_key(window, operation): record for window, record in records.items()},
+        )
+
+    def set_records(self, client_id: str, records: Mapping[str, Tuple[int, int]]) -> None:
+        try:
+            with self._locked():
+                windows = self._data.setdefault(client_id, {})
+                for key, (remaining, timestamp) in records.items():
+                    windows[key] = {"remaining": remaining, "timestamp": timestamp}
+                self._save()
+        except OSError as exc:
+            logger.error("Failed to write rate limit store to %s: %s", self._filename, exc)
 
-    def set(self, client_id: str, window: str, remaining: int, timestamp: int) -> None:
-        self._data.setdefault(client_id, {})[window] = {
-            "remaining": remaining,
-            "timestamp": timestamp,
-        }
-        self._save()
+    def update_records(
+        self,
+        client_id: str,
+        keys: Sequence[str],
+        fn: Callable[[Dict[str, Optional[Record]]], Optional[Mapping[str, Record]]],
+    ) -> Optional[Mapping[str, Record]]:
+        records = None
+        try:
+            with self._locked():
+                windows = self._data.get(client_id, {})
+                records = fn({key: windows.get(key) for key in keys})
+                if records:
+                    windows = self._data.setdefault(client_id, {})
+                    for key, record in records.items():
+                        windows[key] = {
+                            "remaining": record["remaining"],
+                            "timestamp": record["timestamp"],
+                        }
+                    self._save()
+        except OSError as exc:
+            logger.error("Failed to write rate limit store to %s: %s", self._filename, exc)
+        return records
+
+    def update(
+        self,
+        client_id: str,
+        window: str,
+        fn: Callable[[Optional[Dict[str, int]]], Optional[Dict[str, int]]],
+        operation: Optional[str] = None,
+    ) -> Optional[Dict[str, int]]:
+        key = self.window_key(window, operation)
+        record = None
+        try:
+            with self._locked():
+                record = fn(self._data.get(client_id, {}).get(key))
+                if record is not None:
+                    self._data.setdefault(client_id, {})[key] = {
+                        "remaining": record["remaining"],
+                        "timestamp": record["timestamp"],
+                    }
+                    self._save()
+        except OSError as exc:
+            logger.error("Failed to write rate limit store to %s: %s", self._filename, exc)
+        return record
 
     def all_for_client(self, client_id: str) -> List[Dict[str, int]]:
-        return self._data.get(client_id, {})
+        with self._lock:
+            self._refresh()
+            return self._data.get(client_id, {})
 
     # -- private helpers -----------------------------------------------------
 
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold the thread lock and an exclusive lock of the file, on its data.
+
+        :meth:`_save` rewrites the locked file before the locks are released.
+        """
+        fd = os.open(self._filename, os.O_RDWR | os.O_CREAT, 0o644)
+        with self._lock, os.fdopen(fd, "r+b") as fh:
+            fcntl.flock(fh, fcntl.LOCK_EX)
+            try:
+                # the mtime may not tell apart writes in the same tick
+                self._data = self._decode(fh.read())
+                self._signature = self._signature_of(os.fstat(fh.fileno()))
+                self._fh = fh
+                yield
+            finally:
+                self._fh = None
+                fcntl.flock(fh, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _signature_of(st: os.stat_result) -> Tuple[int, int, int]:
+        return st.st_ino, st.st_size, st.st_mtime_ns
+
+    def _refresh(self) -> None:
+        """Reload the file if it changed since it was last read or written."""
+        try:
+            st = os.stat(self._filename)
+        except FileNotFoundError:
+            self._data = {}
+            self._signature = None
+            return
+        signature = self._signature_of(st)
+        if signature != self._signature:
+            self._load()
+            self._signature = signature
+
     def _load(self) -> None:
         try:
-            with open(self._filename, "r+b") as fh:
+            with open(self._filename, "rb") as fh:
                 fcntl.flock(fh, fcntl.LOCK_SH)
                 try:
-                    raw = fh.read()
-                    if raw:
-                        self._data = json.loads(raw)
-                    else:
-                        self._data = {}
-                except (json.JSONDecodeError, ValueError) as exc:
-                    logger.error("Failed to decode rate limit JSON: %s", exc)
-                    self._data = {}
+                    self._data = self._decode(fh.read())
                 finally:
                     fcntl.flock(fh, fcntl.LOCK_UN)
         except OSError as exc:
             logger.error("Failed to read rate limit store from %s: %s", self._filename, exc)
             self._data = {}
 
-    def _save(self) -> None:
+    @staticmethod
+    def _decode(raw: bytes) -> Dict[str, Any]:
+        if not raw:
+            return {}
         try:
-            with open(self._filename, "wb") as fh:
-                fcntl.flock(fh, fcntl.LOCK_EX)
-                try:
-                    fh.write(json.dumps(self._data, indent=4).encode("utf-8"))
-                    fh.flush()
-                finally:
-                    fcntl.flock(fh, fcntl.LOCK_UN)
-        except OSError as exc:
-            logger.error("Failed to write rate limit store to %s: %s", self._filename, exc)
+            return json.loads(raw)
+        except (json.JSONDecodeError, ValueError) as exc:
+            logger.error("Failed to decode rate limit JSON: %s", exc)
+            return {}
+
+    def _save(self) -> None:
+        """Rewrite the file locked by :meth:`_locked` in place."""
+        fh = self._fh
+        fh.seek(0)
+        fh.truncate()
+        fh.write(json.dumps(self._data, separators=(",", ":")).encode("utf-8"))
+        fh.flush()
+        self._signature = self._signature_of(os.fstat(fh.fileno()))
@@ -6,10 +6,21 @@ Abstract interface for rate-limit state storage.
 Implementations must store per-client, per-window (second / day) counters
 so that both PHP and Python applications can share rate-limit knowledge
 through a common backend (e.g. a shared database).
+
+The bank limits each API operation separately, so records may also be
+scoped to an *operation*.  Such records are stored under the window key
+``"<operation>:<window>"`` (see :meth:`RateLimitStoreInterface.window_key`);
+records without an operation keep the plain ``"second"`` / ``"day"`` keys
+used by the PHP library, which ignores the operation-scoped ones.
+:meth:`RateLimitStoreInterface.set_records` and
+:meth:`RateLimitStoreInterface.update_records` take such keys directly, so
+plain and scoped records, or several windows, are written in one go.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+Record = Dict[str, int]
 
 
 class RateLimitStoreInterface(ABC):
@@ -20,18 +31,136 @@ class RateLimitStoreInterface(ABC):
 
     * ``remaining`` – number of requests still allowed in the window (int)
     * ``timestamp`` – UNIX epoch (seconds) when the value was observed (int)
+
+    Passing *operation* scopes the record to one API operation; its
+    ``timestamp`` is then in milliseconds.
     """
 
+    @staticmethod
+    def window_key(window: str, operation: Optional[str] = None) -> str:
+        """Return the storage key of *window*, scoped to *operation* if given."""
+        if operation:
+            return f"{operation}:{window}"
+        return window
+
     @abstractmethod
-    def get(self, client_id: str, window: str) -> Optional[Dict[str, int]]:
+    def get(
+        self, client_id: str, window: str, operation: Optional[str] = None
+    ) -> Optional[Dict[str, int]]:
         """Return stored data for *client_id* and *window*, or ``None``."""
         ...
 
     @abstractmethod
-    def set(self, client_id: str, window: str, remaining: int, timestamp: int) -> None:
+    def set(
+        self,
+        client_id: str,
+        window: str,
+        remaining: int,
+        timestamp: int,
+        operation: Optional[str] = None,
+    ) -> None:
         """Persist *remaining* count for *client_id* / *window* at *timestamp*."""
         ...
 
+    def set_many(
+        self,
+        client_id: str,
+        records: Mapping[str, Tuple[int, int]],
+        operation: Optional[str] = None,
+    ) -> None:
+        """Persist several windows of *client_id* at once.
+
+        :param records: ``{window: (remaining, timestamp)}``
+
+        The default implementation calls :meth:`set` for each window;
+        stores override it to write all of them in one go.
+        """
+        for window, (remaining, timestamp) in records.items():
+            if operation:
+                self.set(client_id, window, remaining, timestamp, operation=operation)
+            else:
+                self.set(client_id, window, remaining, timestamp)
+
+    def set_records(self, client_id: str, records: Mapping[str, Tuple[int, int]]) -> None:
+        """Persist records of *client_id* under several keys at once.
+
+        :param records: ``{key: (remaining, timestamp)}`` where *key* is a
+            :meth:`window_key`, so plain and operation-scoped records can be
+            written together
+
+        The default implementation calls :meth:`set` for each key; stores
+        override it to write all of them in one go.
+        """
+        for key, (remaining, timestamp) in records.items():
+            operation, _, window = key.rpartition(":")
+            if operation:
+                self.set(client_id, window, remaining, timestamp, operation=operation)
+            else:
+                self.set(client_id, window, remaining, timestamp)
+
+    def update_records(
+        self,
+        client_id: str,
+        keys: Sequence[str],
+        fn: Callable[[Dict[str, Optional[Record]]], Optional[Mapping[str, Record]]],
+    ) -> Optional[Mapping[str, Record]]:
+        """Atomically replace several records of *client_id*.
+
+        Like :meth:`update` for the :meth:`window_key` *keys* at once: *fn*
+        receives ``{key: record or None}`` and returns the new records by
+        key, or ``None`` to leave them all unchanged.
+
+        The default implementation is a plain :meth:`get` of each key
+        followed by :meth:`set_records` and is *not* atomic.
+        """
+        current: Dict[str, Optional[Record]] = {}
+        for key in keys:
+            operation, _, window = key.rpartition(":")
+            if operation:
+                current[key] = self.get(client_id, window, operation=operation)
+            else:
+                current[key] = self.get(client_id, window)
+        records = fn(current)
+        if records:
+            self.set_records(
+                client_id,
+                {key: (r["remaining"], r["timestamp"]) for key, r in records.items()},
+            )
+        return records
+
+    def update(
+        self,
+        client_id: str,
+        window: str,
+        fn: Callable[[Optional[Dict[str, int]]], Optional[Dict[str, int]]],
+        operation: Optional[str] = None,
+    ) -> Optional[Dict[str, int]]:
+        """Atomically replace the record of *client_id* / *window*.
+
+        *fn* receives the current record (or ``None``) and returns the new
+        one, or ``None`` to leave the record unchanged.  *fn* may be called
+        while the store holds a lock, so it must be quick and must not
+        call the store.
+
+        :return: the value returned by *fn*
+
+        The default implementation is a plain :meth:`get` followed by
+        :meth:`set` and is *not* atomic; stores shared between threads or
+        processes override it.
+        """
+        if operation:
+            record = fn(self.get(client_id, window, operation=operation))
+            if record is not None:
+                self.set(
+                    client_id, window, record["remaining"], record["timestamp"],
+                    operation=operation,
+                )
+        else:
+            record = fn(self.get(client_id, window))
+            if record is not None:
+                self.set(client_id, window, record["remaining"], record["timestamp"])
+        return record
+
     @abstractmethod
     def all_for_client(self, client_id: str) -> List[Dict[str, int]]:
         """Return all stored records for *client_id* (for debugging)."""
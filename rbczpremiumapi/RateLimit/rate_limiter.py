@@ -6,16 +6,47 @@ Rate limiter that enforces per-second and per-day request limits.
 The logic mirrors the PHP ``RateLimiter`` class so that both PHP and Python
 applications sharing the same ``RateLimitStoreInterface`` backend will
 cooperatively respect the API rate limits.
+
+On top of the shared store, requests sent from this process are scheduled
+through a :class:`SlidingWindowLog` per client and operation, so the
+per-second limit is honoured with sub-second precision.
+
+:meth:`RateLimiter.acquire` atomically takes requests from the stored
+budget *before* they are sent, so concurrent callers cannot all spend the
+last remaining request; the budget is reconciled with the server's
+``X-RateLimit-Remaining-*`` headers when the responses arrive.  Operation-scoped
+store records (not read by PHP) carry millisecond timestamps; the plain
+PHP-compatible records keep whole seconds.  The remaining counts reported
+for an operation are stored in the plain records too, as the PHP library
+stores those of every response, so PHP processes sharing the store see
+the latest counts; reservations are only taken from the operation's
+records, so they reach the plain records with the response.  A request
+costs two store writes: reserving both windows in one ``update_records``
+cycle, and storing the scoped and plain counts of its response in one
+``set_records`` call.
 """
 
 import logging
+import threading
 import time
+from typing import Any, Dict, Mapping, Optional, Tuple
 
 from rbczpremiumapi.RateLimit.rate_limit_exceeded_exception import RateLimitExceededException
 from rbczpremiumapi.RateLimit.rate_limit_store_interface import RateLimitStoreInterface
+from rbczpremiumapi.RateLimit.sliding_window_log import SlidingWindowLog
 
 logger = logging.getLogger(__name__)
 
+#: Limits documented by the bank, used until the API reports actual ones
+#: in ``X-RateLimit-Limit-Second`` / ``X-RateLimit-Limit-Day``.
+DEFAULT_LIMITS: Dict[str, int] = {"second": 10, "day": 5000}
+OPERATION_LIMITS: Dict[str, Dict[str, int]] = {
+    "downloadStatement": {"second": 5, "day": 1500},
+}
+
+_WINDOW_HEADERS = {"second": "Second", "day": "Day"}
+_WINDOW_SECONDS = {"second": 1, "day": 86400}
+
 
 class RateLimiter:
     """Enforces per-client rate limits using a pluggable storage backend.
@@ -23,11 +54,27 @@ class RateLimiter:
     :param store: storage backend for per-client rate-limit state
     :param wait_mode: if ``True`` the limiter sleeps until the window resets;
         if ``False`` it raises :class:`RateLimitExceededException`
+    :param spacing: if ``True`` requests of one client and operation are
+        spread evenly over the second instead of being sent in bursts
     """
 
-    def __init__(self, store: RateLimitStoreInterface, wait_mode: bool = True) -> None:
+    def __init__(
+        self,
+        store: RateLimitStoreInterface,
+        wait_mode: bool = True,
+        spacing: bool = False,
+    ) -> None:
         self._store = store
         self._wait_mode = wait_mode
+        self._spacing = spacing
+        self._limits: Dict[str, Dict[str, int]] = {
+            operation: dict(limits) for operation, limits in OPERATION_LIMITS.items()
+        }
+        self._logs: Dict[Tuple[str, str], SlidingWindowLog] = {}
+        self._logs_lock = threading.Lock()
+        # requests acquired but not answered yet, per (client_id, operation)
+        self._in_flight: Dict[Tuple[str, str], int] = {}
+        self._in_flight_lock = threading.Lock()
 
     def is_wait_mode(self) -> bool:
         """Return ``True`` if the limiter is configured to wait on exhaustion."""
@@ -38,7 +85,8 @@ class RateLimiter:
         client_id: str,
         remaining_second: int,
         remaining_day: int,
-        timestamp: int,
+        timestamp: float,
+        operation: Optional[str] = None,
     ) -> None:
         """Store remaining rate-limit counts for both windows.
 
@@ -46,32 +94,69 @@ class RateLimiter:
             (e.g. certificate SHA-1, serial + issuer)
         :param remaining_second: remaining requests in the 1-second window
         :param remaining_day: remaining requests in the 24-hour window
-        :param timestamp: UNIX timestamp when the limits were observed
+        :param timestamp: UNIX timestamp (seconds, may be fractional) when
+            the limits were observed
+        :param operation: operation id the counts belong to; ``None`` for
+            the shared windows used by the PHP library, which are updated
+            in both cases
+        """
+        self._set_many(
+            client_id, {"second": remaining_second, "day": remaining_day}, timestamp, operation
+        )
+
+    def get_limits(self, operation: Optional[str] = None) -> Dict[str, int]:
+        """Return the ``{"second": n, "day": n}`` limits of *operation*.
+
+        Limits reported by the API override the documented defaults.
+        """
+        return self._limits.get(operation or "", DEFAULT_LIMITS)
+
+    def handle_response_headers(
+        self,
+        client_id: str,
+        headers: Mapping[str, Any],
+        operation: Optional[str] = None,
+        timestamp: Optional[float] = None,
+        status: Optional[int] = None,
+    ) -> None:
+        """Update the store from ``X-RateLimit-*`` response headers.
+
+        :param client_id: fingerprint identifying the client
+        :param headers: response headers (case-insensitive mapping)
+        :param operation: operation id the response belongs to
+        :param timestamp: UNIX timestamp of the response, defaults to now
+        :param status: HTTP status of the response; a 429 without
+            rate-limit headers marks the second window as exhausted
         """
-        self._store.set(client_id, "second", remaining_second, timestamp)
-        self._store.set(client_id, "day", remaining_day, timestamp)
+        if timestamp is None:
+            timestamp = time.time()
+        remaining_by_window = self._reconcile(client_id, headers, operation, status)
+        if remaining_by_window:
+            self._set_many(client_id, remaining_by_window, timestamp, operation)
 
-    def check_before_request(self, client_id: str) -> None:
+    def check_before_request(self, client_id: str, operation: Optional[str] = None) -> None:
         """Ensure the client is allowed to make the next request.
 
         For the **second** window the limiter always waits (it is at most 1 s).
         For the **day** window behaviour depends on *wait_mode*: sleep or raise.
 
         :param client_id: identifier of the client whose limits are checked
+        :param operation: operation id about to be called; each operation
+            has its own budget
         :raises RateLimitExceededException: if a day limit is exceeded and
             wait mode is disabled
         """
-        now = int(time.time())
+        now = time.time()
 
-        second = self._store.get(client_id, "second")
-        day = self._store.get(client_id, "day")
+        second = self._get(client_id, "second", operation)
+        day = self._get(client_id, "day", operation)
 
-        # second window
+        # second window, as reported by the API (possibly to another process)
         if second and second["remaining"] <= 0:
             wait = max(0, 1 - (now - second["timestamp"]))
             if wait > 0:
                 logger.warning(
-                    "Rate-limit (second window) exceeded. Waiting %d seconds", wait
+                    "Rate-limit (second window) exceeded. Waiting %.3f seconds", wait
                 )
                 time.sleep(wait)
 
@@ -88,3 +173,231 @@ class RateLimiter:
                     raise RateLimitExceededException(
                         "Rate-limit (day window) exceeded"
                     )
+
+        # second window, requests sent by this process
+        wait = self._log(client_id, operation).reserve()
+        if wait > 0:
+            logger.debug("Spacing request by %.3f seconds", wait)
+            time.sleep(wait)
+
+    def acquire(self, client_id: str, operation: Optional[str] = None, n: int = 1) -> None:
+        """Reserve *n* requests before sending them.
+
+        Unlike :meth:`check_before_request` the reservation is taken from
+        the stored budget atomically, so concurrent callers never spend the
+        same remaining request twice.  Every acquired request must be
+        followed by :meth:`handle_response_headers` (which reconciles the
+        budget with the server) or by :meth:`release`.
+
+        :param client_id: identifier of the client whose limits are checked
+        :param operation: operation id about to be called
+        :param n: number of requests to reserve
+        :raises RateLimitExceededException: if a day limit is exceeded and
+            wait mode is disabled
+        """
+        while True:
+            reservations = self._reserve(client_id, n, operation)
+            if reservations.wait <= 0:
+                break
+            if reservations.window == "day" and not self._wait_mode:
+                raise RateLimitExceededException("Rate-limit (day window) exceeded")
+            logger.warning(
+                "Rate-limit (%s window) exceeded. Waiting %.3f seconds",
+                reservations.window, reservations.wait,
+            )
+            time.sleep(reservations.wait)
+
+        self._start(client_id, operation, n)
+
+        wait = self._log(client_id, operation).reserve(n)
+        if wait > 0:
+            logger.debug("Spacing request by %.3f seconds", wait)
+            time.sleep(wait)
+
+    def release(self, client_id: str, operation: Optional[str] = None, n: int = 1) -> None:
+        """Forget *n* acquired requests that will get no response headers.
+
+        The reserved budget is not returned: the request may have reached
+        the server before failing.
+        """
+        for _ in range(n):
+            self._finish(client_id, operation)
+
+    # -- private helpers -----------------------------------------------------
+
+    def _reconcile(
+        self,
+        client_id: str,
+        headers: Mapping[str, Any],
+        operation: Optional[str],
+        status: Optional[int] = None,
+    ) -> Dict[str, int]:
+        """Learn limits from *headers*; return the remaining counts to store."""
+        # requests still in flight are not reflected in the headers yet
+        in_flight = self._finish(client_id, operation)
+
+        limits = dict(self.get_limits(operation))
+        remaining_by_window = {}
+        for window, suffix in _WINDOW_HEADERS.items():
+            limit = _int_header(headers, "X-RateLimit-Limit-" + suffix)
+            if limit is not None:
+                limits[window] = limit
+            remaining = _int_header(headers, "X-RateLimit-Remaining-" + suffix)
+            if remaining is not None:
+                remaining_by_window[window] = remaining - in_flight
+        if status == 429 and not remaining_by_window:
+            remaining_by_window["second"] = 0
+        if operation and limits != self.get_limits(operation):
+            self._limits[operation] = limits
+            log = self._logs.get((client_id, operation))
+            if log is not None:
+                log.set_limit(limits["second"])
+        return remaining_by_window
+
+    def _start(self, client_id: str, operation: Optional[str], n: int) -> None:
+        """Count *n* acquired requests as in flight."""
+        key = (client_id, operation or "")
+        with self._in_flight_lock:
+            self._in_flight[key] = self._in_flight.get(key, 0) + n
+
+    def _finish(self, client_id: str, operation: Optional[str]) -> int:
+        """Mark one acquired request as answered; return those still in flight."""
+        key = (client_id, operation or "")
+        with self._in_flight_lock:
+            count = self._in_flight.get(key, 0)
+            if count <= 1:
+                self._in_flight.pop(key, None)
+                return 0
+            self._in_flight[key] = count - 1
+            return count - 1
+
+    def _reserve(self, client_id: str, n: int, operation: Optional[str]) -> "_Reservations":
+        """Take *n* requests from both stored windows in one store update."""
+        reservations = self._reservations(n, operation)
+        self._update(client_id, reservations)
+        return reservations
+
+    def _reservations(self, n: int, operation: Optional[str]) -> "_Reservations":
+        limits = self.get_limits(operation)
+        scale = 1000 if operation else 1
+        return _Reservations({
+            RateLimitStoreInterface.window_key(window, operation): (
+                window, _Reservation(n, limits[window], _WINDOW_SECONDS[window], scale)
+            )
+            for window in ("day", "second")
+        })
+
+    def _log(self, client_id: str, operation: Optional[str]) -> SlidingWindowLog:
+        key = (client_id, operation or "")
+        log = self._logs.get(key)
+        if log is None:
+            with self._logs_lock:
+                log = self._logs.get(key)
+                if log is None:
+                    log = SlidingWindowLog(
+                        self.get_limits(operation)["second"], spacing=self._spacing
+                    )
+                    self._logs[key] = log
+        return log
+
+    # Unscoped calls keep the original store signature so that stores
+    # written before operations existed keep working.  Timestamps are
+    # returned and accepted in (fractional) seconds.
+    def _get(self, client_id: str, window: str, operation: Optional[str]) -> Optional[Dict[str, Any]]:
+        if not operation:
+            return self._store.get(client_id, window)
+        record = self._store.get(client_id, window, operation=operation)
+        if record is None:
+            return None
+        return {"remaining": record["remaining"], "timestamp": record["timestamp"] / 1000}
+
+    def _update(self, client_id: str, reservations: "_Reservations") -> None:
+        self._store.update_records(client_id, list(reservations.windows), reservations)
+
+    def _set_many(
+        self,
+        client_id: str,
+        remaining_by_window: Dict[str, int],
+        timestamp: float,
+        operation: Optional[str],
+    ) -> None:
+        records: Dict[str, Tuple[int, int]] = {}
+        if operation:
+            stamp = int(timestamp * 1000)
+            for window, n in remaining_by_window.items():
+                records[RateLimitStoreInterface.window_key(window, operation)] = (n, stamp)
+        # the PHP library reads the plain records only
+        stamp = int(timestamp)
+        for window, n in remaining_by_window.items():
+            records[window] = (n, stamp)
+        # one store write for both
+        self._store.set_records(client_id, records)
+
+
+class _Reservation:
+    """``RateLimitStoreInterface.update`` callback taking *n* requests.
+
+    After the update :attr:`wait` holds the seconds until the window has
+    room again, or ``0.0`` if the requests were reserved.
+    """
+
+    def __init__(self, n: int, limit: int, length: int, scale: int) -> None:
+        self.n = n
+        self.limit = limit
+        self.length = length
+        self.scale = scale
+        self.now = time.time()
+        self.wait = 0.0
+
+    def __call__(self, record: Optional[Dict[str, int]]) -> Optional[Dict[str, int]]:
+        age = self.now - record["timestamp"] / self.scale if record is not None else None
+        if age is None or age >= self.length:
+            # unknown or expired window: a fresh one starts now
+            self.wait = 0.0
+            return {"remaining": self.limit - self.n, "timestamp": int(self.now * self.scale)}
+        if record["remaining"] >= self.n:
+            self.wait = 0.0
+            return {"remaining": record["remaining"] - self.n, "timestamp": record["timestamp"]}
+        self.wait = self.length - age
+        return None
+
+
+class _Reservations:
+    """``RateLimitStoreInterface.update_records`` callback taking *n*
+    requests from several windows at once.
+
+    Nothing is taken unless every window has room; after the update
+    :attr:`wait` holds the seconds until the first full :attr:`window`
+    has room again, or ``0.0`` if the requests were reserved.
+
+    :param windows: ``{store key: (window, reservation)}``, checked in order
+    """
+
+    def __init__(self, windows: Dict[str, Tuple[str, _Reservation]]) -> None:
+        self.windows = windows
+        self.window: Optional[str] = None
+        self.wait = 0.0
+
+    def __call__(
+        self, records: Mapping[str, Optional[Dict[str, int]]]
+    ) -> Optional[Dict[str, Dict[str, int]]]:
+        updated = {}
+        for key, (window, reservation) in self.windows.items():
+            record = reservation(records.get(key))
+            if record is None:
+                self.window, self.wait = window, reservation.wait
+                return None
+            updated[key] = record
+        self.window, self.wait = None, 0.0
+        return updated
+
+
+def _int_header(headers: Mapping[str, Any], name: str) -> Optional[int]:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        logger.warning("Ignoring malformed %s header: %r", name, value)
+        return None
@@ -0,0 +1,395 @@
+# coding: utf-8
+
+"""
+Shared-memory rate-limit store for processes running on one host.
+
+All processes map the same file (by default under ``/dev/shm``, i.e.
+RAM) holding a fixed-size open-addressing hash table::
+
+    header:  magic (8 bytes) | capacity (uint32) | padding (uint32)
+    slot:    sequence (uint64) | key (128 bytes) | remaining (int64) | timestamp (int64)
+
+where *key* is ``"<client_id>\\0<window key>"`` in UTF-8, NUL padded.
+
+Each slot is a seqlock: a writer makes the sequence odd, updates the slot
+and makes it even again, all under a byte-range ``lockf`` of the slot
+(serialising writers across processes) and a thread lock (within the
+process).  Readers never lock; they copy the slot and retry if the
+sequence was odd or moved meanwhile.  ``get`` and ``set`` therefore cost
+microseconds instead of a file rewrite or SQL round-trip.  A writer that
+died mid-update leaves an odd sequence behind; the next writer starts
+from the following odd number, and a reader that keeps seeing it takes
+the slot lock and makes it even.
+
+Slots are never emptied.  A client uses about two slots per window and
+operation it calls (20 for all operations), so the default capacity of
+16384 slots (2.5 MiB) holds some 800 clients.  When the table is full, a
+new key takes the slot of a record older than a day, or, if none is, the
+write raises ``OSError(ENOSPC)``: requests are not sent unthrottled.
+
+The table can optionally be flushed periodically to a file in the
+:class:`JsonRateLimitStore` layout so that PHP applications keep seeing
+the counters.
+"""
+
+import errno
+import fcntl
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from typing import Callable, Collection, Dict, Mapping, Optional, Sequence, Tuple
+
+from rbczpremiumapi.RateLimit.json_rate_limit_store import JsonRateLimitStore
+from rbczpremiumapi.RateLimit.rate_limit_store_interface import RateLimitStoreInterface, Record
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"RBCZRL01"
+_HEADER = struct.Struct("<8sII")
+_SLOT = struct.Struct("<Q128sqq")
+_SEQ = struct.Struct("<Q")
+
+
+#: reader retries of a slot with an odd sequence before checking its writer
+_READ_SPINS = 1000
+#: age after which a record may be evicted, in seconds
+_EXPIRY = 86400
+
+
+class SharedMemoryRateLimitStore(RateLimitStoreInterface):
+    """Rate-limit store in a memory-mapped table shared between processes.
+
+    :param path: file backing the table; every process must use the same one
+    :param capacity: number of slots (one per client and window key, about
+        20 per client), used when the file is created
+    :param flush_to: optional path of a JSON file (PHP compatible layout)
+        the table is written to every *flush_interval* seconds
+    :param flush_interval: seconds between flushes to *flush_to*
+    """
+
+    def __init__(
+        self,
+        path: str = "/dev/shm/rbczpremiumapi-rate-limits",
+        capacity: int = 16384,
+        flush_to: Optional[str] = None,
+        flush_interval: float = 1.0,
+    ) -> None:
+        self._path = path
+        self._lock = threading.Lock()
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            self._capacity = self._init_file(capacity)
+            self._mmap = mmap.mmap(self._fd, _HEADER.size + self._capacity * _SLOT.size)
+        except BaseException:
+            os.close(self._fd)
+            raise
+
+        self._flush_store: Optional[JsonRateLimitStore] = None
+        self._flush_stop = threading.Event()
+        self._flush_thread: Optional[threading.Thread] = None
+        if flush_to is not None:
+            self._flush_store = JsonRateLimitStore(flush_to)
+            self._flush_thread = threading.Thread(
+                target=self._flush_loop,
+                args=(flush_interval,),
+                name="rbczpremiumapi-rate-limit-flush",
+                daemon=True,
+            )
+            self._flush_thread.start()
+
+    # -- public interface ----------------------------------------------------
+
+    def get(
+        self, client_id: str, window: str, operation: Optional[str] = None
+    ) -> Optional[Dict[str, int]]:
+        key = _encode_key(client_id, self.window_key(window, operation))
+        index = self._find(key)
+        if index is None:
+            return None
+        slot_key, remaining, timestamp = self._read(index)
+        if slot_key != key:
+            return None
+        return {"remaining": remaining, "timestamp": timestamp}
+
+    def set(
+        self,
+        client_id: str,
+        window: str,
+        remaining: int,
+        timestamp: int,
+        operation: Optional[str] = None,
+    ) -> None:
+        self.set_many(client_id, {window: (remaining, timestamp)}, operation)
+
+    def set_many(
+        self,
+        client_id: str,
+        records: Mapping[str, Tuple[int, int]],
+        operation: Optional[str] = None,
+    ) -> None:
+        self.set_records(
+            client_id,
+            {self.window_key(window, operation): record for window, record in records.items()},
+        )
+
+    def set_records(self, client_id: str, records: Mapping[str, Tuple[int, int]]) -> None:
+        with self._lock:
+            for key, (remaining, timestamp) in records.items():
+                record = {"remaining": remaining, "timestamp": timestamp}
+                self._update(_encode_key(client_id, key), lambda current: record)
+
+    def update_records(
+        self,
+        client_id: str,
+        keys: Sequence[str],
+        fn: Callable[[Dict[str, Optional[Record]]], Optional[Mapping[str, Record]]],
+    ) -> Optional[Mapping[str, Record]]:
+        encoded = {_encode_key(client_id, key): key for key in keys}
+        held: Dict[bytes, int] = {}
+        with self._lock:
+            try:
+                held = self._lock_slots(sorted(encoded))
+                current: Dict[str, Optional[Record]] = {}
+                for key, index in held.items():
+                    slot_key, remaining, timestamp = _SLOT.unpack_from(
+                        self._mmap, self._offset(index)
+                    )[1:]
+                    current[encoded[key]] = (
+                        {"remaining": remaining, "timestamp": timestamp}
+                        if slot_key == key else None
+                    )
+                records = fn(current)
+                for key, index in held.items():
+                    record = (records or {}).get(encoded[key])
+                    if record is not None:
+                        self._write(index, key, record)
+                return records
+            finally:
+                for index in held.values():
+                    self._unlock_slot(index)
+
+    def update(
+        self,
+        client_id: str,
+        window: str,
+        fn: Callable[[Optional[Dict[str, int]]], Optional[Dict[str, int]]],
+        operation: Optional[str] = None,
+    ) -> Optional[Dict[str, int]]:
+        key = _encode_key(client_id, self.window_key(window, operation))
+        with self._lock:
+            return self._update(key, fn)
+
+    def all_for_client(self, client_id: str) -> Dict[str, Dict[str, int]]:
+        return self._records().get(client_id, {})
+
+    def flush(self) -> None:
+        """Write the whole table to the *flush_to* JSON file now."""
+        if self._flush_store is None:
+            return
+        for client_id, windows in self._records().items():
+            self._flush_store.set_many(
+                client_id,
+                {window: (r["remaining"], r["timestamp"]) for window, r in windows.items()},
+            )
+
+    def close(self) -> None:
+        """Stop flushing (after a final flush) and unmap the table."""
+        if self._flush_thread is not None:
+            self._flush_stop.set()
+            self._flush_thread.join()
+            self._flush_thread = None
+            self.flush()
+        if not self._mmap.closed:
+            self._mmap.close()
+            os.close(self._fd)
+
+    # -- private helpers -----------------------------------------------------
+
+    def _init_file(self, capacity: int) -> int:
+        """Create the table unless another process did; return its capacity."""
+        fcntl.lockf(self._fd, fcntl.LOCK_EX, _HEADER.size, 0)
+        try:
+            header = os.pread(self._fd, _HEADER.size, 0)
+            if len(header) == _HEADER.size:
+                magic, existing, _ = _HEADER.unpack(header)
+                if magic != _MAGIC:
+                    raise ValueError(f"{self._path} is not a rate limit table")
+                return existing
+            os.ftruncate(self._fd, _HEADER.size + capacity * _SLOT.size)
+            os.pwrite(self._fd, _HEADER.pack(_MAGIC, capacity, 0), 0)
+            return capacity
+        finally:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN, _HEADER.size, 0)
+
+    def _offset(self, index: int) -> int:
+        return _HEADER.size + index * _SLOT.size
+
+    def _read(self, index: int) -> Tuple[bytes, int, int]:
+        offset = self._offset(index)
+        for _ in range(_READ_SPINS):
+            seq, key, remaining, timestamp = _SLOT.unpack_from(self._mmap, offset)
+            if seq % 2 == 0 and _SEQ.unpack_from(self._mmap, offset)[0] == seq:
+                return key, remaining, timestamp
+            os.sched_yield()
+        # a live writer releases the slot soon, a dead one's lock is gone
+        with self._lock:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX, _SLOT.size, offset)
+            try:
+                seq, key, remaining, timestamp = _SLOT.unpack_from(self._mmap, offset)
+                if seq % 2:
+                    logger.warning(
+                        "Repairing slot %d of %s left by a dead writer", index, self._path
+                    )
+                    _SEQ.pack_into(self._mmap, offset, seq + 1)
+                return key, remaining, timestamp
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN, _SLOT.size, offset)
+
+    def _probe(self, key: bytes):
+        start = zlib.crc32(key) % self._capacity
+        for i in range(self._capacity):
+            yield (start + i) % self._capacity
+
+    def _find(self, key: bytes) -> Optional[int]:
+        """Return the slot holding *key*, or the empty slot ending its chain."""
+        for index in self._probe(key):
+            slot_key = self._read(index)[0]
+            if slot_key == key or not slot_key[0]:
+                return index
+        return None
+
+    def _lock_slots(self, keys: Sequence[bytes]) -> Dict[bytes, int]:
+        """Lock and return the slots of several *keys*.
+
+        Only the first slot is waited for; if another writer holds one of
+        the next, all are released and taken again, so that writers
+        locking several slots cannot deadlock.
+        """
+        while True:
+            held: Dict[bytes, int] = {}
+            try:
+                for key in keys:
+                    held[key] = self._lock_slot(key, held.values(), blocking=not held)
+                return held
+            except BaseException as exc:
+                for index in held.values():
+                    self._unlock_slot(index)
+                if not isinstance(exc, OSError) or exc.errno not in (errno.EACCES, errno.EAGAIN):
+                    raise
+            os.sched_yield()
+
+    def _lock_slot(self, key: bytes, held: Collection[int] = (), blocking: bool = True) -> int:
+        """Lock and return the slot of *key*, or the empty slot ending its chain.
+
+        Slots in *held* are locked already (for other keys) and skipped.
+        Without *blocking* a slot locked by another process raises
+        ``OSError`` (``EACCES`` or ``EAGAIN``).
+        """
+        flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+        for index in self._probe(key):
+            if index in held:
+                continue
+            offset = self._offset(index)
+            fcntl.lockf(self._fd, flags, _SLOT.size, offset)
+            slot_key = _SLOT.unpack_from(self._mmap, offset)[1]
+            if slot_key == key or not slot_key[0]:
+                return index
+            fcntl.lockf(self._fd, fcntl.LOCK_UN, _SLOT.size, offset)
+        index = self._evict(held)
+        if index is None:
+            raise OSError(
+                errno.ENOSPC,
+                f"Shared-memory rate limit table {self._path} is full ({self._capacity} slots)",
+            )
+        return index
+
+    def _evict(self, held: Collection[int]) -> Optional[int]:
+        """Lock and return the slot of a record older than a day, if any.
+
+        Evictions are serialised by a lock of the header, so two processes
+        cannot claim two slots for the same new key.  Slots other writers
+        hold are skipped, to avoid waiting for them while holding *held*.
+        """
+        fcntl.lockf(self._fd, fcntl.LOCK_EX, _HEADER.size, 0)
+        try:
+            now = time.time()
+            for index in range(self._capacity):
+                if index in held:
+                    continue
+                offset = self._offset(index)
+                try:
+                    fcntl.lockf(self._fd, fcntl.LOCK_EX | fcntl.LOCK_NB, _SLOT.size, offset)
+                except OSError as exc:
+                    if exc.errno not in (errno.EACCES, errno.EAGAIN):
+                        raise
+                    continue
+                slot_key, _, timestamp = _SLOT.unpack_from(self._mmap, offset)[1:]
+                # operation-scoped records carry milliseconds
+                if b":" in slot_key.split(b"\0", 1)[1]:
+                    timestamp /= 1000
+                if now - timestamp > _EXPIRY:
+                    return index
+                fcntl.lockf(self._fd, fcntl.LOCK_UN, _SLOT.size, offset)
+            return None
+        finally:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN, _HEADER.size, 0)
+
+    def _unlock_slot(self, index: int) -> None:
+        fcntl.lockf(self._fd, fcntl.LOCK_UN, _SLOT.size, self._offset(index))
+
+    def _write(self, index: int, key: bytes, record: Record) -> None:
+        """Write *record* to the locked slot *index*."""
+        offset = self._offset(index)
+        # odd if a writer died mid-update; readers wait for the next even one
+        seq = _SEQ.unpack_from(self._mmap, offset)[0] | 1
+        _SEQ.pack_into(self._mmap, offset, seq)
+        _SLOT.pack_into(self._mmap, offset, seq, key, record["remaining"], record["timestamp"])
+        _SEQ.pack_into(self._mmap, offset, seq + 1)
+
+    def _update(
+        self, key: bytes, fn: Callable[[Optional[Record]], Optional[Record]]
+    ) -> Optional[Record]:
+        """Apply *fn* to the slot of *key* (claiming an empty one if needed)."""
+        index = self._lock_slot(key)
+        try:
+            slot_key, remaining, timestamp = _SLOT.unpack_from(self._mmap, self._offset(index))[1:]
+            if slot_key == key:
+                record = fn({"remaining": remaining, "timestamp": timestamp})
+            else:
+                record = fn(None)
+            if record is not None:
+                self._write(index, key, record)
+            return record
+        finally:
+            self._unlock_slot(index)
+
+    def _records(self) -> Dict[str, Dict[str, Dict[str, int]]]:
+        records: Dict[str, Dict[str, Dict[str, int]]] = {}
+        for index in range(self._capacity):
+            key, remaining, timestamp = self._read(index)
+            if not key[0]:
+                continue
+            client_id, window = key.rstrip(b"\0").decode("utf-8").split("\0", 1)
+            records.setdefault(client_id, {})[window] = {
+                "remaining": remaining,
+                "timestamp": timestamp,
+            }
+        return records
+
+    def _flush_loop(self, interval: float) -> None:
+        while not self._flush_stop.wait(interval):
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Failed to flush rate limits to JSON")
+
+
+def _encode_key(client_id: str, window: str) -> bytes:
+    key = f"{client_id}\0{window}".encode("utf-8")
+    if len(key) > 128 or not key[0]:
+        raise ValueError(f"Unsupported rate limit key: {client_id!r}, {window!r}")
+    return key.ljust(128, b"\0")
@@ -0,0 +1,74 @@
+# coding: utf-8
+
+"""
+In-process sliding-log scheduler for the per-second window.
+
+The API counts requests in a *sliding* second, so a client may send at
+most ``limit`` requests in any 1-second interval.  The log remembers the
+send times of the last ``limit`` requests (``time.monotonic`` based, so
+it is immune to wall-clock jumps) and hands out the earliest slot at
+which the next request stays within the limit.  With *spacing* enabled
+consecutive slots are additionally kept ``window / limit`` apart, which
+spreads requests evenly instead of sending them in bursts.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque
+
+
+class SlidingWindowLog:
+    """Thread-safe sliding-log scheduler.
+
+    :param limit: number of requests allowed per *window*
+    :param window: window length in seconds
+    :param spacing: keep at least ``window / limit`` between requests
+    :param clock: monotonic clock returning seconds as float
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        window: float = 1.0,
+        spacing: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._window = window
+        self._spacing = spacing
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._slots: Deque[float] = deque()
+        self._limit = max(1, limit)
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    def set_limit(self, limit: int) -> None:
+        """Change the number of requests allowed per window."""
+        with self._lock:
+            self._limit = max(1, limit)
+
+    def reserve(self, n: int = 1) -> float:
+        """Reserve slots for *n* requests.
+
+        :return: seconds to wait before the last of the reserved requests
+            may be sent (``0.0`` if it can be sent right away)
+        """
+        with self._lock:
+            now = self._clock()
+            slots = self._slots
+            while slots and slots[0] <= now - self._window:
+                slots.popleft()
+
+            slot = now
+            for _ in range(n):
+                if len(slots) >= self._limit:
+                    slot = max(slot, slots[-self._limit] + self._window)
+                if self._spacing and slots:
+                    slot = max(slot, slots[-1] + self._window / self._limit)
+                slots.append(slot)
+            while len(slots) > self._limit:
+                slots.popleft()
+            return max(0.0, slot - now)
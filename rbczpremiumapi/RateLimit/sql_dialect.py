@@ -7,7 +7,9 @@ Mirrors the PHP ``SqlDialect`` interface so that the same database can be
 accessed from both PHP and Python with dialect-specific SQL generation.
 """
 
+import time
 from abc import ABC, abstractmethod
+from typing import Sequence
 
 
 class SqlDialect(ABC):
@@ -25,3 +27,56 @@ class SqlDialect(ABC):
         Examples: ``:name`` (PDO/SQLite), ``%s`` (psycopg2), ``?`` (sqlite3).
         """
         ...
+
+    def upsert(self, table: str, key_columns: Sequence[str], value_columns: Sequence[str]) -> str:
+        """Return an INSERT statement updating *value_columns* on key conflict.
+
+        Parameters are bound by column name.  The default implementation
+        uses ``ON CONFLICT ... DO UPDATE`` (SQLite >= 3.24, PostgreSQL).
+        """
+        columns = list(key_columns) + list(value_columns)
+        return (
+            f"INSERT INTO {table} ({', '.join(columns)})"
+            f" VALUES ({', '.join(self.placeholder(c) for c in columns)})"
+            f" ON CONFLICT ({', '.join(key_columns)}) DO UPDATE SET "
+            + ", ".join(f"{c} = excluded.{c}" for c in value_columns)
+        )
+
+
+class SqliteDialect(SqlDialect):
+    """Dialect for the standard library ``sqlite3`` module."""
+
+    def now(self) -> int:
+        return int(time.time())
+
+    def placeholder(self, name: str) -> str:
+        return f":{name}"
+
+
+class PostgresDialect(SqlDialect):
+    """Dialect for ``psycopg2`` / ``psycopg`` connections."""
+
+    def now(self) -> int:
+        return int(time.time())
+
+    def placeholder(self, name: str) -> str:
+        return f"%({name})s"
+
+
+class MySqlDialect(SqlDialect):
+    """Dialect for ``mysql-connector-python`` / ``PyMySQL`` connections."""
+
+    def now(self) -> int:
+        return int(time.time())
+
+    def placeholder(self, name: str) -> str:
+        return f"%({name})s"
+
+    def upsert(self, table: str, key_columns: Sequence[str], value_columns: Sequence[str]) -> str:
+        columns = list(key_columns) + list(value_columns)
+        return (
+            f"INSERT INTO {table} ({', '.join(columns)})"
+            f" VALUES ({', '.join(self.placeholder(c) for c in columns)})"
+            " ON DUPLICATE KEY UPDATE "
+            + ", ".join(f"{c} = VALUES({c})" for c in value_columns)
+        )
@@ -38,6 +38,29 @@ from rbczpremiumapi.exceptions import ApiValueError
 from rbczpremiumapi.exceptions import ApiKeyError
 from rbczpremiumapi.exceptions import ApiAttributeError
 from rbczpremiumapi.exceptions import ApiException
+from rbczpremiumapi.retry import RetryPolicy
+from rbczpremiumapi.balances import get_all_balances
+from rbczpremiumapi.json_codec import JsonCodec, MsgspecCodec, OrjsonCodec
+from rbczpremiumapi.json_stream import JsonArrayStream
+from rbczpremiumapi.lazy import LazyModel, make_lazy
+from rbczpremiumapi.model_base import ApiModel
+from rbczpremiumapi.records import record_type
+from rbczpremiumapi.transactions import get_transaction_history, iter_transactions, split_range, stream_transactions
+from rbczpremiumapi.transaction_frame import TransactionFrame
+from rbczpremiumapi.transaction_store import TransactionStore
+from rbczpremiumapi.transaction_sync import TransactionSync
+
+# import asyncio client and apis
+from rbczpremiumapi.async_api_client import AsyncApiClient
+from rbczpremiumapi.async_api import AsyncDownloadStatementApi
+from rbczpremiumapi.async_api import AsyncGetAccountBalanceApi
+from rbczpremiumapi.async_api import AsyncGetAccountsApi
+from rbczpremiumapi.async_api import AsyncGetBatchDetailApi
+from rbczpremiumapi.async_api import AsyncGetFxRatesApi
+from rbczpremiumapi.async_api import AsyncGetFxRatesListApi
+from rbczpremiumapi.async_api import AsyncGetStatementListApi
+from rbczpremiumapi.async_api import AsyncGetTransactionListApi
+from rbczpremiumapi.async_api import AsyncUploadPaymentsApi
 
 # import models into sdk package
 from rbczpremiumapi.Model.currency_list_simple import CurrencyListSimple
@@ -88,8 +111,11 @@ from rbczpremiumapi.Model.import_payments415_response import ImportPayments415Re
 
 # import RateLimit module
 from rbczpremiumapi.RateLimit.rate_limiter import RateLimiter
+from rbczpremiumapi.RateLimit.async_rate_limiter import AsyncRateLimiter
 from rbczpremiumapi.RateLimit.rate_limit_store_interface import RateLimitStoreInterface
 from rbczpremiumapi.RateLimit.rate_limit_exceeded_exception import RateLimitExceededException
-from rbczpremiumapi.RateLimit.sql_dialect import SqlDialect
+from rbczpremiumapi.RateLimit.sql_dialect import SqlDialect, SqliteDialect, PostgresDialect, MySqlDialect
 from rbczpremiumapi.RateLimit.json_rate_limit_store import JsonRateLimitStore
 from rbczpremiumapi.RateLimit.db_rate_limit_store import DbRateLimitStore
+from rbczpremiumapi.RateLimit.in_memory_rate_limit_store import InMemoryRateLimitStore
+from rbczpremiumapi.RateLimit.shared_memory_rate_limit_store import SharedMemoryRateLimitStore
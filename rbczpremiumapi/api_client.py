@@ -14,21 +14,29 @@
 """
 
 import datetime
-from dateutil.parser import parse
 from enum import Enum
 import decimal
+import hashlib
 import json
+import logging
 import mimetypes
 import os
 import re
+import ssl
 import tempfile
+import time
 
 from urllib.parse import quote
-from typing import Tuple, Optional, List, Dict, Union
+from typing import Any, Callable, NamedTuple, Tuple, Optional, List, Dict, Union
 from pydantic import SecretStr
 
 from rbczpremiumapi.configuration import Configuration
 from rbczpremiumapi.api_response import ApiResponse, T as ApiResponseT
+from rbczpremiumapi.iso8601 import parse_date, parse_datetime
+from rbczpremiumapi.lazy import lazy_converter
+from rbczpremiumapi.model_base import ApiModel
+from rbczpremiumapi.RateLimit.async_rate_limiter import AsyncRateLimiter
+from rbczpremiumapi.records import record_converter
 import rbczpremiumapi.Model
 from rbczpremiumapi import rest
 from rbczpremiumapi.exceptions import (
@@ -43,6 +51,42 @@ from rbczpremiumapi.exceptions import (
 
 RequestSerialized = Tuple[str, str, Dict[str, str], Optional[str], List[str]]
 
+RESPONSE_MODES = ("model", "records", "lazy")
+
+JSON_MIME_RE = re.compile(r'^application/(json|[\w!#$&.+-^_]+\+json)\s*(;|$)', re.IGNORECASE)
+
+PEM_CERTIFICATE_RE = re.compile(
+    r'-----BEGIN CERTIFICATE-----.+?-----END CERTIFICATE-----', re.DOTALL
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ApiOperation(NamedTuple):
+    """Static description of an API operation.
+
+    Built once per operation (as a class attribute of the API class) so
+    that a call only has to fill in its parameters.
+
+    :param operation_id: operation id from the OpenAPI document.
+    :param method: HTTP method.
+    :param resource_path: path template, e.g. `/accounts/{accountNumber}`.
+    :param response_types_map: dict of response types by status code.
+    :param content_type: request body content type, if any.
+    :param accept: value of the `Accept` header, if any.
+    :param response_modes: accepted values of `_response_mode`; operations
+        listing bulk data (`x-bulk-response` in the OpenAPI document)
+        accept all of RESPONSE_MODES.
+    """
+    operation_id: str
+    method: str
+    resource_path: str
+    response_types_map: Dict[str, Optional[str]]
+    content_type: Optional[str] = None
+    accept: Optional[str] = None
+    response_modes: Tuple[str, ...] = ("model",)
+
+
 class ApiClient:
     """Generic API client for OpenAPI client library builds.
 
@@ -85,7 +129,7 @@ class ApiClient:
             configuration = Configuration.get_default()
         self.configuration = configuration
 
-        self.rest_client = rest.RESTClientObject(configuration)
+        self.rest_client = self._create_rest_client(configuration)
         self.default_headers = {}
         if header_name is not None:
             self.default_headers[header_name] = header_value
@@ -93,6 +137,13 @@ class ApiClient:
         # Set default User-Agent.
         self.user_agent = 'OpenAPI-Generator/1.0.0/python'
         self.client_side_validation = configuration.client_side_validation
+        self._cert_fingerprint = None
+        # deserializer per response type, see __deserializer()
+        self._deserializers: Dict[Any, Callable[[Any], Any]] = {}
+
+    def _create_rest_client(self, configuration):
+        """Create the HTTP transport used by this client."""
+        return rest.RESTClientObject(configuration)
 
     def __enter__(self):
         return self
@@ -283,14 +334,235 @@ class ApiClient:
 
         return response_data
 
+    def call_operation(
+        self,
+        operation: ApiOperation,
+        path_params=None,
+        query_params=None,
+        header_params=None,
+        body=None,
+        collection_formats=None,
+        _request_timeout=None,
+        _request_auth=None,
+        _return_http_data_only=True,
+        _preload_content=True,
+        _response_mode="model"
+    ) -> Any:
+        """Serializes, sends and deserializes one API operation call.
+
+        :param operation: ApiOperation describing the endpoint.
+        :param path_params: Path parameters keyed by their name in the path.
+        :param query_params: Query parameters in the url.
+        :param header_params: Header parameters to be
+            placed in the request header.
+        :param body: Request body.
+        :param collection_formats: dict of collection formats for path, query,
+            header, and post parameters.
+        :param _request_timeout: timeout setting for this request.
+        :param _request_auth: set to override the auth_settings for
+            a single request.
+        :param _return_http_data_only: if False, return the whole ApiResponse
+            instead of the deserialized data only.
+        :param _preload_content: if False, return the urllib3.HTTPResponse
+            without reading/decoding response data.
+        :param _response_mode: "model" (default); for the operations
+            listing bulk data also "records" to return read-only records
+            built without validation (see rbczpremiumapi.records), or
+            "lazy" to validate nested models such as entry details on
+            first use (see rbczpremiumapi.lazy).
+        :return: deserialized data, ApiResponse or urllib3.HTTPResponse.
+        """
+        self._check_response_mode(operation, _response_mode)
+        method, url, header_params, body, post_params = self._serialize_operation(
+            operation,
+            path_params=path_params,
+            query_params=query_params,
+            header_params=header_params,
+            body=body,
+            collection_formats=collection_formats,
+            _request_auth=_request_auth
+        )
+
+        client_id = None
+        if self.configuration.rate_limiter is not None:
+            client_id = self.rate_limit_client_id(header_params)
+        retry = None
+        if self.configuration.retry_policy is not None:
+            retry = self.configuration.retry_policy.start()
+
+        while True:
+            response_data = self._send_operation(
+                operation, client_id, method, url, header_params, body, post_params,
+                _request_timeout if retry is None else retry.timeout(_request_timeout)
+            )
+            delay = None
+            if retry is not None:
+                delay = retry.next_delay(
+                    method, response_data.status, response_data.getheaders()
+                )
+            if delay is None:
+                break
+            # release the connection before waiting
+            response_data.read()
+            time.sleep(delay)
+
+        if not _preload_content:
+            return response_data.response
+
+        response_data.read()
+        return self._deserialize_operation(
+            operation, response_data, _return_http_data_only, _response_mode
+        )
+
+    @staticmethod
+    def _check_response_mode(operation: ApiOperation, response_mode) -> None:
+        if response_mode not in operation.response_modes:
+            raise ApiValueError(
+                f"Invalid response mode {response_mode!r} for {operation.operation_id}, "
+                f"expected one of {', '.join(operation.response_modes)}"
+            )
+
+    def _send_operation(
+        self,
+        operation: ApiOperation,
+        client_id,
+        method,
+        url,
+        header_params,
+        body,
+        post_params,
+        _request_timeout
+    ) -> rest.RESTResponse:
+        """Makes one attempt of an operation call under the rate limiter."""
+        limiter = self.configuration.rate_limiter
+        if isinstance(limiter, AsyncRateLimiter):
+            # its methods return coroutines nobody would await
+            raise TypeError(
+                "AsyncRateLimiter can only be used with AsyncApiClient; "
+                "use RateLimiter with ApiClient"
+            )
+        if limiter is not None:
+            limiter.acquire(client_id, operation.operation_id)
+
+        try:
+            response_data = self.call_api(
+                method, url,
+                header_params=header_params,
+                body=body,
+                post_params=post_params,
+                _request_timeout=_request_timeout
+            )
+        except BaseException:
+            if limiter is not None:
+                limiter.release(client_id, operation.operation_id)
+            raise
+
+        if limiter is not None:
+            limiter.handle_response_headers(
+                client_id, response_data.getheaders(), operation.operation_id,
+                status=response_data.status
+            )
+        return response_data
+
+    def rate_limit_client_id(self, header_params=None) -> str:
+        """Returns the key under which rate-limit state is stored.
+
+        The SHA-1 fingerprint of the client certificate (the bank counts
+        requests per certificate), falling back to the X-IBM-Client-Id
+        header for calls without a client certificate.  The certificate
+        is the first one in `cert_file`, which may also hold the key, a
+        chain or openssl's "Bag Attributes"; if none can be read, the
+        header is used as well.
+        """
+        if self.configuration.cert_fingerprint:
+            return self.configuration.cert_fingerprint
+        if self._cert_fingerprint is None and self.configuration.cert_file:
+            self._cert_fingerprint = self.__pem_fingerprint(self.configuration.cert_file)
+        if self._cert_fingerprint:
+            return self._cert_fingerprint
+        return (header_params or {}).get('X-IBM-Client-Id', '')
+
+    @staticmethod
+    def __pem_fingerprint(cert_file) -> str:
+        """Returns the SHA-1 fingerprint of the first certificate in a PEM
+        file, or "" if there is none."""
+        try:
+            with open(cert_file, encoding='ascii', errors='replace') as f:
+                match = PEM_CERTIFICATE_RE.search(f.read())
+            if match is None:
+                raise ValueError("no certificate found")
+            der = ssl.PEM_cert_to_DER_cert(match.group(0))
+        except (OSError, ValueError) as exc:
+            logger.warning(
+                "Cannot read the client certificate from %s (%s); rate limits "
+                "are kept per X-IBM-Client-Id", cert_file, exc
+            )
+            return ""
+        return hashlib.sha1(der).hexdigest()
+
+    def _serialize_operation(
+        self,
+        operation: ApiOperation,
+        path_params=None,
+        query_params=None,
+        header_params=None,
+        body=None,
+        collection_formats=None,
+        _request_auth=None
+    ) -> RequestSerialized:
+        """Adds the operation's Accept/Content-Type headers and serializes
+        the request, see param_serialize."""
+        header_params = dict(header_params) if header_params else {}
+        if operation.accept is not None and 'Accept' not in header_params:
+            header_params['Accept'] = operation.accept
+        if (
+            operation.content_type is not None
+            and body is not None
+            and 'Content-Type' not in header_params
+        ):
+            header_params['Content-Type'] = operation.content_type
+
+        return self.param_serialize(
+            method=operation.method,
+            resource_path=operation.resource_path,
+            path_params=path_params,
+            query_params=query_params,
+            header_params=header_params,
+            body=body,
+            collection_formats=collection_formats,
+            _request_auth=_request_auth
+        )
+
+    def _deserialize_operation(
+        self,
+        operation: ApiOperation,
+        response_data,
+        _return_http_data_only=True,
+        _response_mode="model"
+    ) -> Any:
+        """Deserializes a read response of the operation."""
+        response = self.response_deserialize(
+            response_data=response_data,
+            response_types_map=operation.response_types_map,
+            response_mode=_response_mode
+        )
+        if _return_http_data_only:
+            return response.data
+        return response
+
     def response_deserialize(
         self,
         response_data: rest.RESTResponse,
-        response_types_map: Optional[Dict[str, ApiResponseT]]=None
+        response_types_map: Optional[Dict[str, ApiResponseT]]=None,
+        response_mode: str = "model"
     ) -> ApiResponse[ApiResponseT]:
         """Deserializes response into an object.
         :param response_data: RESTResponse object to be deserialized.
         :param response_types_map: dict of response types.
+        :param response_mode: "records" to return successful model responses
+            as read-only records (see rbczpremiumapi.records), not models;
+            "lazy" to validate their nested models on first use (see
+            rbczpremiumapi.lazy).
         :return: ApiResponse
         """
 
@@ -316,8 +588,33 @@ class ApiClient:
                 if content_type is not None:
                     match = re.search(r"charset=([a-zA-Z\-\d]+)[\s;]?", content_type)
                 encoding = match.group(1) if match else "utf-8"
-                response_text = response_data.data.decode(encoding)
-                return_data = self.deserialize(response_text, response_type, content_type)
+                json_body = (
+                    200 <= response_data.status <= 299
+                    and response_data.data
+                    and content_type is not None
+                    and JSON_MIME_RE.match(content_type)
+                )
+                utf8 = encoding.lower() in ("utf-8", "utf8")
+                model = self.__json_model(response_type) if json_body else None
+                if model is not None and response_mode != "model":
+                    convert = (
+                        record_converter if response_mode == "records" else lazy_converter
+                    )(model)
+                    return_data = convert(self.configuration.json_codec.loads(
+                        response_data.data if utf8 else response_data.data.decode(encoding)
+                    ))
+                elif json_body and utf8:
+                    # decode the bytes directly, without a str copy
+                    if model is not None:
+                        return_data = model.from_json(response_data.data)
+                    else:
+                        return_data = self.__deserialize(
+                            self.configuration.json_codec.loads(response_data.data),
+                            response_type
+                        )
+                else:
+                    response_text = response_data.data.decode(encoding)
+                    return_data = self.deserialize(response_text, response_type, content_type)
         finally:
             if not 200 <= response_data.status <= 299:
                 raise ApiException.from_response(
@@ -402,14 +699,14 @@ class ApiClient:
         # fetch data from response object
         if content_type is None:
             try:
-                data = json.loads(response_text)
+                data = self.configuration.json_codec.loads(response_text)
             except ValueError:
                 data = response_text
-        elif re.match(r'^application/(json|[\w!#$&.+-^_]+\+json)\s*(;|$)', content_type, re.IGNORECASE):
+        elif JSON_MIME_RE.match(content_type):
             if response_text == "":
                 data = ""
             else:
-                data = json.loads(response_text)
+                data = self.configuration.json_codec.loads(response_text)
         elif re.match(r'^text\/[a-z.+-]+\s*(;|$)', content_type, re.IGNORECASE):
             data = response_text
         else:
@@ -431,20 +728,59 @@ class ApiClient:
         if data is None:
             return None
 
+        return self.__deserializer(klass)(data)
+
+    def __deserializer(self, klass):
+        """Returns the function deserializing data of type `klass`.
+
+        The type string is resolved once; the resulting function (and
+        those of its item types) is cached on the client, so decoding a
+        page of thousands of items does no per-item type lookups.
+
+        :param klass: class literal, or string of class name.
+        :return: function taking non-None data.
+        """
+        deserializer = self._deserializers.get(klass)
+        if deserializer is None:
+            deserializer = self._deserializers.setdefault(
+                klass, self.__build_deserializer(klass)
+            )
+        return deserializer
+
+    def __json_model(self, klass):
+        """Returns the model class of type `klass`, or None.
+
+        A model validates a JSON document itself, in one pass.
+
+        :param klass: class literal, or string of class name.
+        """
+        if isinstance(klass, str):
+            if klass.startswith(('List[', 'Dict[')) or klass in self.NATIVE_TYPES_MAPPING:
+                return None
+            klass = getattr(rbczpremiumapi.Model, klass)
+        if isinstance(klass, type) and issubclass(klass, ApiModel):
+            return klass
+        return None
+
+    def __build_deserializer(self, klass):
         if isinstance(klass, str):
             if klass.startswith('List['):
                 m = re.match(r'List\[(.*)]', klass)
                 assert m is not None, "Malformed List type definition"
-                sub_kls = m.group(1)
-                return [self.__deserialize(sub_data, sub_kls)
-                        for sub_data in data]
+                item = self.__deserializer(m.group(1))
+                return lambda data: [
+                    None if sub_data is None else item(sub_data)
+                    for sub_data in data
+                ]
 
             if klass.startswith('Dict['):
                 m = re.match(r'Dict\[([^,]*), (.*)]', klass)
                 assert m is not None, "Malformed Dict type definition"
-                sub_kls = m.group(2)
-                return {k: self.__deserialize(v, sub_kls)
-                        for k, v in data.items()}
+                value = self.__deserializer(m.group(2))
+                return lambda data: {
+                    k: None if v is None else value(v)
+                    for k, v in data.items()
+                }
 
             # convert str to class
             if klass in self.NATIVE_TYPES_MAPPING:
@@ -453,19 +789,19 @@ class ApiClient:
                 klass = getattr(rbczpremiumapi.Model, klass)
 
         if klass in self.PRIMITIVE_TYPES:
-            return self.__deserialize_primitive(data, klass)
+            return lambda data: self.__deserialize_primitive(data, klass)
         elif klass == object:
-            return self.__deserialize_object(data)
+            return self.__deserialize_object
         elif klass == datetime.date:
-            return self.__deserialize_date(data)
+            return self.__deserialize_date
         elif klass == datetime.datetime:
-            return self.__deserialize_datetime(data)
+            return self.__deserialize_datetime
         elif klass == decimal.Decimal:
-            return decimal.Decimal(data)
+            return decimal.Decimal
         elif issubclass(klass, Enum):
-            return self.__deserialize_enum(data, klass)
+            return lambda data: self.__deserialize_enum(data, klass)
         else:
-            return self.__deserialize_model(data, klass)
+            return lambda data: self.__deserialize_model(data, klass)
 
     def parameters_to_tuples(self, params, collection_formats):
         """Get parameters as list of tuples, formatting collections.
@@ -739,9 +1075,7 @@ class ApiClient:
         :return: date.
         """
         try:
-            return parse(string).date()
-        except ImportError:
-            return string
+            return parse_date(string)
         except ValueError:
             raise rest.ApiException(
                 status=0,
@@ -757,9 +1091,7 @@ class ApiClient:
         :return: datetime.
         """
         try:
-            return parse(string)
-        except ImportError:
-            return string
+            return parse_datetime(string)
         except ValueError:
             raise rest.ApiException(
                 status=0,
@@ -0,0 +1,83 @@
+# coding: utf-8
+
+"""
+asyncio variants of the Premium API operation classes.
+
+Each class reuses the parameter handling of its generated synchronous
+counterpart and awaits the call on an :class:`AsyncApiClient`::
+
+    async with AsyncApiClient(Configuration.from_p12(cert, password)) as client:
+        api = AsyncGetTransactionListApi(client)
+        page = await api.get_transaction_list(client_id, request_id, account,
+                                              "CZK", date_from, date_to)
+"""
+
+import functools
+
+from rbczpremiumapi.async_api_client import AsyncApiClient
+from rbczpremiumapi.PremiumAPI.download_statement_api import DownloadStatementApi
+from rbczpremiumapi.PremiumAPI.get_account_balance_api import GetAccountBalanceApi
+from rbczpremiumapi.PremiumAPI.get_accounts_api import GetAccountsApi
+from rbczpremiumapi.PremiumAPI.get_batch_detail_api import GetBatchDetailApi
+from rbczpremiumapi.PremiumAPI.get_fx_rates_api import GetFxRatesApi
+from rbczpremiumapi.PremiumAPI.get_fx_rates_list_api import GetFxRatesListApi
+from rbczpremiumapi.PremiumAPI.get_statement_list_api import GetStatementListApi
+from rbczpremiumapi.PremiumAPI.get_transaction_list_api import GetTransactionListApi
+from rbczpremiumapi.PremiumAPI.upload_payments_api import UploadPaymentsApi
+
+
+def _awaitable(operation):
+    """Wrap a synchronous operation method into a coroutine function."""
+
+    @functools.wraps(operation)
+    async def wrapper(self, *args, **kwargs):
+        return await operation(self, *args, **kwargs)
+
+    return wrapper
+
+
+class _AsyncApi:
+    """Mixin requiring an :class:`AsyncApiClient`.
+
+    There is no shared default client, as its connection pool is bound to
+    the event loop it was created on.
+    """
+
+    def __init__(self, api_client: AsyncApiClient):
+        self.api_client = api_client
+
+
+class AsyncDownloadStatementApi(_AsyncApi, DownloadStatementApi):
+    download_statement = _awaitable(DownloadStatementApi.download_statement)
+
+
+class AsyncGetAccountBalanceApi(_AsyncApi, GetAccountBalanceApi):
+    get_balance = _awaitable(GetAccountBalanceApi.get_balance)
+
+
+class AsyncGetAccountsApi(_AsyncApi, GetAccountsApi):
+    get_accounts = _awaitable(GetAccountsApi.get_accounts)
+
+
+class AsyncGetBatchDetailApi(_AsyncApi, GetBatchDetailApi):
+    get_batch_detail = _awaitable(GetBatchDetailApi.get_batch_detail)
+
+
+class AsyncGetFxRatesApi(_AsyncApi, GetFxRatesApi):
+    get_fx_rates = _awaitable(GetFxRatesApi.get_fx_rates)
+
+
+class AsyncGetFxRatesListApi(_AsyncApi, GetFxRatesListApi):
+    get_fx_rates_list = _awaitable(GetFxRatesListApi.get_fx_rates_list)
+
+
+class AsyncGetStatementListApi(_AsyncApi, GetStatementListApi):
+    get_statements = _awaitable(GetStatementListApi.get_statements)
+
+
+class AsyncGetTransactionListApi(_AsyncApi, GetTransactionListApi):
+    get_transaction_list = _awaitable(GetTransactionListApi.get_transaction_list)
+
+
+class AsyncUploadPaymentsApi(_AsyncApi, UploadPaymentsApi):
+    import_payments = _awaitable(UploadPaymentsApi.import_payments)
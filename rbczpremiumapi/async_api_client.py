@@ -0,0 +1,215 @@
+# coding: utf-8
+
+"""
+asyncio flavour of :class:`ApiClient`.
+
+Request serialization and response deserialization are shared with the
+synchronous client; only the transport is replaced by
+:class:`rbczpremiumapi.async_rest.AsyncRESTClientObject`, so thousands of
+concurrent calls can run on one event loop over a pooled connector.
+"""
+
+import asyncio
+from typing import Any
+
+from rbczpremiumapi.api_client import ApiClient, ApiOperation
+from rbczpremiumapi.async_rest import AsyncRESTClientObject, AsyncRESTResponse
+from rbczpremiumapi.exceptions import ApiException
+from rbczpremiumapi.RateLimit.async_rate_limiter import AsyncRateLimiter
+
+
+class AsyncApiClient(ApiClient):
+    """API client performing requests without blocking the event loop.
+
+    Use it as an async context manager (or call :meth:`close`) so that the
+    underlying connection pool is released::
+
+        async with AsyncApiClient(configuration) as api_client:
+            api = AsyncGetAccountBalanceApi(api_client)
+            balance = await api.get_balance(client_id, request_id, account)
+
+    :param configuration: .Configuration object for this client
+    :param header_name: a header to pass when making calls to the API.
+    :param header_value: a header value to pass when making calls to
+        the API.
+    :param cookie: a cookie to include in the header when making calls
+        to the API
+    """
+
+    def _create_rest_client(self, configuration):
+        return AsyncRESTClientObject(configuration)
+
+    def __enter__(self):
+        raise TypeError("use 'async with AsyncApiClient(...)' instead of 'with'")
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        raise TypeError("use 'async with AsyncApiClient(...)' instead of 'with'")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the connection pool."""
+        await self.rest_client.close()
+
+    @classmethod
+    def get_default(cls):
+        """Not supported: an aiohttp session is bound to the event loop it
+        was created on, so no client is shared by default.
+
+        :raises TypeError: always; create an AsyncApiClient with
+            ``async with`` and pass it to the API classes.
+        """
+        raise TypeError(
+            "AsyncApiClient has no shared default instance; create one with "
+            "'async with AsyncApiClient(configuration)' and pass it to the API"
+        )
+
+    @classmethod
+    def set_default(cls, default):
+        """Not supported, see :meth:`get_default`."""
+        raise TypeError("AsyncApiClient has no shared default instance")
+
+    async def call_api(
+        self,
+        method,
+        url,
+        header_params=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None
+    ) -> AsyncRESTResponse:
+        """Makes the HTTP request (asynchronous)
+        :param method: Method to call.
+        :param url: Path to method endpoint.
+        :param header_params: Header parameters to be
+            placed in the request header.
+        :param body: Request body.
+        :param post_params dict: Request post form parameters,
+            for `application/x-www-form-urlencoded`, `multipart/form-data`.
+        :param _request_timeout: timeout setting for this request.
+        :return: AsyncRESTResponse
+        """
+
+        try:
+            # perform request and return response
+            response_data = await self.rest_client.request(
+                method, url,
+                headers=header_params,
+                body=body, post_params=post_params,
+                _request_timeout=_request_timeout
+            )
+
+        except ApiException as e:
+            raise e
+
+        return response_data
+
+    async def call_operation(
+        self,
+        operation: ApiOperation,
+        path_params=None,
+        query_params=None,
+        header_params=None,
+        body=None,
+        collection_formats=None,
+        _request_timeout=None,
+        _request_auth=None,
+        _return_http_data_only=True,
+        _preload_content=True,
+        _response_mode="model"
+    ) -> Any:
+        """Serializes, sends and deserializes one API operation call.
+
+        See :meth:`ApiClient.call_operation`; with `_preload_content` set to
+        False the unread aiohttp.ClientResponse is returned.
+        """
+        self._check_response_mode(operation, _response_mode)
+        method, url, header_params, body, post_params = self._serialize_operation(
+            operation,
+            path_params=path_params,
+            query_params=query_params,
+            header_params=header_params,
+            body=body,
+            collection_formats=collection_formats,
+            _request_auth=_request_auth
+        )
+
+        client_id = None
+        if self.configuration.rate_limiter is not None:
+            client_id = self.rate_limit_client_id(header_params)
+        retry = None
+        if self.configuration.retry_policy is not None:
+            retry = self.configuration.retry_policy.start()
+
+        while True:
+            response_data = await self._send_operation(
+                operation, client_id, method, url, header_params, body, post_params,
+                _request_timeout if retry is None else retry.timeout(_request_timeout)
+            )
+            delay = None
+            if retry is not None:
+                delay = retry.next_delay(
+                    method, response_data.status, response_data.getheaders()
+                )
+            if delay is None:
+                break
+            # release the connection before waiting
+            await response_data.read()
+            await asyncio.sleep(delay)
+
+        if not _preload_content:
+            return response_data.response
+
+        await response_data.read()
+        return self._deserialize_operation(
+            operation, response_data, _return_http_data_only, _response_mode
+        )
+
+    async def _send_operation(
+        self,
+        operation: ApiOperation,
+        client_id,
+        method,
+        url,
+        header_params,
+        body,
+        post_params,
+        _request_timeout
+    ) -> AsyncRESTResponse:
+        """Makes one attempt of an operation call under the rate limiter."""
+        limiter = self.configuration.rate_limiter
+        if isinstance(limiter, AsyncRateLimiter):
+            await limiter.acquire(client_id, operation.operation_id)
+        elif limiter is not None:
+            # the limiter sleeps and does blocking store I/O
+            await asyncio.to_thread(limiter.acquire, client_id, operation.operation_id)
+
+        try:
+            response_data = await self.call_api(
+                method, url,
+                header_params=header_params,
+                body=body,
+                post_params=post_params,
+                _request_timeout=_request_timeout
+            )
+        except BaseException:
+            if limiter is not None:
+                limiter.release(client_id, operation.operation_id)
+            raise
+
+        if isinstance(limiter, AsyncRateLimiter):
+            await limiter.handle_response_headers(
+                client_id, response_data.getheaders(), operation.operation_id,
+                status=response_data.status
+            )
+        elif limiter is not None:
+            await asyncio.to_thread(
+                limiter.handle_response_headers,
+                client_id, response_data.getheaders(), operation.operation_id,
+                status=response_data.status
+            )
+        return response_data
@@ -0,0 +1,208 @@
+# coding: utf-8
+
+"""
+Non-blocking HTTP transport for :class:`AsyncApiClient` built on aiohttp.
+
+It mirrors :mod:`rbczpremiumapi.rest`: same request/response interface,
+same TLS settings taken from :class:`Configuration` (including the
+in-memory client certificate loaded by ``Configuration.from_p12``), and
+one pooled connector shared by all requests of the client.
+"""
+
+import io
+import json
+import re
+import ssl
+from typing import Any, Optional
+
+from rbczpremiumapi.certificate import load_client_certificate
+from rbczpremiumapi.exceptions import ApiException, ApiValueError
+
+
+def _import_aiohttp() -> Any:
+    try:
+        import aiohttp
+    except ImportError:
+        raise ImportError(
+            "The 'aiohttp' package is required for the asyncio client. "
+            "Install it using: pip install aiohttp"
+        )
+    return aiohttp
+
+
+class AsyncRESTResponse(io.IOBase):
+
+    def __init__(self, resp) -> None:
+        self.response = resp
+        self.status = resp.status
+        self.reason = resp.reason
+        self.data: Optional[bytes] = None
+
+    async def read(self):
+        if self.data is None:
+            try:
+                self.data = await self.response.read()
+            finally:
+                self.response.release()
+        return self.data
+
+    def getheaders(self):
+        """Returns a CIMultiDictProxy of the response headers."""
+        return self.response.headers
+
+    def getheader(self, name, default=None):
+        """Returns a given response header."""
+        return self.response.headers.get(name, default)
+
+
+class AsyncRESTClientObject:
+
+    def __init__(self, configuration) -> None:
+        self._aiohttp = _import_aiohttp()
+        self.json_codec = configuration.json_codec
+
+        self.maxsize = configuration.connection_pool_maxsize
+
+        if configuration.ssl_context is not None:
+            # prebuilt context, used as is
+            self.ssl_context = configuration.ssl_context
+        else:
+            self.ssl_context = ssl.create_default_context(
+                cafile=configuration.ssl_ca_cert,
+                cadata=configuration.ca_cert_data,
+            )
+            if configuration.client_certificate is not None:
+                load_client_certificate(self.ssl_context, configuration.client_certificate)
+            elif configuration.cert_file:
+                self.ssl_context.load_cert_chain(
+                    configuration.cert_file, keyfile=configuration.key_file
+                )
+            if not configuration.verify_ssl or configuration.assert_hostname is False:
+                self.ssl_context.check_hostname = False
+            if not configuration.verify_ssl:
+                self.ssl_context.verify_mode = ssl.CERT_NONE
+
+        self.proxy = configuration.proxy
+        self.proxy_headers = configuration.proxy_headers
+
+        self.pool_manager = None
+
+    async def close(self) -> None:
+        if self.pool_manager is not None:
+            await self.pool_manager.close()
+            self.pool_manager = None
+
+    async def request(
+        self,
+        method,
+        url,
+        headers=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None
+    ):
+        """Execute request
+
+        :param method: http request method
+        :param url: http request url
+        :param headers: http request headers
+        :param body: request json body, for `application/json`
+        :param post_params: request post parameters,
+                            `application/x-www-form-urlencoded`
+                            and `multipart/form-data`
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        """
+        aiohttp = self._aiohttp
+        method = method.upper()
+        assert method in [
+            'GET',
+            'HEAD',
+            'DELETE',
+            'POST',
+            'PUT',
+            'PATCH',
+            'OPTIONS'
+        ]
+
+        if post_params and body:
+            raise ApiValueError(
+                "body parameter cannot be used with post_params parameter."
+            )
+
+        post_params = post_params or {}
+        headers = headers or {}
+
+        if isinstance(_request_timeout, (int, float)):
+            timeout = aiohttp.ClientTimeout(total=_request_timeout)
+        elif isinstance(_request_timeout, tuple) and len(_request_timeout) == 2:
+            timeout = aiohttp.ClientTimeout(
+                connect=_request_timeout[0],
+                sock_read=_request_timeout[1]
+            )
+        else:
+            timeout = aiohttp.ClientTimeout(total=5 * 60)
+
+        args = {
+            "method": method,
+            "url": url,
+            "timeout": timeout,
+            "headers": headers
+        }
+        if self.proxy:
+            args["proxy"] = self.proxy
+        if self.proxy_headers:
+            args["proxy_headers"] = self.proxy_headers
+
+        # For `POST`, `PUT`, `PATCH`, `OPTIONS`, `DELETE`
+        if method in ['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE']:
+            content_type = headers.get('Content-Type')
+            if not content_type or re.search('json', content_type, re.IGNORECASE):
+                if body is not None:
+                    body = self.json_codec.dumps(body)
+                args["data"] = body
+            elif content_type == 'application/x-www-form-urlencoded':
+                args["data"] = aiohttp.FormData(post_params)
+            elif content_type == 'multipart/form-data':
+                # must del headers['Content-Type'], or the correct
+                # Content-Type which generated by aiohttp will be
+                # overwritten.
+                del headers['Content-Type']
+                data = aiohttp.FormData()
+                for k, v in post_params:
+                    if isinstance(v, tuple) and len(v) == 3:
+                        data.add_field(k, value=v[1], filename=v[0], content_type=v[2])
+                    else:
+                        if isinstance(v, dict):
+                            v = json.dumps(v)
+                        elif isinstance(v, int):
+                            v = str(v)
+                        data.add_field(k, v)
+                args["data"] = data
+            # Pass a `bytes` or `str` parameter directly in the body to support
+            # other content types than JSON when `body` argument is provided
+            # in serialized form.
+            elif isinstance(body, (str, bytes)):
+                args["data"] = body
+            else:
+                # Cannot generate the request from given parameters
+                msg = """Cannot prepare a request message for provided
+                         arguments. Please check that your arguments match
+                         declared content type."""
+                raise ApiException(status=0, reason=msg)
+
+        if self.pool_manager is None:
+            self.pool_manager = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.maxsize, ssl=self.ssl_context),
+                trust_env=True,
+            )
+
+        try:
+            r = await self.pool_manager.request(**args)
+        except aiohttp.ClientSSLError as e:
+            msg = "\n".join([type(e).__name__, str(e)])
+            raise ApiException(status=0, reason=msg)
+
+        return AsyncRESTResponse(r)
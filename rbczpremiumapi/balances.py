@@ -0,0 +1,122 @@
+# coding: utf-8
+
+"""
+Balances of all accounts of a certificate at once.
+
+:func:`get_all_balances` lists the accounts page by page and requests the
+balance of each account as soon as its page arrives, on a thread pool as
+wide as the per-second limit of the rate limiter::
+
+    snapshot = get_all_balances(api_client, client_id)
+    snapshot["1234567890"]["CZK"]["CLBD"]  # booked balance
+
+Every request goes through the limiter of the :class:`ApiClient`, so the
+fan-out never exceeds the limits; it only stops waiting for round-trips.
+"""
+
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from rbczpremiumapi.api_client import ApiClient
+from rbczpremiumapi.PremiumAPI.get_account_balance_api import GetAccountBalanceApi
+from rbczpremiumapi.PremiumAPI.get_accounts_api import GetAccountsApi
+
+if TYPE_CHECKING:
+    from rbczpremiumapi.Model.get_accounts200_response import GetAccounts200Response
+    from rbczpremiumapi.Model.get_balance200_response import GetBalance200Response
+
+# Balances requested at once without a rate limiter to follow.
+_DEFAULT_WORKERS = 10
+
+
+def get_all_balances(
+    api_client: ApiClient,
+    x_ibm_client_id: str,
+    psu_ip_address: Optional[str] = None,
+    page_size: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    x_request_id: Optional[str] = None,
+    **kwargs: Any,
+) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """Return ``{account_number: {currency: {balance_type: value}}}``.
+
+    :param api_client: client the requests are sent through
+    :param x_ibm_client_id: ClientID obtained from the Developer Portal
+    :param psu_ip_address: IP address of the end user, if any
+    :param page_size: accounts listed per page, the API default if ``None``
+    :param max_workers: number of requests sent at once, by default the
+        per-second limit of the rate limiter for ``getBalance``
+    :param x_request_id: request id of the snapshot; account pages are
+        requested as ``"<x_request_id>-accounts-<page>"`` and balances as
+        ``"<x_request_id>-<account_number>"``.  A UUID per request by default.
+    :param kwargs: passed on to every operation call
+    """
+    accounts_api = GetAccountsApi(api_client)
+    balance_api = GetAccountBalanceApi(api_client)
+
+    def request_id(suffix: str) -> str:
+        return f"{x_request_id}-{suffix}" if x_request_id else str(uuid.uuid4())
+
+    def accounts(page: int) -> Optional["GetAccounts200Response"]:
+        return accounts_api.get_accounts(
+            x_ibm_client_id, request_id(f"accounts-{page}"),
+            psu_ip_address=psu_ip_address, page=page, size=page_size, **kwargs
+        )
+
+    def balance(account_number: str) -> Tuple[str, Dict[str, Dict[str, float]]]:
+        response = balance_api.get_balance(
+            x_ibm_client_id, request_id(account_number), account_number,
+            psu_ip_address=psu_ip_address, **kwargs
+        )
+        return account_number, _currencies(response)
+
+    if max_workers is None:
+        max_workers = min(_second_limit(api_client), _DEFAULT_WORKERS)
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, max_workers), thread_name_prefix="rbczpremiumapi-balances"
+    )
+    requested = set()
+    balances: List[Future] = []
+
+    def request_balances(response: Optional["GetAccounts200Response"]) -> None:
+        for account in (response.accounts or []) if response is not None else []:
+            if account.account_number not in requested:
+                requested.add(account.account_number)
+                balances.append(executor.submit(balance, account.account_number))
+
+    try:
+        first = accounts(1)
+        total_pages = (first.total_pages or 1) if first is not None else 1
+        pages = [executor.submit(accounts, page) for page in range(2, total_pages + 1)]
+        request_balances(first)
+        for page in pages:
+            request_balances(page.result())
+
+        snapshot: Dict[str, Dict[str, Dict[str, float]]] = {}
+        for future in balances:
+            account_number, currencies = future.result()
+            snapshot[account_number] = currencies
+        return snapshot
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _currencies(response: Optional["GetBalance200Response"]) -> Dict[str, Dict[str, float]]:
+    currencies: Dict[str, Dict[str, float]] = {}
+    if response is None:
+        return currencies
+    for folder in response.currency_folders or []:
+        balances = currencies.setdefault(folder.currency, {})
+        for entry in folder.balances or []:
+            balances[entry.balance_type] = entry.value
+    return currencies
+
+
+def _second_limit(api_client: ApiClient) -> int:
+    """Return the balance requests per second the rate limiter allows, if any."""
+    limiter = api_client.configuration.rate_limiter
+    if limiter is None:
+        return _DEFAULT_WORKERS
+    operation = GetAccountBalanceApi._get_balance_operation.operation_id
+    return limiter.get_limits(operation)["second"]
@@ -0,0 +1,193 @@
+# coding: utf-8
+
+"""
+In-memory mTLS support for PKCS#12 client certificates.
+
+The bank issues client certificates as password protected ``*.p12`` files.
+:func:`load_p12` decrypts such a file without writing the private key to
+disk in clear text and caches the result per file content and password,
+so the file is decrypted only once per process.  Only this certificate
+material is shared: :func:`create_ssl_context` builds a new
+:class:`ssl.SSLContext` from it for every client, because the transports
+(and urllib3 on every connection) apply the TLS settings of their
+``Configuration`` - verification, CA certificates, hostname checks - to
+the context they use.
+"""
+
+import hashlib
+import os
+import ssl
+import tempfile
+import threading
+from typing import Dict, NamedTuple, Optional, Tuple, Union
+
+from urllib3.util.ssl_ import create_urllib3_context
+
+
+class ClientCertificate(NamedTuple):
+    """A decrypted client certificate, see :func:`load_p12`.
+
+    :param cert_pem: the certificate and its chain, PEM encoded.
+    :param key_pem: the private key, PEM encoded and encrypted with
+        *passphrase*.
+    :param passphrase: the one-off passphrase of *key_pem*.
+    :param fingerprint: SHA-1 fingerprint of the certificate.
+    """
+    cert_pem: bytes
+    key_pem: bytes
+    passphrase: bytes
+    fingerprint: str
+
+
+_lock = threading.Lock()
+# sha256(p12 data + password) -> decrypted certificate
+_certificates: Dict[str, ClientCertificate] = {}
+
+
+def load_p12(p12_file_path: str, password: str) -> ClientCertificate:
+    """Decrypt (or reuse) the client certificate of a PKCS#12 file.
+
+    :param p12_file_path: Path to the .p12/.pfx certificate file
+    :param password: Password to decrypt the certificate file
+    :return: The decrypted certificate
+    :raises ImportError: If cryptography library is not available
+    :raises FileNotFoundError: If certificate file doesn't exist
+    :raises ValueError: If password is incorrect or file format is invalid
+    """
+    if not os.path.exists(p12_file_path):
+        raise FileNotFoundError(f"Certificate file not found: {p12_file_path}")
+
+    with open(p12_file_path, 'rb') as f:
+        p12_data = f.read()
+
+    source_key = hashlib.sha256(p12_data + b"\0" + password.encode('utf-8')).hexdigest()
+
+    with _lock:
+        certificate = _certificates.get(source_key)
+        if certificate is None:
+            certificate = _certificates[source_key] = ClientCertificate(
+                *_decrypt_p12(p12_data, password)
+            )
+        return certificate
+
+
+def create_ssl_context(
+    certificate: ClientCertificate,
+    verify_ssl: bool = True,
+    ca_file: Optional[str] = None,
+    ca_data: Optional[Union[str, bytes]] = None,
+    check_hostname: bool = True,
+) -> ssl.SSLContext:
+    """Build a new SSL context presenting *certificate*.
+
+    :param certificate: The client certificate, see :func:`load_p12`
+    :param verify_ssl: Whether to verify the server certificate
+    :param ca_file: File of CA certificates to verify it with, instead of
+        the system ones
+    :param ca_data: PEM (str) or DER (bytes) CA certificates, ditto
+    :param check_hostname: Whether to match the server hostname
+    :return: The SSL context
+    """
+    context = create_urllib3_context(
+        cert_reqs=ssl.CERT_REQUIRED if verify_ssl else ssl.CERT_NONE
+    )
+    if verify_ssl:
+        context.check_hostname = check_hostname
+        if ca_file or ca_data:
+            context.load_verify_locations(cafile=ca_file, cadata=ca_data)
+        else:
+            context.load_default_certs()
+    load_client_certificate(context, certificate)
+    return context
+
+
+def load_client_certificate(context: ssl.SSLContext, certificate: ClientCertificate) -> None:
+    """Load *certificate* into *context*, for an SSL context built elsewhere."""
+    _load_cert_chain_from_memory(
+        context, certificate.cert_pem + certificate.key_pem, certificate.passphrase
+    )
+
+
+def create_ssl_context_from_p12(p12_file_path: str, password: str) -> Tuple[ssl.SSLContext, str]:
+    """Build a new SSL context holding the client certificate of a PKCS#12 file.
+
+    The file is decrypted once per process, see :func:`load_p12`.
+
+    :param p12_file_path: Path to the .p12/.pfx certificate file
+    :param password: Password to decrypt the certificate file
+    :return: Tuple of (ssl_context, certificate SHA-1 fingerprint)
+    """
+    certificate = load_p12(p12_file_path, password)
+    return create_ssl_context(certificate), certificate.fingerprint
+
+
+def clear_ssl_context_cache() -> None:
+    """Forget all decrypted certificates (e.g. after a certificate renewal)."""
+    with _lock:
+        _certificates.clear()
+
+
+def _decrypt_p12(p12_data: bytes, password: str) -> Tuple[bytes, bytes, bytes, str]:
+    """Decrypt a PKCS#12 payload.
+
+    :return: Tuple of (certificate chain PEM, private key PEM encrypted with
+        a throwaway passphrase, that passphrase, SHA-1 fingerprint)
+    """
+    try:
+        from cryptography.hazmat.primitives import hashes, serialization
+        from cryptography.hazmat.primitives.serialization import pkcs12
+    except ImportError:
+        raise ImportError(
+            "The 'cryptography' package is required for certificate extraction. "
+            "Install it using: pip install cryptography"
+        )
+
+    try:
+        private_key, certificate, additional_certificates = pkcs12.load_key_and_certificates(
+            p12_data, password.encode('utf-8')
+        )
+    except Exception as e:
+        raise ValueError(f"Failed to extract certificate: {str(e)}") from e
+
+    if private_key is None or certificate is None:
+        raise ValueError("No valid certificate and private key found in the P12 file")
+
+    chain = [certificate] + list(additional_certificates or [])
+    cert_pem = b"".join(c.public_bytes(serialization.Encoding.PEM) for c in chain)
+
+    # The key only ever leaves memory encrypted with a one-off passphrase.
+    passphrase = os.urandom(32).hex().encode('ascii')
+    key_pem = private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.BestAvailableEncryption(passphrase)
+    )
+    fingerprint = certificate.fingerprint(hashes.SHA1()).hex()
+
+    return cert_pem, key_pem, passphrase, fingerprint
+
+
+def _load_cert_chain_from_memory(context: ssl.SSLContext, pem_data: bytes, passphrase: bytes) -> None:
+    """Load certificate chain and encrypted key PEM data into *context*.
+
+    ``ssl.SSLContext.load_cert_chain`` only accepts paths, so on Linux the
+    data is passed through an anonymous ``memfd`` which never touches the
+    filesystem.  Elsewhere a private temporary file is used and removed
+    right after loading; the key in it is encrypted either way.
+    """
+    if hasattr(os, "memfd_create") and os.path.isdir("/proc/self/fd"):
+        fd = os.memfd_create("rbczpremiumapi-cert", os.MFD_CLOEXEC)
+        try:
+            os.write(fd, pem_data)
+            context.load_cert_chain(f"/proc/self/fd/{fd}", password=passphrase)
+        finally:
+            os.close(fd)
+        return
+
+    fd, path = tempfile.mkstemp(suffix='.pem')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(pem_data)
+        context.load_cert_chain(path, password=passphrase)
+    finally:
+        os.unlink(path)
@@ -18,12 +18,20 @@ import http.client as httplib
 import logging
 from logging import FileHandler
 import multiprocessing
+import ssl
 import sys
-from typing import Any, ClassVar, Dict, List, Literal, Optional, TypedDict, Union
+from typing import Any, ClassVar, Dict, List, Literal, Optional, TypedDict, Union, TYPE_CHECKING
 from typing_extensions import NotRequired, Self
 
 import urllib3
 
+from rbczpremiumapi.json_codec import JsonCodec, default_codec
+from rbczpremiumapi.retry import RetryPolicy
+
+if TYPE_CHECKING:
+    from rbczpremiumapi.certificate import ClientCertificate
+    from rbczpremiumapi.RateLimit.rate_limiter import RateLimiter
+
 
 JSON_SCHEMA_VALIDATION_KEYWORDS = {
     'multipleOf', 'maximum', 'exclusiveMaximum',
@@ -163,6 +171,8 @@ class Configuration:
     :param retries: Number of retries for API requests.
     :param ca_cert_data: verify the peer using concatenated CA certificate data
       in PEM (str) or DER (bytes) format.
+    :param fast_json: Encode and decode JSON with orjson or msgspec when one
+      is installed; False always uses the standard library.
 
     """
 
@@ -186,6 +196,7 @@ class Configuration:
         ca_cert_data: Optional[Union[str, bytes]] = None,
         *,
         debug: Optional[bool] = None,
+        fast_json: bool = True,
     ) -> None:
         """Constructor
         """
@@ -278,6 +289,25 @@ class Configuration:
         """SSL/TLS Server Name Indication (SNI)
            Set this to the SNI value expected by the server.
         """
+        self.ssl_context: Optional[ssl.SSLContext] = None
+        """Prebuilt SSL context, used as is: the settings above do not
+           apply to it. Takes precedence over client_certificate and
+           cert_file/key_file.
+        """
+        self.client_certificate: Optional["ClientCertificate"] = None
+        """Decrypted client certificate, see from_p12. Each client builds
+           its own SSL context from it, with the settings above applied.
+           Takes precedence over cert_file/key_file.
+        """
+        self.cert_fingerprint: Optional[str] = None
+        """SHA-1 fingerprint of the client certificate
+        """
+        self.rate_limiter: Optional["RateLimiter"] = None
+        """Opt-in RateLimiter consulted before each API operation and fed
+           with the X-RateLimit-* headers of each response. Its state is
+           keyed by the client certificate fingerprint. An AsyncRateLimiter
+           works with AsyncApiClient only; ApiClient raises TypeError.
+        """
 
         self.connection_pool_maxsize = multiprocessing.cpu_count() * 5
         """urllib3 connection pool's maximum number of connections saved
@@ -299,6 +329,15 @@ class Configuration:
         self.retries = retries
         """Adding retries to override urllib3 default value 3
         """
+        self.retry_policy: Optional[RetryPolicy] = None
+        """Retrying of 429 and 5xx responses to idempotent operations,
+           honouring Retry-After and the X-RateLimit-* headers.
+           Opt-in: set to a RetryPolicy to enable.
+        """
+        self.json_codec: JsonCodec = default_codec(fast_json)
+        """Encoder/decoder of JSON bodies: orjson or msgspec if installed
+           and fast_json is set, the standard library otherwise.
+        """
         # Enable client side validation
         self.client_side_validation = True
 
@@ -319,10 +358,16 @@ class Configuration:
         result = cls.__new__(cls)
         memo[id(self)] = result
         for k, v in self.__dict__.items():
-            if k not in ('logger', 'logger_file_handler'):
+            if k not in ('logger', 'logger_file_handler', 'ssl_context', 'client_certificate',
+                         'rate_limiter', 'json_codec'):
                 setattr(result, k, copy.deepcopy(v, memo))
         # shallow copy of loggers
         result.logger = copy.copy(self.logger)
+        # SSL contexts, certificates, rate limiters and codecs are shared, not copied
+        result.ssl_context = self.ssl_context
+        result.client_certificate = self.client_certificate
+        result.rate_limiter = self.rate_limiter
+        result.json_codec = self.json_codec
         # use setters to configure loggers
         result.logger_file = self.logger_file
         result.debug = self.debug
@@ -331,6 +376,27 @@ class Configuration:
     def __setattr__(self, name: str, value: Any) -> None:
         object.__setattr__(self, name, value)
 
+    @classmethod
+    def from_p12(cls, p12_file_path: str, password: str, **kwargs: Any) -> Self:
+        """Create configuration for mTLS with a PKCS#12 client certificate.
+
+        The certificate is decrypted in memory, once per file and
+        password; configurations created for the same certificate share it.
+        Each client builds its own SSL context from it, with the TLS
+        settings of its configuration (verify_ssl, ssl_ca_cert, ...).
+
+        :param p12_file_path: Path to the .p12/.pfx certificate file
+        :param password: Password to decrypt the certificate file
+        :param kwargs: Other Configuration constructor arguments
+        :return: The configuration object.
+        """
+        from rbczpremiumapi.certificate import load_p12
+
+        configuration = cls(**kwargs)
+        configuration.client_certificate = load_p12(p12_file_path, password)
+        configuration.cert_fingerprint = configuration.client_certificate.fingerprint
+        return configuration
+
     @classmethod
     def set_default(cls, default: Optional[Self]) -> None:
         """Set default instance of configuration.
@@ -158,6 +158,9 @@ class ApiException(OpenApiException):
         if http_resp.status == 422:
             raise UnprocessableEntityException(http_resp=http_resp, body=body, data=data)
 
+        if http_resp.status == 429:
+            raise TooManyRequestsException(http_resp=http_resp, body=body, data=data)
+
         if 500 <= http_resp.status <= 599:
             raise ServiceException(http_resp=http_resp, body=body, data=data)
         raise ApiException(http_resp=http_resp, body=body, data=data)
@@ -206,6 +209,11 @@ class UnprocessableEntityException(ApiException):
     pass
 
 
+class TooManyRequestsException(ApiException):
+    """Exception for HTTP 429 Too Many Requests (rate limit exceeded)."""
+    pass
+
+
 def render_path(path_to_item):
     """Returns a string representation of a path"""
     result = ""
@@ -0,0 +1,61 @@
+# coding: utf-8
+
+"""
+Fast parsing of ISO 8601 dates and timestamps.
+
+The API sends timestamps such as ``2024-01-05T10:30:00.0+01:00`` and
+dates such as ``2024-01-05``, and a transaction page repeats the same
+few of them many times.  :func:`parse_datetime` reads this shape with
+one precompiled pattern (``datetime.fromisoformat`` only accepts all of
+it from Python 3.11 on) and memoizes the results.  Anything else is
+left to ``dateutil``, so odd formats keep working, just slower.
+"""
+
+import datetime
+import functools
+import re
+
+from dateutil.parser import parse
+
+_ISO_RE = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})"
+    r"(?:[T ](\d{2}):(\d{2})(?::(\d{2})(?:[.,](\d+))?)?"
+    r"(Z|[+-]\d{2}(?::?\d{2})?)?)?"
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_datetime(string: str) -> datetime.datetime:
+    """Parse a timestamp (or date, as midnight); raise ``ValueError`` if invalid.
+
+    Results are cached; :class:`datetime.datetime` is immutable.
+    """
+    match = _ISO_RE.fullmatch(string)
+    if match is not None:
+        year, month, day, hour, minute, second, fraction, offset = match.groups()
+        try:
+            return datetime.datetime(
+                int(year), int(month), int(day),
+                int(hour or 0), int(minute or 0), int(second or 0),
+                int(fraction[:6].ljust(6, "0")) if fraction else 0,
+                _timezone(offset) if offset else None,
+            )
+        except ValueError:
+            pass
+    return parse(string)
+
+
+def parse_date(string: str) -> datetime.date:
+    """Parse a date (or the date of a timestamp); raise ``ValueError`` if invalid."""
+    return parse_datetime(string).date()
+
+
+@functools.lru_cache(maxsize=None)
+def _timezone(offset: str) -> datetime.timezone:
+    if offset == "Z":
+        return datetime.timezone.utc
+    sign = -1 if offset[0] == "-" else 1
+    digits = offset[1:].replace(":", "")
+    return datetime.timezone(sign * datetime.timedelta(
+        hours=int(digits[:2]), minutes=int(digits[2:] or 0)
+    ))
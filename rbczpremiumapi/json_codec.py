@@ -0,0 +1,102 @@
+# coding: utf-8
+
+"""
+JSON encoding and decoding of request and response bodies.
+
+``Configuration.json_codec`` defaults to the first of these that is
+installed:
+
+* :class:`OrjsonCodec`, `orjson <https://github.com/ijl/orjson>`_
+  (``pip install rbczpremiumapi[fast-json]``),
+* :class:`MsgspecCodec`, `msgspec <https://jcristharif.com/msgspec/>`_
+  (``pip install rbczpremiumapi[msgspec]``),
+* :class:`JsonCodec`, the standard library.
+
+``Configuration(fast_json=False)`` always uses the standard library.  All
+of them decode UTF-8 response bytes directly, without decoding them to
+``str`` first, and encode request bodies to UTF-8 bytes.
+"""
+
+import json
+from typing import Any, Union
+
+
+class JsonCodec:
+    """Codec of the standard library ``json`` module."""
+
+    name = "json"
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Decode a JSON document; raise ``ValueError`` if it is invalid."""
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode *obj* (plain JSON types only) as UTF-8 bytes."""
+        return json.dumps(obj).encode("utf-8")
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+
+class OrjsonCodec(JsonCodec):
+    """Codec backed by ``orjson``."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        try:
+            import orjson
+        except ImportError:
+            raise ImportError(
+                "The 'orjson' package is required for OrjsonCodec. "
+                "Install it using: pip install orjson"
+            )
+        self._loads = orjson.loads
+        self._dumps = orjson.dumps
+        self._options = orjson.OPT_NON_STR_KEYS
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._dumps(obj, option=self._options)
+
+
+class MsgspecCodec(JsonCodec):
+    """Codec backed by ``msgspec.json``."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        try:
+            import msgspec
+        except ImportError:
+            raise ImportError(
+                "The 'msgspec' package is required for MsgspecCodec. "
+                "Install it using: pip install msgspec"
+            )
+        self._decode = msgspec.json.Decoder().decode
+        self._encode = msgspec.json.Encoder().encode
+        self._error = msgspec.DecodeError
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        try:
+            return self._decode(data)
+        except self._error as e:
+            # msgspec errors are not ValueErrors
+            raise ValueError(str(e)) from e
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encode(obj)
+
+
+def default_codec(fast: bool = True) -> JsonCodec:
+    """Return the fastest codec available, or the standard library's if not *fast*."""
+    if not fast:
+        return JsonCodec()
+    for codec in (OrjsonCodec, MsgspecCodec):
+        try:
+            return codec()
+        except ImportError:
+            pass
+    return JsonCodec()
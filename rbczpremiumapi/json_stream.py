@@ -0,0 +1,132 @@
+# coding: utf-8
+
+"""
+Incremental decoding of one array inside a JSON object.
+
+Response bodies such as a transaction page are a JSON object whose bulk
+is a single array::
+
+    {"lastPage": false, "transactions": [{...}, {...}, ...]}
+
+:class:`JsonArrayStream` reads such a body in chunks from a file-like
+object (e.g. an unread ``urllib3.HTTPResponse``) and yields the items of
+the array one by one, so the whole body, its decoded text and the list
+of all items never have to be in memory at once.  The other members of
+the object are collected in :attr:`JsonArrayStream.members`.
+
+Each item is decoded by the stdlib ``json`` decoder; only the object and
+array punctuation around the items is scanned here.
+"""
+
+import codecs
+import json
+from typing import Any, BinaryIO, Dict, Iterator
+
+_WHITESPACE = " \t\n\r"
+
+
+class JsonArrayStream:
+    """Yields the items of array member *key* of a JSON object.
+
+    :param fp: binary file-like object with ``read(size)``
+    :param key: name of the array member to stream
+    :param chunk_size: bytes read at a time
+    :param encoding: character encoding of the body
+    """
+
+    def __init__(
+        self, fp: BinaryIO, key: str, chunk_size: int = 64 * 1024, encoding: str = "utf-8"
+    ) -> None:
+        self._fp = fp
+        self._key = key
+        self._chunk_size = chunk_size
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self._json = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        #: members of the object other than *key*, complete once iterated
+        self.members: Dict[str, Any] = {}
+
+    def __iter__(self) -> Iterator[Any]:
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self._value()
+            if not isinstance(key, str):
+                raise self._error("Expecting property name")
+            self._expect(":")
+            if key == self._key and self._peek() == "[":
+                self._pos += 1
+                if self._peek() == "]":
+                    self._pos += 1
+                else:
+                    while True:
+                        yield self._value()
+                        if self._delimiter(",", "]") == "]":
+                            break
+            else:
+                self.members[key] = self._value()
+            if self._delimiter(",", "}") == "}":
+                return
+
+    # -- private helpers -----------------------------------------------------
+
+    def _fill(self) -> bool:
+        """Read the next chunk; return ``False`` at the end of the body."""
+        if self._eof:
+            return False
+        # drop what was decoded already, keeping memory flat
+        self._buffer = self._buffer[self._pos:]
+        self._pos = 0
+        data = self._fp.read(self._chunk_size)
+        if not data:
+            self._eof = True
+            self._buffer += self._decoder.decode(b"", final=True)
+            return False
+        self._buffer += self._decoder.decode(data)
+        return True
+
+    def _peek(self) -> str:
+        """Skip whitespace and return the next character ('' at the end)."""
+        while True:
+            buffer, pos = self._buffer, self._pos
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, char: str) -> None:
+        if self._peek() != char:
+            raise self._error(f"Expecting '{char}'")
+        self._pos += 1
+
+    def _delimiter(self, *chars: str) -> str:
+        char = self._peek()
+        if not char or char not in chars:
+            raise self._error("Expecting " + " or ".join(f"'{c}'" for c in chars))
+        self._pos += 1
+        return char
+
+    def _value(self) -> Any:
+        self._peek()
+        while True:
+            try:
+                value, end = self._json.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # a number at the end of the buffer may continue in the next chunk
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self._buffer, self._pos)
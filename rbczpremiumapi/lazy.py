@@ -0,0 +1,231 @@
+# coding: utf-8
+
+"""
+Nested models validated on first access, for responses read partially.
+
+Most consumers of a transaction read its amount, direction and dates,
+yet its ``entry_details`` is a tree of sixteen models (parties, postal
+addresses, references) validated for every row.  With
+``_response_mode="lazy"`` an API call returns the usual models, except
+that the fields registered with :func:`make_lazy` (by default
+``entry_details`` of a transaction) hold a :class:`LazyModel` proxy.  The
+proxy keeps the decoded JSON object and validates it, with the model's
+whole sub-tree, when it is first used::
+
+    page = api.get_transaction_list(..., _response_mode="lazy")
+    page.transactions[0].amount.value           # entry details not validated
+    page.transactions[0].entry_details.transaction_details  # validated now
+
+A proxy forwards attribute access and assignment, iteration, equality,
+``repr``, copying and pickling to its model and passes ``isinstance``
+checks for it; pydantic serializes it like the model.  ``type()`` still
+returns :class:`LazyModel` - :func:`materialize` returns the model itself.
+Validation errors of a lazy sub-tree are raised (as
+``pydantic.ValidationError``) on first use instead of while the response
+is deserialized.  The models and the default ``"model"`` response mode are
+unaffected.
+"""
+
+import copy
+import typing
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from rbczpremiumapi.Model import GetTransactionList200ResponseTransactionsInner
+from rbczpremiumapi.model_base import ApiModel
+
+_Converter = Callable[[Any], Any]
+_Wrapper = Callable[[Any], None]
+
+_lazy_fields: Dict[Type[ApiModel], Dict[str, Type[ApiModel]]] = {}
+_wrappers: Dict[Type[ApiModel], Optional[_Wrapper]] = {}
+_converters: Dict[Type[ApiModel], _Converter] = {}
+
+
+class LazyModel:
+    """Proxy of *model* validating *data* on first use."""
+
+    __slots__ = ("_model", "_data", "_value")
+
+    def __init__(self, model: Type[ApiModel], data: Dict[str, Any]) -> None:
+        object.__setattr__(self, "_model", model)
+        object.__setattr__(self, "_data", data)
+        object.__setattr__(self, "_value", None)
+
+    def _materialize(self) -> ApiModel:
+        value = self._value
+        if value is None:
+            value = lazy_converter(self._model)(self._data)
+            object.__setattr__(self, "_value", value)
+            object.__setattr__(self, "_data", None)
+        return value
+
+    @property  # type: ignore[misc]
+    def __class__(self) -> type:
+        return self._model
+
+    def __getattr__(self, name: str) -> Any:
+        if name in LazyModel.__slots__:
+            raise AttributeError(name)
+        return getattr(self._materialize(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._materialize(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self._materialize(), name)
+
+    def __dir__(self) -> List[str]:
+        return dir(self._materialize())
+
+    def __iter__(self) -> Any:
+        return iter(self._materialize())
+
+    def __eq__(self, other: Any) -> bool:
+        return self._materialize() == materialize(other)
+
+    def __hash__(self) -> int:
+        return hash(self._materialize())
+
+    def __repr__(self) -> str:
+        return repr(self._materialize())
+
+    def __str__(self) -> str:
+        return str(self._materialize())
+
+    def __copy__(self) -> ApiModel:
+        return copy.copy(self._materialize())
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> ApiModel:
+        return copy.deepcopy(self._materialize(), memo)
+
+    def __reduce__(self) -> Any:
+        return self._materialize().__reduce__()
+
+
+def materialize(value: Any) -> Any:
+    """Return the model behind a :class:`LazyModel`, other values as they are."""
+    return value._materialize() if type(value) is LazyModel else value
+
+
+def make_lazy(model: Type[ApiModel], *names: str) -> None:
+    """Validate fields *names* of *model* on first use, in ``"lazy"`` mode.
+
+    The fields must hold a model (``Model`` or ``Optional[Model]``).
+    """
+    fields = _lazy_fields.setdefault(model, {})
+    for name in names:
+        nested = _model_of(model.model_fields[name].annotation)
+        if nested is None:
+            raise TypeError(f"{model.__name__}.{name} does not hold a model")
+        fields[name] = nested
+    _wrappers.clear()
+    _converters.clear()
+
+
+def has_lazy_fields(model: Type[ApiModel]) -> bool:
+    """Return whether *model*, or a model below it, has lazy fields."""
+    return _wrapper(model) is not None
+
+
+def lazy_converter(model: Type[ApiModel]) -> _Converter:
+    """Return the function validating a decoded JSON object lazily.
+
+    The function replaces the objects of lazy fields in the decoded JSON
+    by :class:`LazyModel` proxies, which pydantic keeps as they are, and
+    validates the rest as usual.
+    """
+    converter = _converters.get(model)
+    if converter is None:
+        converter = _converters.setdefault(model, _build_converter(model))
+    return converter
+
+
+def _build_converter(model: Type[ApiModel]) -> _Converter:
+    wrap = _wrapper(model)
+    validate = model.model_validate
+    if wrap is None:
+        return validate
+
+    def convert(data: Any) -> Any:
+        if type(data) is dict:
+            wrap(data)
+        return validate(data)
+
+    return convert
+
+
+def _wrapper(model: Type[ApiModel]) -> Optional[_Wrapper]:
+    """Return the function wrapping the lazy objects of a decoded *model*."""
+    if model in _wrappers:
+        return _wrappers[model]
+    _wrappers[model] = None  # models referring to themselves
+    lazy = _lazy_fields.get(model, {})
+    steps: List[Tuple[str, Optional[Type[ApiModel]], Optional[_Wrapper]]] = []
+    for name, info in model.model_fields.items():
+        alias = info.alias or name
+        if name in lazy:
+            steps.append((alias, lazy[name], None))
+            continue
+        nested = _nested_wrapper(info.annotation)
+        if nested is not None:
+            steps.append((alias, None, nested))
+    if not steps:
+        return None
+
+    def wrap(data: Dict[str, Any]) -> None:
+        for alias, lazy_model, nested in steps:
+            value = data.get(alias)
+            if lazy_model is not None:
+                if type(value) is dict:
+                    data[alias] = LazyModel(lazy_model, value)
+            elif value is not None:
+                nested(value)
+
+    _wrappers[model] = wrap
+    return wrap
+
+
+def _nested_wrapper(annotation: Any) -> Optional[_Wrapper]:
+    """Return the function wrapping the lazy objects in a field's value."""
+    origin = typing.get_origin(annotation)
+    if origin is typing.Union:
+        arguments = [a for a in typing.get_args(annotation) if a is not type(None)]
+        if len(arguments) != 1:
+            return None
+        return _nested_wrapper(arguments[0])
+    if origin in (list, typing.List):
+        item = _nested_wrapper(typing.get_args(annotation)[0])
+        if item is None:
+            return None
+
+        def wrap_items(values: Any) -> None:
+            if type(values) is list:
+                for value in values:
+                    if value is not None:
+                        item(value)
+
+        return wrap_items
+    if isinstance(annotation, type) and issubclass(annotation, ApiModel):
+        wrap = _wrapper(annotation)
+        if wrap is None:
+            return None
+
+        def wrap_model(value: Any) -> None:
+            if type(value) is dict:
+                wrap(value)
+
+        return wrap_model
+    return None
+
+
+def _model_of(annotation: Any) -> Optional[Type[ApiModel]]:
+    """Return the model of a ``Model`` or ``Optional[Model]`` annotation."""
+    if typing.get_origin(annotation) is typing.Union:
+        arguments = [a for a in typing.get_args(annotation) if a is not type(None)]
+        annotation = arguments[0] if len(arguments) == 1 else None
+    if isinstance(annotation, type) and issubclass(annotation, ApiModel):
+        return annotation
+    return None
+
+
+make_lazy(GetTransactionList200ResponseTransactionsInner, "entry_details")
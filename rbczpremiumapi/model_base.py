@@ -0,0 +1,53 @@
+# coding: utf-8
+
+"""
+Base class of the models in :mod:`rbczpremiumapi.Model`.
+
+The API speaks camelCase JSON (``entryReference``) while the models have
+snake_case fields (``entry_reference``).  Every field declares its JSON
+name as alias, so pydantic-core maps the keys while it validates, and
+:meth:`ApiModel.from_json` validates a raw response body in one pass,
+without building an intermediate ``dict``.  Models accept the field
+names as well, for construction in code::
+
+    GetTransactionList200ResponseTransactionsInnerAmount(value=1.5, currency="CZK")
+"""
+
+from typing import Any, Dict, Optional, Union
+
+from pydantic import BaseModel, ConfigDict
+
+
+class ApiModel(BaseModel):
+    """Model with camelCase JSON aliases."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    @classmethod
+    def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Any:
+        """Create an instance from a decoded JSON object (camelCase keys)."""
+        if obj is None:
+            return None
+        return cls.model_validate(obj)
+
+    @classmethod
+    def from_json(cls, json_data: Union[bytes, str]) -> Any:
+        """Create an instance from a JSON document, validated in one pass."""
+        return cls.model_validate_json(json_data)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the JSON object (camelCase keys) without unset members."""
+        return self.model_dump(by_alias=True, exclude_none=True)
+
+    def to_json(self) -> str:
+        """Return the JSON document (camelCase keys) without unset members."""
+        return self.model_dump_json(by_alias=True, exclude_none=True)
+
+
+def get_path(obj: Any, *path: str) -> Any:
+    """Follow attributes *path* from a model or record, stopping at the first ``None``."""
+    for name in path:
+        if obj is None:
+            return None
+        obj = getattr(obj, name, None)
+    return obj
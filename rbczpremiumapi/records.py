@@ -0,0 +1,102 @@
+# coding: utf-8
+
+"""
+Read-only records mirroring the models, for bulk data.
+
+A pydantic model instance carries a ``__dict__``, a set of the fields
+set and validation state, and a transaction is a tree of a dozen of
+them.  With ``_response_mode="records"`` an API call returns the same
+tree as named tuples instead::
+
+    page = api.get_transaction_list(..., _response_mode="records")
+    page.transactions[0].amount.value
+
+Each model gets a record type with the same field names (see
+:func:`record_type`), built once from ``model_fields``.  Records are
+built straight from the decoded JSON, **without validation** - the
+payload is trusted as the API documents it.  Only dates are parsed
+(memoized, see :mod:`rbczpremiumapi.iso8601`), lists become tuples and
+string values are interned, so repeated values such as currencies,
+codes or counterparty names are stored once.
+"""
+
+import collections
+import datetime
+import sys
+import typing
+from typing import Any, Callable, Dict, Optional, Type
+
+from rbczpremiumapi.iso8601 import parse_date, parse_datetime
+from rbczpremiumapi.model_base import ApiModel
+
+_Converter = Callable[[Any], Any]
+
+_types: Dict[Type[ApiModel], type] = {}
+_converters: Dict[Type[ApiModel], _Converter] = {}
+
+
+def record_type(model: Type[ApiModel]) -> type:
+    """Return the named tuple type mirroring *model*.
+
+    Its name is the model's with ``Record`` appended; all fields default
+    to ``None``.
+    """
+    record = _types.get(model)
+    if record is None:
+        record = collections.namedtuple(
+            model.__name__ + "Record", list(model.model_fields),
+            defaults=(None,) * len(model.model_fields), module=model.__module__,
+        )
+        record = _types.setdefault(model, record)
+    return record
+
+
+def record_converter(model: Type[ApiModel]) -> _Converter:
+    """Return the function turning a decoded JSON object into a record."""
+    converter = _converters.get(model)
+    if converter is None:
+        converter = _converters.setdefault(model, _build_converter(model))
+    return converter
+
+
+def _build_converter(model: Type[ApiModel]) -> _Converter:
+    make = tuple.__new__
+    record = record_type(model)
+    fields = [
+        (info.alias or name, _value_converter(info.annotation))
+        for name, info in model.model_fields.items()
+    ]
+
+    def convert(data: Dict[str, Any]) -> Any:
+        get = data.get
+        return make(record, [
+            value if (value := get(alias)) is None or to_value is None else to_value(value)
+            for alias, to_value in fields
+        ])
+
+    return convert
+
+
+def _value_converter(annotation: Any) -> Optional[_Converter]:
+    """Return the converter of a field's JSON value; ``None`` keeps it as is."""
+    origin = typing.get_origin(annotation)
+    if origin is typing.Union:
+        arguments = [a for a in typing.get_args(annotation) if a is not type(None)]
+        if len(arguments) != 1:
+            return None
+        return _value_converter(arguments[0])
+    if origin in (list, typing.List):
+        item = _value_converter(typing.get_args(annotation)[0])
+        if item is None:
+            return tuple
+        return lambda values: tuple(v if v is None else item(v) for v in values)
+    if isinstance(annotation, type):
+        if issubclass(annotation, ApiModel):
+            return record_converter(annotation)
+        if annotation is datetime.datetime:
+            return parse_datetime
+        if annotation is datetime.date:
+            return parse_date
+        if annotation is str:
+            return sys.intern
+    return None
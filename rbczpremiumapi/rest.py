@@ -20,6 +20,7 @@ import ssl
 
 import urllib3
 
+from rbczpremiumapi.certificate import create_ssl_context
 from rbczpremiumapi.exceptions import ApiException, ApiValueError
 
 SUPPORTED_SOCKS_PROXIES = {"socks5", "socks5h", "socks4", "socks4a"}
@@ -61,6 +62,8 @@ class RESTResponse(io.IOBase):
 class RESTClientObject:
 
     def __init__(self, configuration) -> None:
+        self.json_codec = configuration.json_codec
+
         # urllib3.PoolManager will pass all kw parameters to connectionpool
         # https://github.com/shazow/urllib3/blob/f9409436f83aeb79fbaf090181cd81b784f1b8ce/urllib3/poolmanager.py#L75  # noqa: E501
         # https://github.com/shazow/urllib3/blob/f9409436f83aeb79fbaf090181cd81b784f1b8ce/urllib3/connectionpool.py#L680  # noqa: E501
@@ -90,6 +93,18 @@ class RESTClientObject:
         if configuration.tls_server_name:
             pool_args['server_hostname'] = configuration.tls_server_name
 
+        if configuration.ssl_context is not None:
+            pool_args['ssl_context'] = configuration.ssl_context
+        elif configuration.client_certificate is not None:
+            # a context of its own: urllib3 applies the settings above to it
+            pool_args['ssl_context'] = create_ssl_context(
+                configuration.client_certificate,
+                verify_ssl=configuration.verify_ssl,
+                ca_file=configuration.ssl_ca_cert,
+                ca_data=configuration.ca_cert_data,
+                check_hostname=configuration.assert_hostname is not False,
+            )
+
 
         if configuration.socket_options is not None:
             pool_args['socket_options'] = configuration.socket_options
@@ -180,7 +195,7 @@ class RESTClientObject:
                 ):
                     request_body = None
                     if body is not None:
-                        request_body = json.dumps(body)
+                        request_body = self.json_codec.dumps(body)
                     r = self.pool_manager.request(
                         method,
                         url,
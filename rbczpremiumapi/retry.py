@@ -0,0 +1,144 @@
+# coding: utf-8
+
+"""
+Retrying of rate-limited (429) and failed (5xx) API calls.
+
+:class:`RetryPolicy` decides whether a response is retried and how long to
+wait before the next attempt:
+
+* ``Retry-After`` (seconds or HTTP date) if the server sent one,
+* otherwise the bank's rate-limit headers: an exhausted
+  ``X-RateLimit-Remaining-Second`` means the next second, an exhausted
+  ``X-RateLimit-Remaining-Day`` is not worth waiting for,
+* otherwise exponential backoff with full jitter.
+
+Every call has a deadline: the timeout of each attempt, the first one
+included, is capped at the time left until it, and no retry is started
+that could not finish waiting before it, so the latency of a call stays
+bounded.
+"""
+
+import email.utils
+import random
+import time
+from typing import Any, Collection, Mapping, Optional
+
+
+class RetryPolicy:
+    """When and how :class:`ApiClient` retries a response.
+
+    :param max_retries: maximum number of retries of one call
+    :param backoff_base: first backoff delay in seconds, doubled per retry
+    :param backoff_max: upper bound of one backoff delay in seconds
+    :param deadline: seconds since the first attempt within which the call
+        finishes; caps the timeout of every attempt
+    :param statuses: HTTP statuses that are retried
+    :param methods: HTTP methods that are retried (idempotent ones only by
+        default, as a failed POST may have been processed)
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 10.0,
+        deadline: float = 30.0,
+        statuses: Collection[int] = (429, 500, 502, 503, 504),
+        methods: Collection[str] = ("GET", "HEAD", "OPTIONS"),
+    ) -> None:
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.deadline = deadline
+        self.statuses = frozenset(statuses)
+        self.methods = frozenset(m.upper() for m in methods)
+
+    def start(self) -> "RetryState":
+        """Start tracking the attempts of one call."""
+        return RetryState(self)
+
+    def delay(self, retry: int, headers: Optional[Mapping[str, Any]] = None) -> Optional[float]:
+        """Return seconds to wait before retry number *retry* (from 0).
+
+        ``None`` means the server asked to wait longer than makes sense
+        (the day window is exhausted).
+        """
+        if headers:
+            retry_after = _retry_after(headers.get("Retry-After"))
+            if retry_after is not None:
+                return retry_after
+            if _exhausted(headers, "X-RateLimit-Remaining-Day"):
+                return None
+            if _exhausted(headers, "X-RateLimit-Remaining-Second"):
+                # the sliding second ends at most 1 s from now
+                return 1.0 + random.uniform(0, self.backoff_base / 2)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** retry))
+
+
+class RetryState:
+    """Attempts and deadline of one call made under a :class:`RetryPolicy`."""
+
+    def __init__(self, policy: RetryPolicy) -> None:
+        self.policy = policy
+        self.retries = 0
+        self.deadline = time.monotonic() + policy.deadline
+
+    def remaining(self) -> float:
+        """Seconds left until the deadline."""
+        return max(0.0, self.deadline - time.monotonic())
+
+    def timeout(self, request_timeout: Any) -> Any:
+        """Return *request_timeout* capped at the time left until the deadline.
+
+        Accepts the forms of ``_request_timeout``: ``None``, a total number
+        of seconds or a ``(connect, read)`` tuple.
+        """
+        # a zero timeout means none to the REST clients
+        remaining = max(0.001, self.remaining())
+        if isinstance(request_timeout, tuple):
+            return tuple(
+                remaining if t is None else min(t, remaining) for t in request_timeout
+            )
+        if request_timeout is None:
+            return remaining
+        return min(request_timeout, remaining)
+
+    def next_delay(self, method: str, status: int, headers: Optional[Mapping[str, Any]]) -> Optional[float]:
+        """Return seconds to wait before retrying, or ``None`` to give up.
+
+        Counts the retry when one is granted.
+        """
+        policy = self.policy
+        if (
+            status not in policy.statuses
+            or method.upper() not in policy.methods
+            or self.retries >= policy.max_retries
+        ):
+            return None
+        delay = policy.delay(self.retries, headers)
+        if delay is None or delay >= self.remaining():
+            return None
+        self.retries += 1
+        return delay
+
+
+def _retry_after(value: Optional[str]) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, date.timestamp() - time.time())
+
+
+def _exhausted(headers: Mapping[str, Any], name: str) -> bool:
+    value = headers.get(name)
+    try:
+        return value is not None and int(value) <= 0
+    except (TypeError, ValueError):
+        return False
@@ -0,0 +1,240 @@
+# coding: utf-8
+
+"""
+Columnar view of the frequently used transaction fields.
+
+A :class:`TransactionFrame` holds one NumPy array per field instead of
+one model object (with a dozen nested ones) per transaction.  It is built
+straight from the decoded JSON pages, so no model is ever created::
+
+    pages = [json.loads(body) for body in bodies]
+    frame = TransactionFrame.from_pages(pages)
+    frame.filter(frame["credit"]).sum()            # incoming payments
+    frame.group_sum("counterparty_account")        # turnover per counterparty
+    frame.to_arrow()                               # pyarrow.Table
+
+Columns (:data:`TransactionFrame.COLUMNS`):
+
+=====================  ==================  ==============================
+column                 dtype               source
+=====================  ==================  ==============================
+entry_reference        object              ``entryReference``
+amount                 float64             ``amount.value``
+currency               object              ``amount.currency``
+credit                 bool                ``creditDebitIndication == "CRDT"``
+booking_date           datetime64[ms]      ``bookingDate`` in UTC
+value_date             datetime64[ms]      ``valueDate`` in UTC
+counterparty_account   object              IBAN, else ``prefix-number``
+variable_symbol        object              creditor reference ``variable``
+=====================  ==================  ==============================
+
+NumPy is an optional dependency (``pip install rbczpremiumapi[frame]``);
+pyarrow and pandas are only needed for the respective export.
+"""
+
+import datetime
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from rbczpremiumapi.iso8601 import parse_datetime
+from rbczpremiumapi.model_base import get_path
+
+if TYPE_CHECKING:
+    from rbczpremiumapi.Model.get_transaction_list200_response_transactions_inner import (
+        GetTransactionList200ResponseTransactionsInner,
+    )
+
+_DTYPES = {
+    "entry_reference": "object",
+    "amount": "float64",
+    "currency": "object",
+    "credit": "bool",
+    "booking_date": "datetime64[ms]",
+    "value_date": "datetime64[ms]",
+    "counterparty_account": "object",
+    "variable_symbol": "object",
+}
+
+
+def _import_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            "The 'numpy' package is required for TransactionFrame. "
+            "Install it using: pip install numpy"
+        )
+    return numpy
+
+
+class TransactionFrame:
+    """Transactions as a set of equally long NumPy columns.
+
+    :param columns: array per column name of :data:`COLUMNS`
+    """
+
+    COLUMNS: Tuple[str, ...] = tuple(_DTYPES)
+
+    def __init__(self, columns: Mapping[str, Any]) -> None:
+        np = _import_numpy()
+        missing = set(self.COLUMNS) - set(columns)
+        if missing:
+            raise ValueError(f"Missing columns: {', '.join(sorted(missing))}")
+        self._columns = {
+            name: np.asarray(columns[name], dtype=_DTYPES[name]) for name in self.COLUMNS
+        }
+        lengths = {len(column) for column in self._columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("Columns differ in length")
+
+    # -- construction ----------------------------------------------------------
+
+    @classmethod
+    def from_pages(cls, pages: Iterable[Optional[Mapping[str, Any]]]) -> "TransactionFrame":
+        """Build from decoded ``getTransactionList`` response bodies."""
+        return cls.from_records(
+            record for page in pages if page for record in page.get("transactions") or ()
+        )
+
+    @classmethod
+    def from_records(cls, records: Iterable[Mapping[str, Any]]) -> "TransactionFrame":
+        """Build from decoded transactions (camelCase JSON objects)."""
+        values: Dict[str, List[Any]] = {name: [] for name in cls.COLUMNS}
+        for record in records:
+            amount = record["amount"]
+            details = (record.get("entryDetails") or {}).get("transactionDetails") or {}
+            account = ((details.get("relatedParties") or {}).get("counterParty") or {}).get("account")
+            reference = (details.get("remittanceInformation") or {}).get(
+                "creditorReferenceInformation"
+            ) or {}
+            values["entry_reference"].append(record["entryReference"])
+            values["amount"].append(amount["value"])
+            values["currency"].append(amount["currency"])
+            values["credit"].append(record["creditDebitIndication"] == "CRDT")
+            values["booking_date"].append(_utc(record.get("bookingDate")))
+            values["value_date"].append(_utc(record.get("valueDate")))
+            values["counterparty_account"].append(
+                _account(account.get("iban"), account.get("accountNumberPrefix"),
+                         account.get("accountNumber")) if account else None
+            )
+            values["variable_symbol"].append(reference.get("variable"))
+        return cls(values)
+
+    @classmethod
+    def from_transactions(
+        cls, transactions: Iterable["GetTransactionList200ResponseTransactionsInner"]
+    ) -> "TransactionFrame":
+        """Build from transaction models already deserialized."""
+        values: Dict[str, List[Any]] = {name: [] for name in cls.COLUMNS}
+        for transaction in transactions:
+            details = get_path(transaction, "entry_details", "transaction_details")
+            account = get_path(details, "related_parties", "counter_party", "account")
+            values["entry_reference"].append(transaction.entry_reference)
+            values["amount"].append(transaction.amount.value)
+            values["currency"].append(transaction.amount.currency)
+            values["credit"].append(transaction.credit_debit_indication == "CRDT")
+            values["booking_date"].append(_utc(transaction.booking_date))
+            values["value_date"].append(_utc(transaction.value_date))
+            values["counterparty_account"].append(
+                _account(account.iban, account.account_number_prefix, account.account_number)
+                if account is not None else None
+            )
+            values["variable_symbol"].append(get_path(
+                details, "remittance_information", "creditor_reference_information", "variable"
+            ))
+        return cls(values)
+
+    @classmethod
+    def concat(cls, frames: Iterable["TransactionFrame"]) -> "TransactionFrame":
+        """Join frames one after another."""
+        np = _import_numpy()
+        frames = list(frames)
+        return cls({
+            name: np.concatenate([f[name] for f in frames]) if frames else []
+            for name in cls.COLUMNS
+        })
+
+    # -- access ----------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._columns["amount"])
+
+    def __getitem__(self, name: str) -> Any:
+        """Return the array of column *name*."""
+        return self._columns[name]
+
+    def __repr__(self) -> str:
+        return f"<TransactionFrame of {len(self)} transactions>"
+
+    def filter(self, mask: Any) -> "TransactionFrame":
+        """Return the rows selected by a boolean *mask* (or index array)."""
+        return TransactionFrame({name: column[mask] for name, column in self._columns.items()})
+
+    def sum(self, column: str = "amount") -> float:
+        """Return the sum of a numeric column."""
+        return float(self._columns[column].sum())
+
+    def group_sum(self, by: str, column: str = "amount") -> Dict[Any, float]:
+        """Return the sum of *column* per distinct value of column *by*.
+
+        Rows where *by* is missing (``None`` or NaT) are left out.
+        """
+        np = _import_numpy()
+        keys = self._columns[by]
+        if keys.dtype == object:
+            present = np.array([key is not None for key in keys], dtype=bool)
+        elif keys.dtype.kind == "M":
+            present = ~np.isnat(keys)
+        else:
+            present = np.ones(len(keys), dtype=bool)
+        unique, inverse = np.unique(keys[present], return_inverse=True)
+        sums = np.bincount(
+            inverse.ravel(), weights=self._columns[column][present], minlength=len(unique)
+        )
+        return {key.item() if hasattr(key, "item") else key: float(total)
+                for key, total in zip(unique, sums)}
+
+    # -- export ----------------------------------------------------------------
+
+    def to_arrow(self) -> Any:
+        """Return a ``pyarrow.Table``; numeric and date columns are not copied."""
+        try:
+            import pyarrow
+        except ImportError:
+            raise ImportError(
+                "The 'pyarrow' package is required for TransactionFrame.to_arrow(). "
+                "Install it using: pip install pyarrow"
+            )
+        return pyarrow.table({
+            name: pyarrow.array(column, from_pandas=True)
+            for name, column in self._columns.items()
+        })
+
+    def to_pandas(self) -> Any:
+        """Return a ``pandas.DataFrame`` sharing the column arrays."""
+        try:
+            import pandas
+        except ImportError:
+            raise ImportError(
+                "The 'pandas' package is required for TransactionFrame.to_pandas(). "
+                "Install it using: pip install pandas"
+            )
+        return pandas.DataFrame(dict(self._columns), copy=False)
+
+
+def _utc(value: Any) -> Optional[datetime.datetime]:
+    """Return *value* (ISO 8601 string or datetime) as naive UTC datetime."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = parse_datetime(value)
+    if isinstance(value, datetime.datetime) and value.tzinfo is not None:
+        value = value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _account(iban: Optional[str], prefix: Optional[str], number: Optional[str]) -> Optional[str]:
+    if iban:
+        return iban
+    if number and prefix:
+        return f"{prefix}-{number}"
+    return number
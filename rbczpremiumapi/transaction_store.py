@@ -0,0 +1,237 @@
+# coding: utf-8
+
+"""
+Local SQLite copy of downloaded transactions.
+
+:class:`TransactionStore` flattens each transaction into one row of the
+``transactions`` table, so that reconciliation can look transactions up
+by date, variable symbol or counterparty without calling the API::
+
+    store = TransactionStore("/var/lib/myapp/transactions.db")
+    store.add("1234567890", "CZK", iter_transactions(api, client_id, ...))
+    store.find(variable_symbol="20240117")
+
+Table schema::
+
+    CREATE TABLE IF NOT EXISTS transactions (
+        account_number              TEXT NOT NULL,
+        currency_code               TEXT NOT NULL,
+        entry_reference             TEXT NOT NULL,
+        amount                      REAL NOT NULL,
+        currency                    TEXT NOT NULL,
+        credit_debit_indication     TEXT NOT NULL,
+        booking_date                TEXT,
+        value_date                  TEXT,
+        bank_transaction_code       TEXT,
+        end_to_end_identification   TEXT,
+        variable_symbol             TEXT,
+        constant_symbol             TEXT,
+        specific_symbol             TEXT,
+        remittance_information      TEXT,
+        originator_message          TEXT,
+        counterparty_name           TEXT,
+        counterparty_iban           TEXT,
+        counterparty_account_number TEXT,
+        counterparty_bank_code      TEXT,
+        PRIMARY KEY (account_number, currency_code, entry_reference)
+    )
+
+with indexes on the booking date, ``entry_reference``, the variable
+symbol and the counterparty IBAN.  Dates are stored as ISO 8601 text.
+Rows are written with one ``executemany`` upsert per :meth:`add`, in WAL
+mode with ``synchronous=NORMAL`` as in :class:`DbRateLimitStore`.
+"""
+
+import datetime
+import sqlite3
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
+
+from rbczpremiumapi.model_base import get_path
+
+if TYPE_CHECKING:
+    from rbczpremiumapi.Model.get_transaction_list200_response_transactions_inner import (
+        GetTransactionList200ResponseTransactionsInner,
+    )
+
+_KEY = ("account_number", "currency_code", "entry_reference")
+
+_COLUMNS = _KEY + (
+    "amount",
+    "currency",
+    "credit_debit_indication",
+    "booking_date",
+    "value_date",
+    "bank_transaction_code",
+    "end_to_end_identification",
+    "variable_symbol",
+    "constant_symbol",
+    "specific_symbol",
+    "remittance_information",
+    "originator_message",
+    "counterparty_name",
+    "counterparty_iban",
+    "counterparty_account_number",
+    "counterparty_bank_code",
+)
+
+_NOT_NULL = _KEY + ("amount", "currency", "credit_debit_indication")
+
+_INDEXES = {
+    "transactions_booking_date": ("account_number", "currency_code", "booking_date"),
+    "transactions_entry_reference": ("entry_reference",),
+    "transactions_variable_symbol": ("variable_symbol",),
+    "transactions_counterparty_iban": ("counterparty_iban",),
+}
+
+
+class TransactionStore:
+    """Transactions of any number of accounts in one SQLite database.
+
+    :param database: path of the database file, ``":memory:"`` for a
+        temporary one
+    :param kwargs: passed to :func:`sqlite3.connect`
+    """
+
+    def __init__(self, database: str = ":memory:", **kwargs: Any) -> None:
+        kwargs.setdefault("check_same_thread", False)
+        self._conn = sqlite3.connect(database, **kwargs)
+        self._lock = threading.Lock()
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._init_table()
+        placeholders = ", ".join("?" for _ in _COLUMNS)
+        updates = ", ".join(f"{c} = excluded.{c}" for c in _COLUMNS if c not in _KEY)
+        self._upsert_sql = (
+            f"INSERT INTO transactions ({', '.join(_COLUMNS)}) VALUES ({placeholders})"
+            f" ON CONFLICT ({', '.join(_KEY)}) DO UPDATE SET {updates}"
+        )
+
+    # -- public interface ----------------------------------------------------
+
+    def add(
+        self,
+        account_number: str,
+        currency_code: str,
+        transactions: Iterable["GetTransactionList200ResponseTransactionsInner"],
+    ) -> int:
+        """Insert or replace transactions of one account.
+
+        :return: number of transactions written
+        """
+        currency_code = currency_code.upper()
+        rows = [_row(account_number, currency_code, t) for t in transactions]
+        with self._lock:
+            try:
+                self._conn.executemany(self._upsert_sql, rows)
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+        return len(rows)
+
+    def find(
+        self,
+        account_number: Optional[str] = None,
+        currency_code: Optional[str] = None,
+        var_from: Optional[datetime.date] = None,
+        to: Optional[datetime.date] = None,
+        entry_reference: Optional[str] = None,
+        variable_symbol: Optional[str] = None,
+        counterparty_iban: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Return matching transactions as rows, in booking order.
+
+        All given criteria must match; *var_from* and *to* bound the
+        booking date and are inclusive like in the API.
+        """
+        conditions: List[str] = []
+        params: List[Any] = []
+        for column, value in (
+            ("account_number", account_number),
+            ("currency_code", currency_code.upper() if currency_code else None),
+            ("entry_reference", entry_reference),
+            ("variable_symbol", variable_symbol),
+            ("counterparty_iban", counterparty_iban),
+        ):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        if var_from is not None:
+            conditions.append("booking_date >= ?")
+            params.append(var_from.isoformat())
+        if to is not None:
+            if not isinstance(to, datetime.datetime):
+                # dates include the whole day
+                to = datetime.datetime.combine(to + datetime.timedelta(days=1), datetime.time())
+                conditions.append("booking_date < ?")
+            else:
+                conditions.append("booking_date <= ?")
+            params.append(to.isoformat())
+
+        sql = f"SELECT {', '.join(_COLUMNS)} FROM transactions"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY booking_date, rowid"
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [dict(zip(_COLUMNS, row)) for row in rows]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    # -- private helpers -----------------------------------------------------
+
+    def _init_table(self) -> None:
+        columns = ", ".join(
+            f"{c} {'REAL' if c == 'amount' else 'TEXT'}{' NOT NULL' if c in _NOT_NULL else ''}"
+            for c in _COLUMNS
+        )
+        with self._lock:
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS transactions ({columns},"
+                f" PRIMARY KEY ({', '.join(_KEY)}))"
+            )
+            for name, indexed in _INDEXES.items():
+                self._conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS {name} ON transactions ({', '.join(indexed)})"
+                )
+            self._conn.commit()
+
+
+def _row(
+    account_number: str,
+    currency_code: str,
+    transaction: "GetTransactionList200ResponseTransactionsInner",
+) -> Tuple[Any, ...]:
+    details = get_path(transaction, "entry_details", "transaction_details")
+    remittance = get_path(details, "remittance_information")
+    creditor_reference = get_path(remittance, "creditor_reference_information")
+    counter_party = get_path(details, "related_parties", "counter_party")
+    return (
+        account_number,
+        currency_code,
+        transaction.entry_reference,
+        transaction.amount.value,
+        transaction.amount.currency,
+        transaction.credit_debit_indication,
+        _isoformat(transaction.booking_date),
+        _isoformat(transaction.value_date),
+        get_path(transaction, "bank_transaction_code", "code"),
+        get_path(details, "references", "end_to_end_identification"),
+        get_path(creditor_reference, "variable"),
+        get_path(creditor_reference, "constant"),
+        get_path(creditor_reference, "specific"),
+        get_path(remittance, "unstructured"),
+        get_path(remittance, "originator_message"),
+        get_path(counter_party, "name"),
+        get_path(counter_party, "account", "iban"),
+        get_path(counter_party, "account", "account_number"),
+        get_path(counter_party, "organisation_identification", "bank_code"),
+    )
+
+
+def _isoformat(value: Optional[datetime.date]) -> Optional[str]:
+    return value.isoformat() if value is not None else None
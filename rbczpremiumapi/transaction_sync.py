@@ -0,0 +1,203 @@
+# coding: utf-8
+
+"""
+Incremental download of transactions.
+
+:class:`TransactionSync` remembers, per account and currency, the latest
+booking date seen (the *watermark*) and the transactions booked in the
+last *overlap* before it.  Each :meth:`TransactionSync.sync` lists only
+from ``watermark - overlap`` on and returns the transactions that are new
+or changed since the previous sync::
+
+    sync = TransactionSync(GetTransactionListApi(api_client), client_id,
+                           path="/var/lib/myapp/transaction-sync.json")
+    for transaction in sync.sync("1234567890", "CZK"):
+        ...
+
+The overlap catches transactions the bank books late or amends.  State
+is kept in memory, or in a JSON file replaced atomically on each sync.
+With a :class:`TransactionStore` the returned transactions are also
+written to it.
+"""
+
+import datetime
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from rbczpremiumapi.PremiumAPI.get_transaction_list_api import GetTransactionListApi
+from rbczpremiumapi.transaction_store import TransactionStore
+from rbczpremiumapi.transactions import MAX_WINDOW, get_transaction_history
+
+if TYPE_CHECKING:
+    from rbczpremiumapi.Model.get_transaction_list200_response_transactions_inner import (
+        GetTransactionList200ResponseTransactionsInner,
+    )
+
+logger = logging.getLogger(__name__)
+
+
+class TransactionSync:
+    """Fetches only the transactions not returned by a previous sync.
+
+    :param api: API the transactions are listed through
+    :param x_ibm_client_id: ClientID obtained from the Developer Portal
+    :param path: JSON file keeping the watermarks between runs; state is
+        kept in memory only if ``None``
+    :param overlap: how far before the watermark each sync lists again
+    :param window: window length used by :func:`get_transaction_history`
+    :param max_workers: windows listed at once, see
+        :func:`get_transaction_history`
+    :param psu_ip_address: IP address of the end user, if any
+    :param store: store the new and changed transactions are added to
+    """
+
+    def __init__(
+        self,
+        api: GetTransactionListApi,
+        x_ibm_client_id: str,
+        path: Optional[str] = None,
+        overlap: datetime.timedelta = datetime.timedelta(days=3),
+        window: datetime.timedelta = datetime.timedelta(days=7),
+        max_workers: Optional[int] = None,
+        psu_ip_address: Optional[str] = None,
+        store: Optional[TransactionStore] = None,
+    ) -> None:
+        self._api = api
+        self._client_id = x_ibm_client_id
+        self._path = path
+        self._overlap = overlap
+        self._window = window
+        self._max_workers = max_workers
+        self._psu_ip_address = psu_ip_address
+        self._store = store
+        self._lock = threading.Lock()
+        self._state: Dict[str, Dict[str, Any]] = self._load()
+
+    # -- public interface ----------------------------------------------------
+
+    def sync(
+        self,
+        account_number: str,
+        currency_code: str,
+        to: Optional[datetime.date] = None,
+    ) -> List["GetTransactionList200ResponseTransactionsInner"]:
+        """List the account and return new or changed transactions.
+
+        The first sync of an account lists the whole history the bank
+        keeps (:data:`MAX_WINDOW`).
+
+        :param to: last day to list, today by default
+        :return: transactions in booking order
+        """
+        if to is None:
+            to = datetime.date.today()
+        key = _key(account_number, currency_code)
+        with self._lock:
+            state = self._state.get(key, {"watermark": None, "seen": {}})
+
+        earliest = to - MAX_WINDOW + datetime.timedelta(days=1)
+        watermark = _parse(state["watermark"])
+        if watermark is None:
+            var_from = earliest
+        else:
+            var_from = (watermark - self._overlap).date()
+            if var_from < earliest:
+                logger.warning(
+                    "Transactions of %s %s booked between %s and %s are no longer available",
+                    account_number, currency_code, var_from, earliest,
+                )
+                var_from = earliest
+
+        transactions = get_transaction_history(
+            self._api, self._client_id, account_number, currency_code,
+            var_from, to, window=self._window, max_workers=self._max_workers,
+            psu_ip_address=self._psu_ip_address,
+        )
+
+        seen: Dict[str, List[Optional[str]]] = dict(state["seen"])
+        changed = []
+        for transaction in transactions:
+            fingerprint = _fingerprint(transaction)
+            previous = seen.get(transaction.entry_reference)
+            if previous is None or previous[0] != fingerprint:
+                changed.append(transaction)
+            booking_date = transaction.booking_date
+            seen[transaction.entry_reference] = [
+                fingerprint, booking_date.isoformat() if booking_date is not None else None
+            ]
+            if booking_date is not None and (watermark is None or booking_date > watermark):
+                watermark = booking_date
+
+        if watermark is not None:
+            # transactions booked before the next overlap are never listed again
+            horizon = (watermark - self._overlap).date()
+            seen = {
+                reference: entry for reference, entry in seen.items()
+                if entry[1] is None or _parse(entry[1]).date() >= horizon
+            }
+        if self._store is not None and changed:
+            self._store.add(account_number, currency_code, changed)
+        with self._lock:
+            self._state[key] = {
+                "watermark": watermark.isoformat() if watermark is not None else None,
+                "seen": seen,
+            }
+            self._save()
+        return changed
+
+    def watermark(self, account_number: str, currency_code: str) -> Optional[datetime.datetime]:
+        """Return the latest booking date synced for the account, if any."""
+        with self._lock:
+            state = self._state.get(_key(account_number, currency_code))
+        return _parse(state["watermark"]) if state is not None else None
+
+    def reset(self, account_number: str, currency_code: str) -> None:
+        """Forget the account, so that its next sync lists the whole history."""
+        with self._lock:
+            self._state.pop(_key(account_number, currency_code), None)
+            self._save()
+
+    # -- private helpers -----------------------------------------------------
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self._path is None:
+            return {}
+        try:
+            with open(self._path, "rb") as fh:
+                return json.loads(fh.read().decode("utf-8"))
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            logger.error("Ignoring corrupted transaction sync state %s", self._path)
+            return {}
+
+    def _save(self) -> None:
+        if self._path is None:
+            return
+        directory = os.path.dirname(os.path.abspath(self._path))
+        fd, tmp_filename = tempfile.mkstemp(dir=directory, prefix=".transaction_sync.")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(json.dumps(self._state, separators=(",", ":")).encode("utf-8"))
+            os.replace(tmp_filename, self._path)
+        except BaseException:
+            os.unlink(tmp_filename)
+            raise
+
+
+def _key(account_number: str, currency_code: str) -> str:
+    return f"{account_number}/{currency_code.upper()}"
+
+
+def _parse(value: Optional[str]) -> Optional[datetime.datetime]:
+    return datetime.datetime.fromisoformat(value) if value is not None else None
+
+
+def _fingerprint(transaction: "GetTransactionList200ResponseTransactionsInner") -> str:
+    data = transaction.model_dump(mode="json")
+    return hashlib.sha1(json.dumps(data, sort_keys=True).encode("utf-8")).hexdigest()
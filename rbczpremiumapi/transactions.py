@@ -0,0 +1,304 @@
+# coding: utf-8
+
+"""
+Iterating over all transactions of an account.
+
+The transaction list is paged and each page is only known to be the last
+one once it arrives.  :func:`iter_transactions` therefore requests the
+following pages speculatively while the caller consumes the current one::
+
+    api = GetTransactionListApi(api_client)
+    for transaction in iter_transactions(api, client_id, account, "CZK",
+                                         date_from, date_to, prefetch=3):
+        ...
+
+At most *prefetch* pages are in flight ahead of the one being read, and
+never more than the per-second limit of the rate limiter allows; every
+request still goes through the limiter of the :class:`ApiClient`.  Once
+the last page arrives, pages requested past it are discarded.
+
+Long ranges are better served by :func:`get_transaction_history`, which
+splits the range into windows (:func:`split_range`), lists them
+concurrently and merges the transactions in booking order::
+
+    transactions = get_transaction_history(api, client_id, account, "CZK",
+                                           date(2024, 1, 1), date(2024, 3, 31))
+
+:func:`stream_transactions` skips the models altogether: it decodes each
+page while it is being received and yields the raw JSON objects, keeping
+memory flat however large the pages are.
+"""
+
+import datetime
+import uuid
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Deque, Dict, Iterator, List, Optional, Tuple, Union
+
+from rbczpremiumapi.json_stream import JsonArrayStream
+from rbczpremiumapi.PremiumAPI.get_transaction_list_api import GetTransactionListApi
+from rbczpremiumapi.rest import RESTResponse
+
+if TYPE_CHECKING:
+    from rbczpremiumapi.Model.get_transaction_list200_response import GetTransactionList200Response
+    from rbczpremiumapi.Model.get_transaction_list200_response_transactions_inner import (
+        GetTransactionList200ResponseTransactionsInner,
+    )
+
+
+# The bank lists at most 90 days of history.
+MAX_WINDOW = datetime.timedelta(days=90)
+
+# Windows listed at once without a rate limiter to follow.
+_DEFAULT_WORKERS = 10
+
+
+def iter_transactions(
+    api: GetTransactionListApi,
+    x_ibm_client_id: str,
+    account_number: str,
+    currency_code: str,
+    var_from: Any,
+    to: Any,
+    prefetch: int = 2,
+    psu_ip_address: Optional[str] = None,
+    x_request_id: Optional[str] = None,
+    **kwargs: Any,
+) -> Iterator["GetTransactionList200ResponseTransactionsInner"]:
+    """Yield the transactions of all pages between *var_from* and *to*.
+
+    :param api: API the pages are requested through
+    :param x_ibm_client_id: ClientID obtained from the Developer Portal
+    :param account_number: account number in national format
+    :param currency_code: ISO-4217 currency code of the account
+    :param var_from: date (and optionally time) transactions are listed from
+    :param to: date (and optionally time) transactions are listed until
+    :param prefetch: number of pages requested ahead of the one being
+        read; ``0`` requests each page after the previous one was read
+    :param psu_ip_address: IP address of the end user, if any
+    :param x_request_id: request id of the iteration; page *n* is requested
+        as ``"<x_request_id>-<n>"``.  A UUID per page by default.
+    :param kwargs: passed on to :meth:`GetTransactionListApi.get_transaction_list`
+    """
+    if prefetch < 0:
+        raise ValueError("prefetch must not be negative")
+
+    def fetch(page: int) -> Optional["GetTransactionList200Response"]:
+        request_id = f"{x_request_id}-{page}" if x_request_id else str(uuid.uuid4())
+        return api.get_transaction_list(
+            x_ibm_client_id, request_id, account_number, currency_code, var_from, to,
+            psu_ip_address=psu_ip_address, page=page, **kwargs
+        )
+
+    prefetch = min(prefetch, _second_limit(api) - 1)
+    if prefetch <= 0:
+        page = 1
+        while True:
+            response = fetch(page)
+            yield from _transactions(response)
+            if _is_last(response):
+                return
+            page += 1
+
+    executor = ThreadPoolExecutor(
+        max_workers=prefetch + 1, thread_name_prefix="rbczpremiumapi-transactions"
+    )
+    pending: Deque[Future] = deque()
+    next_page = 1
+    try:
+        while True:
+            # keep the current page and *prefetch* following ones in flight
+            while len(pending) <= prefetch:
+                pending.append(executor.submit(fetch, next_page))
+                next_page += 1
+            response = pending.popleft().result()
+            if _is_last(response):
+                yield from _transactions(response)
+                return
+            pending.append(executor.submit(fetch, next_page))
+            next_page += 1
+            yield from _transactions(response)
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def stream_transactions(
+    api: GetTransactionListApi,
+    x_ibm_client_id: str,
+    account_number: str,
+    currency_code: str,
+    var_from: Any,
+    to: Any,
+    psu_ip_address: Optional[str] = None,
+    x_request_id: Optional[str] = None,
+    chunk_size: int = 64 * 1024,
+    **kwargs: Any,
+) -> Iterator[Dict[str, Any]]:
+    """Yield the transactions of all pages as decoded JSON objects.
+
+    Each page is read from the connection in *chunk_size* pieces and its
+    transactions are yielded as soon as they are decoded; keys are the
+    camelCase names of the API (``entryReference``, ``amount``, ...).
+    Feed them to :meth:`TransactionFrame.from_records` for analysis.
+
+    The other parameters are those of :func:`iter_transactions`.
+    """
+    operation = GetTransactionListApi._get_transaction_list_operation
+    page = 1
+    while True:
+        request_id = f"{x_request_id}-{page}" if x_request_id else str(uuid.uuid4())
+        response = api.get_transaction_list(
+            x_ibm_client_id, request_id, account_number, currency_code, var_from, to,
+            psu_ip_address=psu_ip_address, page=page, _preload_content=False, **kwargs
+        )
+        complete = False
+        try:
+            if not 200 <= response.status <= 299:
+                # read the error body and raise it like a preloaded call
+                error = RESTResponse(response)
+                error.read()
+                api.api_client.response_deserialize(error, operation.response_types_map)
+            if response.status == 204:
+                complete = True
+                return
+            stream = JsonArrayStream(response, "transactions", chunk_size)
+            count = 0
+            for transaction in stream:
+                count += 1
+                yield transaction
+            complete = True
+            if stream.members.get("lastPage") or count == 0:
+                return
+        finally:
+            if complete:
+                response.drain_conn()
+                response.release_conn()
+            else:
+                # a partly read connection cannot be reused
+                response.close()
+        page += 1
+
+
+def split_range(
+    var_from: Union[datetime.date, datetime.datetime],
+    to: Union[datetime.date, datetime.datetime],
+    window: datetime.timedelta = datetime.timedelta(days=7),
+) -> List[Tuple[Any, Any]]:
+    """Split the range from *var_from* to *to* into consecutive windows.
+
+    Dates are inclusive on both ends (as in the API), so date windows do
+    not overlap.  Datetime windows share their boundaries; transactions
+    listed twice are dropped by :func:`get_transaction_history`.  No
+    window is longer than :data:`MAX_WINDOW`.
+    """
+    if isinstance(var_from, datetime.datetime) != isinstance(to, datetime.datetime):
+        raise ValueError("var_from and to must both be dates or both datetimes")
+    if var_from > to:
+        raise ValueError("var_from must not be after to")
+    window = min(window, MAX_WINDOW)
+
+    windows = []
+    if isinstance(var_from, datetime.datetime):
+        if window <= datetime.timedelta(0):
+            raise ValueError("window must be positive")
+        start = var_from
+        while True:
+            end = min(start + window, to)
+            windows.append((start, end))
+            if end >= to:
+                return windows
+            start = end
+
+    if window.days < 1:
+        raise ValueError("window must be at least one day for dates")
+    start = var_from
+    while start <= to:
+        end = min(start + datetime.timedelta(days=window.days - 1), to)
+        windows.append((start, end))
+        start = end + datetime.timedelta(days=1)
+    return windows
+
+
+def get_transaction_history(
+    api: GetTransactionListApi,
+    x_ibm_client_id: str,
+    account_number: str,
+    currency_code: str,
+    var_from: Union[datetime.date, datetime.datetime],
+    to: Union[datetime.date, datetime.datetime],
+    window: datetime.timedelta = datetime.timedelta(days=7),
+    max_workers: Optional[int] = None,
+    psu_ip_address: Optional[str] = None,
+    x_request_id: Optional[str] = None,
+    **kwargs: Any,
+) -> List["GetTransactionList200ResponseTransactionsInner"]:
+    """Return the transactions between *var_from* and *to* in booking order.
+
+    The range is split by :func:`split_range` and the windows are listed
+    concurrently; each transaction is returned once (by
+    ``entry_reference``), transactions without a booking date last.
+
+    :param window: length of the windows listed concurrently
+    :param max_workers: number of windows listed at once, by default the
+        per-second limit of the rate limiter
+    :param x_request_id: request id of the listing; page *p* of window *w*
+        is requested as ``"<x_request_id>-<w>-<p>"``.  A UUID per page by
+        default.
+
+    The other parameters are those of :func:`iter_transactions`.
+    """
+    windows = split_range(var_from, to, window)
+
+    def fetch(index: int) -> List["GetTransactionList200ResponseTransactionsInner"]:
+        start, end = windows[index]
+        return list(iter_transactions(
+            api, x_ibm_client_id, account_number, currency_code, start, end,
+            prefetch=0, psu_ip_address=psu_ip_address,
+            x_request_id=f"{x_request_id}-{index + 1}" if x_request_id else None,
+            **kwargs
+        ))
+
+    if max_workers is None:
+        max_workers = min(_second_limit(api), _DEFAULT_WORKERS)
+    max_workers = max(1, min(max_workers, len(windows)))
+    if max_workers == 1:
+        pages = [fetch(index) for index in range(len(windows))]
+    else:
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="rbczpremiumapi-transactions"
+        ) as executor:
+            pages = list(executor.map(fetch, range(len(windows))))
+
+    unique: Dict[str, "GetTransactionList200ResponseTransactionsInner"] = {}
+    for transactions in pages:
+        for transaction in transactions:
+            unique.setdefault(transaction.entry_reference, transaction)
+    # sorted() is stable: equal booking dates keep the order of the listing
+    return sorted(
+        unique.values(),
+        key=lambda t: (t.booking_date is None, t.booking_date),
+    )
+
+
+def _second_limit(api: GetTransactionListApi) -> int:
+    """Return the requests per second the rate limiter allows, if any."""
+    limiter = api.api_client.configuration.rate_limiter
+    if limiter is None:
+        return 1 << 31
+    operation = GetTransactionListApi._get_transaction_list_operation.operation_id
+    return limiter.get_limits(operation)["second"]
+
+
+def _transactions(
+    response: Optional["GetTransactionList200Response"],
+) -> List["GetTransactionList200ResponseTransactionsInner"]:
+    if response is None:
+        return []
+    return response.transactions or []
+
+
+def _is_last(response: Optional["GetTransactionList200Response"]) -> bool:
+    # 204 No Content and empty pages end the listing as well
+    return response is None or bool(response.last_page) or not response.transactions
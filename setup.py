@@ -44,6 +44,12 @@ setup(
     url="https://github.com/Vitexus/python-rbczpremiumapi",
     keywords=["RBC", "Raiffeisen", "Bank", "API", "Premium", "OpenAPI", "mTLS", "PKCS12"],
     install_requires=REQUIRES,
+    extras_require={
+        "async": ["aiohttp >= 3.8.4"],
+        "fast-json": ["orjson >= 3.9"],
+        "frame": ["numpy >= 1.22"],
+        "msgspec": ["msgspec >= 0.18"],
+    },
     packages=find_packages(exclude=["test", "tests"]),
     include_package_data=True,
     long_description_content_type="text/markdown",
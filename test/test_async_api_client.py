@@ -0,0 +1,149 @@
+# coding: utf-8
+
+"""Tests for AsyncApiClient and the asyncio API variants."""
+
+import asyncio
+import inspect
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import test_utils, web
+
+from rbczpremiumapi.async_api import AsyncDownloadStatementApi, AsyncGetTransactionListApi
+from rbczpremiumapi.async_api_client import AsyncApiClient
+from rbczpremiumapi.configuration import Configuration
+from rbczpremiumapi.exceptions import ApiException
+from rbczpremiumapi.RateLimit.async_rate_limiter import AsyncRateLimiter
+from rbczpremiumapi.RateLimit.in_memory_rate_limit_store import InMemoryRateLimitStore
+from rbczpremiumapi.retry import RetryPolicy
+
+
+async def _statement(request):
+    body = await request.json()
+    return web.Response(
+        body=("statement-" + body["id"]).encode(),
+        content_type="application/pdf",
+        headers={"X-RateLimit-Remaining-Second": "3", "X-RateLimit-Remaining-Day": "1400"},
+    )
+
+
+_transaction_requests = []
+
+
+async def _transactions(request):
+    _transaction_requests.append(request.match_info["currency"])
+    if request.match_info["currency"] == "XXX":
+        return web.Response(status=500, text="boom")
+    if request.match_info["currency"] == "EUR":
+        return web.json_response({"lastPage": True, "transactions": [{
+            "entryReference": "1", "amount": {"value": 5.0, "currency": "EUR"},
+            "creditDebitIndication": "CRDT", "bankTransactionCode": {"code": "10000101000"},
+        }]})
+    return web.Response(status=204)
+
+
+def _run(coro_factory):
+    async def main():
+        app = web.Application()
+        app.router.add_post("/rbcz/premium/api/accounts/statements/download", _statement)
+        app.router.add_get(
+            "/rbcz/premium/api/accounts/{account}/{currency}/transactions", _transactions
+        )
+        server = test_utils.TestServer(app)
+        await server.start_server()
+        try:
+            config = Configuration(host=str(server.make_url("")).rstrip("/"))
+            config.retry_policy = RetryPolicy(backoff_base=0.01)
+            async with AsyncApiClient(config) as client:
+                return await coro_factory(client)
+        finally:
+            await server.close()
+
+    return asyncio.run(main())
+
+
+class TestAsyncApiClient:
+    def test_operations_are_coroutine_functions(self):
+        assert inspect.iscoroutinefunction(AsyncDownloadStatementApi.download_statement)
+        assert "account_number" in inspect.signature(
+            AsyncGetTransactionListApi.get_transaction_list
+        ).parameters
+
+    def test_no_shared_default_client(self):
+        with pytest.raises(TypeError):
+            AsyncApiClient.get_default()
+        with pytest.raises(TypeError):
+            AsyncGetTransactionListApi()
+
+    def test_sync_context_manager_is_rejected(self):
+        async def scenario(client):
+            with pytest.raises(TypeError, match="async with"):
+                with client:
+                    pass
+
+        _run(scenario)
+
+    def test_concurrent_requests(self):
+        async def scenario(client):
+            api = AsyncDownloadStatementApi(client)
+            return await asyncio.gather(*[
+                api.download_statement("cid", f"req-{i}", "cs", {"id": str(i)})
+                for i in range(20)
+            ])
+
+        results = _run(scenario)
+        assert results == [("statement-%d" % i).encode() for i in range(20)]
+
+    def test_empty_response(self):
+        async def scenario(client):
+            api = AsyncGetTransactionListApi(client)
+            return await api.get_transaction_list(
+                "cid", "req", "123", "CZK", "2024-01-01", "2024-01-31"
+            )
+
+        assert _run(scenario) is None
+
+    def test_records(self):
+        async def scenario(client):
+            api = AsyncGetTransactionListApi(client)
+            return await api.get_transaction_list(
+                "cid", "req", "123", "EUR", "2024-01-01", "2024-01-31", _response_mode="records"
+            )
+
+        page = _run(scenario)
+        assert type(page).__name__ == "GetTransactionList200ResponseRecord"
+        assert page.transactions[0].amount.value == 5.0
+
+    def test_error_status_raises(self):
+        async def scenario(client):
+            api = AsyncGetTransactionListApi(client)
+            return await api.get_transaction_list(
+                "cid", "req", "123", "XXX", "2024-01-01", "2024-01-31"
+            )
+
+        with pytest.raises(ApiException):
+            _run(scenario)
+
+    def test_async_rate_limiter(self):
+        store = InMemoryRateLimitStore()
+
+        async def scenario(client):
+            client.configuration.rate_limiter = AsyncRateLimiter(store)
+            api = AsyncDownloadStatementApi(client)
+            return await api.download_statement("cid", "req", "cs", {"id": "1"})
+
+        assert _run(scenario) == b"statement-1"
+        assert store.get("cid", "day", operation="downloadStatement")["remaining"] == 1400
+
+    def test_server_error_on_get_is_retried(self):
+        async def scenario(client):
+            api = AsyncGetTransactionListApi(client)
+            return await api.get_transaction_list(
+                "cid", "req", "123", "XXX", "2024-01-01", "2024-01-31"
+            )
+
+        _transaction_requests.clear()
+        with pytest.raises(ApiException):
+            _run(scenario)
+        assert _transaction_requests == ["XXX"] * 4
@@ -0,0 +1,79 @@
+# coding: utf-8
+
+"""Tests for AsyncRateLimiter."""
+
+import asyncio
+import time
+
+import pytest
+
+from rbczpremiumapi.RateLimit.async_rate_limiter import AsyncRateLimiter
+from rbczpremiumapi.RateLimit.in_memory_rate_limit_store import InMemoryRateLimitStore
+from rbczpremiumapi.RateLimit.json_rate_limit_store import JsonRateLimitStore
+from rbczpremiumapi.RateLimit.rate_limit_exceeded_exception import RateLimitExceededException
+
+
+def _exhausted_second(store, age):
+    store.set("client", "second", 0, int((time.time() - age) * 1000), operation="getBalance")
+
+
+class TestAsyncRateLimiter:
+    def test_waiting_does_not_block_the_loop(self):
+        store = InMemoryRateLimitStore()
+        _exhausted_second(store, 0.8)
+        limiter = AsyncRateLimiter(store)
+        ticks = []
+
+        async def ticker():
+            for _ in range(5):
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.02)
+
+        async def main():
+            start = time.monotonic()
+            await asyncio.gather(limiter.acquire("client", "getBalance"), ticker())
+            return time.monotonic() - start
+
+        elapsed = asyncio.run(main())
+        assert 0.1 < elapsed < 0.5
+        assert len(ticks) == 5
+
+    def test_waiters_are_woken_in_fifo_order(self):
+        store = InMemoryRateLimitStore()
+        _exhausted_second(store, 0.9)
+        limiter = AsyncRateLimiter(store)
+        order = []
+
+        async def caller(n):
+            await limiter.acquire("client", "getBalance")
+            order.append(n)
+
+        async def main():
+            tasks = []
+            for n in range(5):
+                tasks.append(asyncio.create_task(caller(n)))
+                await asyncio.sleep(0)
+            await asyncio.gather(*tasks)
+
+        asyncio.run(main())
+        assert order == [0, 1, 2, 3, 4]
+
+    def test_day_window_raises_without_wait_mode(self):
+        store = InMemoryRateLimitStore()
+        store.set("client", "day", 0, int(time.time() * 1000), operation="getBalance")
+        limiter = AsyncRateLimiter(store, wait_mode=False)
+        with pytest.raises(RateLimitExceededException):
+            asyncio.run(limiter.acquire("client", "getBalance"))
+
+    def test_headers_update_offloaded_store(self, tmp_path):
+        store = JsonRateLimitStore(str(tmp_path / "limits.json"))
+        limiter = AsyncRateLimiter(store)
+
+        async def main():
+            await limiter.acquire("client", "getBalance")
+            await limiter.handle_response_headers(
+                "client", {"X-RateLimit-Remaining-Second": "7"}, "getBalance"
+            )
+
+        asyncio.run(main())
+        assert store.get("client", "second", operation="getBalance")["remaining"] == 7
@@ -0,0 +1,91 @@
+# coding: utf-8
+
+"""Tests for get_all_balances."""
+
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from rbczpremiumapi.balances import get_all_balances
+from rbczpremiumapi.exceptions import ApiException
+
+
+class FakeBank:
+    """Answers getAccounts and getBalance calls made through call_operation."""
+
+    def __init__(self, accounts, page_size=2, delay=0.0, failing=()):
+        self.accounts = accounts
+        self.page_size = page_size
+        self.delay = delay
+        self.failing = failing
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self.api_client = MagicMock()
+        self.api_client.configuration.rate_limiter = None
+        self.api_client.call_operation.side_effect = self.call_operation
+
+    def call_operation(self, operation, path_params, query_params, header_params, body):
+        with self._lock:
+            self.calls.append((operation.operation_id, header_params["X-Request-Id"]))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+
+        if operation.operation_id == "getAccounts":
+            page = query_params["page"]
+            start = (page - 1) * self.page_size
+            return SimpleNamespace(
+                accounts=[SimpleNamespace(account_number=number)
+                          for number in self.accounts[start:start + self.page_size]],
+                total_pages=-(-len(self.accounts) // self.page_size),
+            )
+
+        number = path_params["accountNumber"]
+        if number in self.failing:
+            raise ApiException(status=403, reason="Forbidden")
+        return SimpleNamespace(currency_folders=[
+            SimpleNamespace(currency="CZK", balances=[
+                SimpleNamespace(balance_type="CLBD", value=float(number)),
+                SimpleNamespace(balance_type="CLAV", value=float(number) + 0.5),
+            ]),
+            SimpleNamespace(currency="EUR", balances=[
+                SimpleNamespace(balance_type="CLBD", value=1.0),
+            ]),
+        ])
+
+
+class TestGetAllBalances:
+    def test_snapshot_of_all_pages(self):
+        bank = FakeBank(["1", "2", "3", "4", "5"])
+        snapshot = get_all_balances(bank.api_client, "cid")
+        assert list(snapshot) == ["1", "2", "3", "4", "5"]
+        assert snapshot["3"] == {"CZK": {"CLBD": 3.0, "CLAV": 3.5}, "EUR": {"CLBD": 1.0}}
+        operations = [operation for operation, _ in bank.calls]
+        assert operations.count("getAccounts") == 3
+        assert operations.count("getBalance") == 5
+
+    def test_balances_are_fetched_concurrently(self):
+        bank = FakeBank([str(n) for n in range(12)], page_size=15, delay=0.05)
+        get_all_balances(bank.api_client, "cid", max_workers=4)
+        assert bank.max_in_flight == 4
+
+    def test_no_accounts(self):
+        bank = FakeBank([])
+        assert get_all_balances(bank.api_client, "cid") == {}
+
+    def test_request_ids(self):
+        bank = FakeBank(["7"])
+        get_all_balances(bank.api_client, "cid", x_request_id="snap")
+        assert sorted(request_id for _, request_id in bank.calls) == ["snap-7", "snap-accounts-1"]
+
+    def test_failure_is_raised(self):
+        bank = FakeBank(["1", "2", "3"], failing=("2",))
+        with pytest.raises(ApiException):
+            get_all_balances(bank.api_client, "cid")
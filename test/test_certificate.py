@@ -0,0 +1,114 @@
+# coding: utf-8
+
+"""Tests for in-memory PKCS#12 SSL contexts."""
+
+import copy
+import os
+import ssl
+
+import pytest
+
+pytest.importorskip("cryptography")
+
+from rbczpremiumapi.api_client import ApiClient
+from rbczpremiumapi.certificate import clear_ssl_context_cache, create_ssl_context_from_p12, load_p12
+from rbczpremiumapi.configuration import Configuration
+
+CERT_FILE = os.path.join(os.path.dirname(__file__), "..", "examples", "test_cert.p12")
+CERT_PASS = "Test12345678"
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    clear_ssl_context_cache()
+    yield
+    clear_ssl_context_cache()
+
+
+class TestCertificate:
+    def test_create_ssl_context(self):
+        context, fingerprint = create_ssl_context_from_p12(CERT_FILE, CERT_PASS)
+        assert isinstance(context, ssl.SSLContext)
+        assert len(fingerprint) == 40
+
+    def test_certificate_is_cached(self):
+        assert load_p12(CERT_FILE, CERT_PASS) is load_p12(CERT_FILE, CERT_PASS)
+        first, fp1 = create_ssl_context_from_p12(CERT_FILE, CERT_PASS)
+        second, fp2 = create_ssl_context_from_p12(CERT_FILE, CERT_PASS)
+        assert first is not second
+        assert fp1 == fp2
+
+    def test_wrong_password(self):
+        with pytest.raises(ValueError):
+            create_ssl_context_from_p12(CERT_FILE, "wrong")
+
+    def test_missing_file(self):
+        with pytest.raises(FileNotFoundError):
+            create_ssl_context_from_p12("nonexistent_file.p12", CERT_PASS)
+
+    def test_configuration_from_p12(self):
+        config = Configuration.from_p12(CERT_FILE, CERT_PASS, host="https://api.rb.cz")
+        assert config.host == "https://api.rb.cz"
+        assert config.cert_fingerprint == config.client_certificate.fingerprint
+        assert config.cert_file is None
+        assert config.ssl_context is None
+
+        client = ApiClient(config)
+        context = client.rest_client.pool_manager.connection_pool_kw["ssl_context"]
+        assert isinstance(context, ssl.SSLContext)
+        assert context.verify_mode == ssl.CERT_REQUIRED
+
+    def test_configurations_share_certificate(self):
+        config1 = Configuration.from_p12(CERT_FILE, CERT_PASS)
+        config2 = Configuration.from_p12(CERT_FILE, CERT_PASS)
+        assert config1.client_certificate is config2.client_certificate
+
+    def test_deepcopy_keeps_certificate(self):
+        config = Configuration.from_p12(CERT_FILE, CERT_PASS)
+        assert copy.deepcopy(config).client_certificate is config.client_certificate
+
+
+def _contexts(*configurations):
+    return [
+        ApiClient(c).rest_client.pool_manager.connection_pool_kw["ssl_context"]
+        for c in configurations
+    ]
+
+
+class TestTlsSettingsPerConfiguration:
+    def test_mixed_settings(self, tmp_path):
+        ca_file = tmp_path / "ca.pem"
+        ca_file.write_bytes(load_p12(CERT_FILE, CERT_PASS).cert_pem)
+        default = Configuration.from_p12(CERT_FILE, CERT_PASS)
+        unverified = Configuration.from_p12(CERT_FILE, CERT_PASS)
+        unverified.verify_ssl = False
+        no_hostname = Configuration.from_p12(CERT_FILE, CERT_PASS)
+        no_hostname.assert_hostname = False
+        custom_ca = Configuration.from_p12(CERT_FILE, CERT_PASS, ssl_ca_cert=str(ca_file))
+
+        contexts = _contexts(default, unverified, no_hostname, custom_ca)
+        assert len({id(c) for c in contexts}) == 4
+        context, unverified_context, no_hostname_context, custom_ca_context = contexts
+        assert context.verify_mode == ssl.CERT_REQUIRED
+        assert context.check_hostname
+        assert unverified_context.verify_mode == ssl.CERT_NONE
+        assert not no_hostname_context.check_hostname
+        assert no_hostname_context.verify_mode == ssl.CERT_REQUIRED
+        # only the given CA file instead of the system certificates
+        ca_count = ca_file.read_bytes().count(b"-----BEGIN CERTIFICATE-----")
+        assert custom_ca_context.cert_store_stats()["x509"] == ca_count
+        # building the others left the first one alone
+        assert context.verify_mode == ssl.CERT_REQUIRED and context.check_hostname
+
+    def test_async_transport(self):
+        pytest.importorskip("aiohttp")
+        from rbczpremiumapi.async_rest import AsyncRESTClientObject
+
+        default = Configuration.from_p12(CERT_FILE, CERT_PASS)
+        unverified = Configuration.from_p12(CERT_FILE, CERT_PASS)
+        unverified.verify_ssl = False
+        context = AsyncRESTClientObject(default).ssl_context
+        unverified_context = AsyncRESTClientObject(unverified).ssl_context
+        assert context is not unverified_context
+        assert context.verify_mode == ssl.CERT_REQUIRED and context.check_hostname
+        assert unverified_context.verify_mode == ssl.CERT_NONE
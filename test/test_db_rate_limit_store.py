@@ -3,10 +3,13 @@
 """Tests for DbRateLimitStore."""
 
 import sqlite3
+import threading
+from unittest.mock import MagicMock
 
 import pytest
 
 from rbczpremiumapi.RateLimit.db_rate_limit_store import DbRateLimitStore
+from rbczpremiumapi.RateLimit.sql_dialect import SqliteDialect
 
 
 def _make_store() -> DbRateLimitStore:
@@ -66,3 +69,74 @@ class TestDbRateLimitStore:
         assert store.get("client1", "second")["remaining"] == 9
         assert store.get("client2", "second")["remaining"] == 7
         assert store.all_for_client("client1") != store.all_for_client("client2")
+
+    def test_operation_windows_are_independent(self):
+        store = _make_store()
+        store.set("client", "day", 4999, 1000)
+        store.set("client", "day", 1499, 1000, operation="downloadStatement")
+        assert store.get("client", "day")["remaining"] == 4999
+        assert store.get("client", "day", operation="downloadStatement")["remaining"] == 1499
+        assert set(store.all_for_client("client")) == {"day", "downloadStatement:day"}
+
+    def test_set_many_commits_once(self):
+        conn = MagicMock(wraps=sqlite3.connect(":memory:"))
+        store = DbRateLimitStore(conn, dialect=SqliteDialect())
+        conn.commit.reset_mock()
+        store.set_many("client", {"second": (9, 1000), "day": (4999, 1000)})
+        assert conn.commit.call_count == 1
+        assert store.get("client", "day") == {"remaining": 4999, "timestamp": 1000}
+
+    def test_sqlite_uses_wal(self, tmp_path):
+        conn = sqlite3.connect(str(tmp_path / "limits.db"))
+        DbRateLimitStore(conn)
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+
+    def test_connection_factory_one_connection_per_thread(self, tmp_path):
+        store = DbRateLimitStore.sqlite(str(tmp_path / "limits.db"))
+
+        def worker(n):
+            store.set_many(f"client{n}", {"second": (n, 1000), "day": (n, 1000)})
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert all(store.get(f"client{n}", "day")["remaining"] == n for n in range(20))
+
+    def test_close_closes_factory_connections(self, tmp_path):
+        opened = []
+
+        def factory():
+            conn = sqlite3.connect(str(tmp_path / "limits.db"), check_same_thread=False)
+            opened.append(conn)
+            return conn
+
+        store = DbRateLimitStore(connection_factory=factory)
+        thread = threading.Thread(target=store.set, args=("client", "day", 4999, 1000))
+        thread.start()
+        thread.join()
+        assert len(opened) == 2
+        store.close()
+        for conn in opened:
+            with pytest.raises(sqlite3.ProgrammingError):
+                conn.execute("SELECT 1")
+
+    def test_close_leaves_shared_connection_open(self):
+        conn = sqlite3.connect(":memory:")
+        DbRateLimitStore(conn).close()
+        assert conn.execute("SELECT 1").fetchone() == (1,)
+
+    def test_connection_in_transaction_is_not_tuned(self, tmp_path):
+        conn = sqlite3.connect(str(tmp_path / "limits.db"))
+        conn.execute("CREATE TABLE other (x INTEGER)")
+        conn.execute("INSERT INTO other VALUES (1)")
+        assert conn.in_transaction
+        store = DbRateLimitStore(conn)
+        store.set("client", "day", 4999, 1000)
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+
+    def test_requires_connection_or_factory(self):
+        with pytest.raises(ValueError):
+            DbRateLimitStore()
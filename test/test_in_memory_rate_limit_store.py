@@ -0,0 +1,30 @@
+# coding: utf-8
+
+"""Tests for InMemoryRateLimitStore."""
+
+from rbczpremiumapi.RateLimit.in_memory_rate_limit_store import InMemoryRateLimitStore
+
+
+class TestInMemoryRateLimitStore:
+    def test_get_returns_none_when_empty(self):
+        assert InMemoryRateLimitStore().get("client", "second") is None
+
+    def test_set_and_get(self):
+        store = InMemoryRateLimitStore()
+        store.set("client", "second", 9, 1000)
+        store.set("client", "second", 4, 1000, operation="downloadStatement")
+        assert store.get("client", "second") == {"remaining": 9, "timestamp": 1000}
+        assert store.get("client", "second", operation="downloadStatement") == {
+            "remaining": 4, "timestamp": 1000
+        }
+        assert set(store.all_for_client("client")) == {"second", "downloadStatement:second"}
+
+    def test_update(self):
+        store = InMemoryRateLimitStore()
+        store.set("client", "day", 10, 1000)
+        result = store.update(
+            "client", "day", lambda r: {"remaining": r["remaining"] - 1, "timestamp": r["timestamp"]}
+        )
+        assert result == {"remaining": 9, "timestamp": 1000}
+        assert store.update("client", "day", lambda r: None) is None
+        assert store.get("client", "day") == {"remaining": 9, "timestamp": 1000}
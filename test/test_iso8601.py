@@ -0,0 +1,45 @@
+# coding: utf-8
+
+"""Tests for the ISO 8601 parser."""
+
+import datetime
+
+import pytest
+from dateutil.parser import parse
+
+from rbczpremiumapi.iso8601 import parse_date, parse_datetime
+
+
+@pytest.mark.parametrize("string", [
+    "2024-01-05",
+    "2024-01-05T10:30",
+    "2024-01-05T10:30:15",
+    "2024-01-05T10:30:00.0+01:00",
+    "2024-01-05T10:30:00.123Z",
+    "2024-01-05T10:30:00.123456789-05:30",
+    "2024-01-05 10:30:00,5+0100",
+    "2024-07-01T00:00:00+02",
+    "2024-02-29T23:59:59.999999",
+])
+def test_same_as_dateutil(string):
+    expected = parse(string)
+    result = parse_datetime(string)
+    assert result == expected
+    assert result.utcoffset() == expected.utcoffset()
+    assert parse_date(string) == expected.date()
+
+
+def test_results_are_memoized():
+    assert parse_datetime("2024-01-06T08:00:00.0+01:00") is \
+        parse_datetime("2024-01-06T08:00:00.0+01:00")
+
+
+def test_other_formats_fall_back_to_dateutil():
+    assert parse_datetime("5 Jan 2024 10:30") == datetime.datetime(2024, 1, 5, 10, 30)
+    assert parse_date("20240105") == datetime.date(2024, 1, 5)
+
+
+@pytest.mark.parametrize("string", ["2024-13-01", "2024-01-05T25:00", "not a date", ""])
+def test_invalid(string):
+    with pytest.raises(ValueError):
+        parse_datetime(string)
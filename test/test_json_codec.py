@@ -0,0 +1,148 @@
+# coding: utf-8
+
+"""Tests for the pluggable JSON codecs."""
+
+import copy
+from unittest.mock import MagicMock
+
+import pytest
+
+from rbczpremiumapi.api_client import ApiClient
+from rbczpremiumapi.configuration import Configuration
+from rbczpremiumapi.exceptions import ApiException
+from rbczpremiumapi.json_codec import JsonCodec, MsgspecCodec, OrjsonCodec, default_codec
+from rbczpremiumapi.rest import RESTClientObject, RESTResponse
+
+
+def _codecs():
+    codecs = [JsonCodec()]
+    for codec in (OrjsonCodec, MsgspecCodec):
+        try:
+            codecs.append(codec())
+        except ImportError:
+            pass
+    return codecs
+
+
+DOCUMENT = {
+    "lastPage": True,
+    "transactions": [{
+        "entryReference": "1",
+        "amount": {"value": -1234.56, "currency": "CZK"},
+        "text": "Příliš žluťoučký kůň",
+        "bookingDate": "2024-01-05T10:30:00.0+01:00",
+        "tags": [1, None, False],
+    }],
+}
+
+
+class SpyCodec(JsonCodec):
+    def __init__(self):
+        self.decoded = []
+        self.encoded = []
+
+    def loads(self, data):
+        self.decoded.append(data)
+        return super().loads(data)
+
+    def dumps(self, obj):
+        self.encoded.append(obj)
+        return super().dumps(obj)
+
+
+def _response(status=200, data=b"", content_type="application/json"):
+    raw = MagicMock()
+    raw.status = status
+    raw.reason = "OK"
+    raw.data = data
+    raw.headers = {"content-type": content_type}
+    response = RESTResponse(raw)
+    response.read()
+    return response
+
+
+@pytest.mark.parametrize("codec", _codecs(), ids=lambda codec: codec.name)
+class TestCodecs:
+    def test_round_trip(self, codec):
+        encoded = codec.dumps(DOCUMENT)
+        assert isinstance(encoded, bytes)
+        assert codec.loads(encoded) == DOCUMENT
+        assert codec.loads(encoded.decode("utf-8")) == DOCUMENT
+
+    def test_invalid_document(self, codec):
+        with pytest.raises(ValueError):
+            codec.loads(b'{"transactions": [1,')
+
+
+class TestConfiguration:
+    def test_default_codec(self):
+        try:
+            import orjson  # noqa: F401
+        except ImportError:
+            pytest.skip("orjson is not installed")
+        assert isinstance(default_codec(), OrjsonCodec)
+        assert isinstance(Configuration().json_codec, OrjsonCodec)
+
+    def test_fallback_to_stdlib(self, monkeypatch):
+        import builtins
+        real_import = builtins.__import__
+
+        def no_fast_json(name, *args, **kwargs):
+            if name in ("orjson", "msgspec"):
+                raise ImportError(name)
+            return real_import(name, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "__import__", no_fast_json)
+        assert type(default_codec()) is JsonCodec
+        with pytest.raises(ImportError, match="pip install orjson"):
+            OrjsonCodec()
+
+    def test_fast_json_off_forces_stdlib(self, monkeypatch):
+        monkeypatch.setattr(OrjsonCodec, "__init__", lambda self: None)
+        assert type(default_codec(fast=False)) is JsonCodec
+        assert type(Configuration(fast_json=False).json_codec) is JsonCodec
+        assert isinstance(Configuration().json_codec, OrjsonCodec)
+
+    def test_deepcopy_shares_codec(self):
+        config = Configuration()
+        config.json_codec = SpyCodec()
+        assert copy.deepcopy(config).json_codec is config.json_codec
+
+
+class TestApiClient:
+    def _client(self):
+        config = Configuration(host="https://api.test")
+        config.json_codec = SpyCodec()
+        return ApiClient(config), config.json_codec
+
+    def test_json_decoded_from_bytes(self):
+        client, codec = self._client()
+        body = JsonCodec().dumps(DOCUMENT)
+        result = client.response_deserialize(_response(200, body), {"200": "object"})
+        assert result.data == DOCUMENT
+        assert codec.decoded == [body]
+
+    def test_other_charset_decoded_as_text(self):
+        client, codec = self._client()
+        body = '{"text": "žluťoučký"}'.encode("cp1250")
+        result = client.response_deserialize(
+            _response(200, body, "application/json; charset=cp1250"), {"200": "object"}
+        )
+        assert result.data == {"text": "žluťoučký"}
+        assert codec.decoded == ['{"text": "žluťoučký"}']
+
+    def test_error_body_keeps_text(self):
+        client, codec = self._client()
+        with pytest.raises(ApiException) as info:
+            client.response_deserialize(_response(400, b'{"error": "bad"}'), {"400": "object"})
+        assert info.value.body == '{"error": "bad"}'
+        assert info.value.data == {"error": "bad"}
+
+    def test_request_body_encoded_by_codec(self):
+        config = Configuration(host="https://api.test")
+        config.json_codec = SpyCodec()
+        rest_client = RESTClientObject(config)
+        rest_client.pool_manager = MagicMock()
+        rest_client.request("POST", "https://api.test/x", headers={}, body={"a": 1})
+        assert config.json_codec.encoded == [{"a": 1}]
+        assert rest_client.pool_manager.request.call_args.kwargs["body"] == b'{"a": 1}'
@@ -2,9 +2,11 @@
 
 """Tests for JsonRateLimitStore."""
 
+import fcntl
 import json
 import os
 import tempfile
+import threading
 
 import pytest
 
@@ -80,3 +82,79 @@ class TestJsonRateLimitStore:
         store = JsonRateLimitStore(path)
         assert store.get("client1", "second") == {"remaining": 5, "timestamp": 1714780000}
         assert store.get("client1", "day") == {"remaining": 3000, "timestamp": 1714780000}
+
+    def test_operation_windows_are_independent(self, tmp_path):
+        path = self._tmpfile(tmp_path)
+        store = JsonRateLimitStore(path)
+        store.set("client", "second", 9, 1000)
+        store.set("client", "second", 4, 1000, operation="downloadStatement")
+        assert store.get("client", "second") == {"remaining": 9, "timestamp": 1000}
+        assert store.get("client", "second", operation="downloadStatement") == {
+            "remaining": 4, "timestamp": 1000
+        }
+        assert store.get("client", "second", operation="getBalance") is None
+
+        with open(path) as f:
+            data = json.load(f)
+        assert set(data["client"]) == {"second", "downloadStatement:second"}
+
+    def test_set_many_writes_once(self, tmp_path, monkeypatch):
+        store = JsonRateLimitStore(self._tmpfile(tmp_path))
+        writes = []
+        real_dumps = json.dumps
+        monkeypatch.setattr(json, "dumps", lambda *a, **kw: (writes.append(a), real_dumps(*a, **kw))[1])
+        store.set_many("client", {"second": (9, 1000), "day": (4999, 1000)})
+        assert len(writes) == 1
+        assert store.get("client", "day") == {"remaining": 4999, "timestamp": 1000}
+
+    def test_writes_hold_lock_of_data_file(self, tmp_path):
+        """A writer holding the PHP store's lock, the data file's, is waited for."""
+        path = self._tmpfile(tmp_path)
+        store = JsonRateLimitStore(path)
+        store.set("client", "second", 9, 1000)
+        inode = os.stat(path).st_ino
+        done = threading.Event()
+        with open(path, "r+b") as fh:
+            fcntl.flock(fh, fcntl.LOCK_EX)
+            writer = threading.Thread(
+                target=lambda: (store.set("client", "second", 8, 1000), done.set())
+            )
+            writer.start()
+            assert not done.wait(0.2)
+            fh.seek(0)
+            fh.truncate()
+            fh.write(b'{"other": {"day": {"remaining": 5, "timestamp": 1000}}}')
+            fh.flush()
+            fcntl.flock(fh, fcntl.LOCK_UN)
+        writer.join(5)
+        assert done.is_set()
+        assert os.stat(path).st_ino == inode
+        with open(path) as f:
+            assert json.load(f) == {
+                "other": {"day": {"remaining": 5, "timestamp": 1000}},
+                "client": {"second": {"remaining": 8, "timestamp": 1000}},
+            }
+
+    def test_concurrent_writers_are_merged(self, tmp_path):
+        path = self._tmpfile(tmp_path)
+        store1 = JsonRateLimitStore(path)
+        store2 = JsonRateLimitStore(path)
+        store1.set("client1", "second", 9, 1000)
+        store2.set("client2", "second", 7, 1000)
+        assert store1.get("client2", "second") == {"remaining": 7, "timestamp": 1000}
+        assert store2.get("client1", "second") == {"remaining": 9, "timestamp": 1000}
+
+    def test_unchanged_file_is_not_reparsed(self, tmp_path, monkeypatch):
+        path = self._tmpfile(tmp_path)
+        store = JsonRateLimitStore(path)
+        store.set("client", "second", 9, 1000)
+        loads = []
+        real_loads = json.loads
+        monkeypatch.setattr(json, "loads", lambda raw: (loads.append(raw), real_loads(raw))[1])
+        store.get("client", "second")
+        store.get("client", "day")
+        assert loads == []
+        JsonRateLimitStore(path).set("client", "day", 4999, 1000)
+        assert store.get("client", "day") == {"remaining": 4999, "timestamp": 1000}
+        # the new instance on creation and under the write lock, then store
+        assert len(loads) == 3
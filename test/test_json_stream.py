@@ -0,0 +1,79 @@
+# coding: utf-8
+
+"""Tests for JsonArrayStream."""
+
+import io
+import json
+
+import pytest
+
+from rbczpremiumapi.json_stream import JsonArrayStream
+
+
+def _stream(document, chunk_size=7, key="transactions"):
+    body = document if isinstance(document, bytes) else json.dumps(document).encode("utf-8")
+    return JsonArrayStream(io.BytesIO(body), key, chunk_size=chunk_size)
+
+
+class TestJsonArrayStream:
+    @pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 1 << 16])
+    def test_items_and_members(self, chunk_size):
+        document = {
+            "lastPage": False,
+            "transactions": [
+                {"entryReference": "1", "amount": {"value": 12345.678, "currency": "CZK"}},
+                {"entryReference": "2", "text": "Příliš žluťoučký kůň \"úpěl\""},
+                [1, 2, 3],
+                123456789,
+                None,
+            ],
+            "pageNumber": 3,
+        }
+        stream = _stream(document, chunk_size)
+        assert list(stream) == document["transactions"]
+        assert stream.members == {"lastPage": False, "pageNumber": 3}
+
+    def test_whitespace(self):
+        body = b' {\n "transactions" : [ {"a" : 1} ,\n\t{"b": 2} ] ,\r\n "lastPage" : true } '
+        stream = _stream(body, chunk_size=3)
+        assert list(stream) == [{"a": 1}, {"b": 2}]
+        assert stream.members == {"lastPage": True}
+
+    def test_empty(self):
+        assert list(_stream({})) == []
+        stream = _stream({"transactions": [], "lastPage": True})
+        assert list(stream) == []
+        assert stream.members == {"lastPage": True}
+
+    def test_key_missing_or_not_an_array(self):
+        stream = _stream({"transactions": None, "other": [1]})
+        assert list(stream) == []
+        assert stream.members == {"transactions": None, "other": [1]}
+
+    def test_items_are_yielded_before_the_end(self):
+        body = b'{"transactions": [{"a": 1}, {"b": 2}, {"c": '
+        items = iter(_stream(body, chunk_size=4))
+        assert next(items) == {"a": 1}
+        assert next(items) == {"b": 2}
+        with pytest.raises(ValueError):
+            next(items)
+
+    @pytest.mark.parametrize("body", [
+        b'[1, 2]',
+        b'{"transactions": [1 2]}',
+        b'{"transactions": [1, 2]',
+        b'{1: 2}',
+        b'',
+    ])
+    def test_malformed(self, body):
+        with pytest.raises(ValueError):
+            list(_stream(body))
+
+    def test_buffer_stays_small(self):
+        document = {"transactions": [{"entryReference": str(n), "pad": "x" * 50}
+                                     for n in range(5000)]}
+        stream = _stream(document, chunk_size=1024)
+        largest = 0
+        for _ in stream:
+            largest = max(largest, len(stream._buffer))
+        assert largest < 2 * 1024
@@ -0,0 +1,115 @@
+# coding: utf-8
+
+"""Tests for the lazily validated nested models."""
+
+import copy
+import datetime
+import json
+import os
+import pickle
+from unittest.mock import MagicMock
+
+import pytest
+from pydantic import ValidationError
+
+from rbczpremiumapi.api_client import ApiClient
+from rbczpremiumapi.configuration import Configuration
+from rbczpremiumapi.lazy import LazyModel, has_lazy_fields, lazy_converter, materialize
+from rbczpremiumapi.Model import (
+    GetAccounts200Response,
+    GetTransactionList200Response,
+    GetTransactionList200ResponseTransactionsInner,
+    GetTransactionList200ResponseTransactionsInnerEntryDetails,
+)
+from rbczpremiumapi.PremiumAPI.get_transaction_list_api import GetTransactionListApi
+from rbczpremiumapi.rest import RESTResponse
+
+PAYLOADS = os.path.join(os.path.dirname(__file__), os.pardir, "benchmarks", "payloads")
+
+with open(os.path.join(PAYLOADS, "transaction.json"), encoding="utf-8") as f:
+    TRANSACTION = json.load(f)
+
+PAGE = {"lastPage": True, "transactions": [TRANSACTION, dict(TRANSACTION, entryReference="2")]}
+
+
+def _page():
+    return lazy_converter(GetTransactionList200Response)(json.loads(json.dumps(PAGE)))
+
+
+class TestLazyModel:
+    def test_validated_on_first_use(self):
+        transaction = _page().transactions[0]
+        entry_details = transaction.__dict__["entry_details"]
+        assert type(entry_details) is LazyModel
+        assert entry_details._value is None
+        assert transaction.amount.value == -1668.59
+        assert entry_details._value is None
+        details = transaction.entry_details.transaction_details
+        assert details.references.end_to_end_identification == "EBGTF015477198"
+        assert type(materialize(entry_details)) is \
+            GetTransactionList200ResponseTransactionsInnerEntryDetails
+
+    def test_behaves_like_the_model(self):
+        transaction, expected = _page().transactions[0], GetTransactionList200Response \
+            .model_validate(PAGE).transactions[0]
+        entry_details = transaction.entry_details
+        assert isinstance(entry_details, GetTransactionList200ResponseTransactionsInnerEntryDetails)
+        assert entry_details == expected.entry_details
+        assert dict(entry_details) == dict(expected.entry_details)
+        assert repr(entry_details) == repr(expected.entry_details)
+        assert copy.deepcopy(entry_details) == expected.entry_details
+        assert pickle.loads(pickle.dumps(transaction)) == expected
+        entry_details.transaction_details = None
+        assert entry_details.transaction_details is None
+
+    def test_serialized_like_the_model(self):
+        page, expected = _page(), GetTransactionList200Response.model_validate(PAGE)
+        assert page == expected
+        assert page.to_dict() == expected.to_dict()
+        assert page.to_json() == expected.to_json()
+        exclude = {"transactions": {0: {"entry_details": {"transaction_details": {"related_parties"}}}}}
+        assert page.model_dump(exclude=exclude) == expected.model_dump(exclude=exclude)
+
+    def test_errors_raised_on_first_use(self):
+        data = dict(TRANSACTION, entryDetails={"transactionDetails": {"references": "bad"}})
+        transaction = lazy_converter(GetTransactionList200ResponseTransactionsInner)(data)
+        with pytest.raises(ValidationError):
+            transaction.entry_details.transaction_details
+
+    def test_missing_and_null(self):
+        page = lazy_converter(GetTransactionList200Response)(
+            {"transactions": [dict(TRANSACTION, entryDetails=None), {
+                k: v for k, v in TRANSACTION.items() if k != "entryDetails"
+            }]}
+        )
+        assert page.transactions[0].entry_details is None
+        assert page.transactions[1].entry_details is None
+
+    def test_has_lazy_fields(self):
+        assert has_lazy_fields(GetTransactionList200Response)
+        assert not has_lazy_fields(GetTransactionList200ResponseTransactionsInnerEntryDetails)
+        assert not has_lazy_fields(GetAccounts200Response)
+
+
+def _get_transactions(**kwargs):
+    raw = MagicMock(status=200, reason="OK", data=json.dumps(PAGE).encode("utf-8"),
+                    headers={"content-type": "application/json"})
+    client = ApiClient(Configuration(host="https://api.test"))
+    client.rest_client = MagicMock()
+    client.rest_client.request.return_value = RESTResponse(raw)
+    return GetTransactionListApi(client).get_transaction_list(
+        "client-id", "req-1", "1234567890", "CZK",
+        datetime.date(2024, 1, 1), datetime.date(2024, 1, 31), **kwargs
+    )
+
+
+class TestResponseMode:
+    def test_lazy(self):
+        page = _get_transactions(_response_mode="lazy")
+        assert type(page.transactions[0].__dict__["entry_details"]) is LazyModel
+        assert page == GetTransactionList200Response.model_validate(PAGE)
+
+    def test_models_by_default(self):
+        page = _get_transactions()
+        assert type(page.transactions[0].entry_details) is \
+            GetTransactionList200ResponseTransactionsInnerEntryDetails
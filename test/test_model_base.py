@@ -0,0 +1,107 @@
+# coding: utf-8
+
+"""Tests for the camelCase model base."""
+
+import datetime
+import json
+import os
+from unittest.mock import MagicMock
+
+import pytest
+from pydantic import ValidationError
+
+from rbczpremiumapi.api_client import ApiClient
+from rbczpremiumapi.configuration import Configuration
+from rbczpremiumapi.json_codec import JsonCodec
+from rbczpremiumapi.Model import (
+    ExchangeRateList,
+    GetBalance401Response,
+    GetTransactionList200Response,
+    GetTransactionList200ResponseTransactionsInnerAmount,
+)
+from rbczpremiumapi.rest import RESTResponse
+
+PAYLOADS = os.path.join(os.path.dirname(__file__), os.pardir, "benchmarks", "payloads")
+
+
+def _payload(name):
+    with open(os.path.join(PAYLOADS, name), "rb") as f:
+        return f.read()
+
+
+PAGE = json.dumps({
+    "lastPage": True,
+    "transactions": [json.loads(_payload("transaction.json"))],
+}).encode("utf-8")
+
+
+class TestApiModel:
+    def test_from_json(self):
+        page = GetTransactionList200Response.from_json(PAGE)
+        assert page.last_page is True
+        transaction = page.transactions[0]
+        assert transaction.entry_reference == "3887196517"
+        assert transaction.credit_debit_indication == "DBIT"
+        assert transaction.booking_date == datetime.datetime(
+            2024, 1, 5, 10, 30, tzinfo=datetime.timezone(datetime.timedelta(hours=1))
+        )
+        details = transaction.entry_details.transaction_details
+        assert details.related_parties.counter_party.account.iban == "CZ0801000000192000145399"
+        assert details.remittance_information.creditor_reference_information.variable == "1234567890"
+
+    def test_from_dict_matches_from_json(self):
+        assert GetTransactionList200Response.from_dict(json.loads(PAGE)) == \
+            GetTransactionList200Response.from_json(PAGE)
+        assert GetTransactionList200Response.from_dict(None) is None
+
+    def test_fx_rates(self):
+        rates = ExchangeRateList.from_json(_payload("fx_rates.json"))
+        assert rates.exchange_rates[0].currency_from == "EUR"
+        assert rates.exchange_rates[0].exchange_rate_ecb_rate is None
+
+    def test_field_names_accepted(self):
+        amount = GetTransactionList200ResponseTransactionsInnerAmount(value=1.5, currency="CZK")
+        assert amount.to_dict() == {"value": 1.5, "currency": "CZK"}
+
+    def test_to_dict_uses_json_names(self):
+        data = GetTransactionList200Response.from_json(PAGE).to_dict()
+        transaction = data["transactions"][0]
+        assert transaction["entryReference"] == "3887196517"
+        assert transaction["bankTransactionCode"] == {"code": "10000401000"}
+        assert "entryDetails" in transaction and "entry_details" not in transaction
+        document = json.loads(GetTransactionList200Response.from_json(PAGE).to_json())
+        assert document["transactions"][0]["bookingDate"] == "2024-01-05T10:30:00+01:00"
+
+    def test_alias_not_camel_case(self):
+        error = GetBalance401Response.from_json(b'{"error": "x", "error_description": "y"}')
+        assert error.error_description == "y"
+        assert error.to_dict() == {"error": "x", "error_description": "y"}
+
+    def test_invalid_document(self):
+        with pytest.raises(ValidationError):
+            GetTransactionList200Response.from_json(b'{"transactions": [{"amount": 1}]}')
+
+
+class TestApiClient:
+    def test_model_validated_from_bytes(self):
+        config = Configuration(host="https://api.test")
+        config.json_codec = MagicMock(wraps=JsonCodec())
+        raw = MagicMock(status=200, reason="OK", data=PAGE,
+                        headers={"content-type": "application/json"})
+        response = RESTResponse(raw)
+        response.read()
+        result = ApiClient(config).response_deserialize(
+            response, {"200": "GetTransactionList200Response"}
+        )
+        assert isinstance(result.data, GetTransactionList200Response)
+        assert result.data.transactions[0].amount.value == -1668.59
+        config.json_codec.loads.assert_not_called()
+
+    def test_model_in_list(self):
+        client = ApiClient(Configuration())
+        data = client.deserialize(
+            '[{"value": 2, "currency": "EUR"}]',
+            "List[GetTransactionList200ResponseTransactionsInnerAmount]",
+            "application/json",
+        )
+        assert data == [GetTransactionList200ResponseTransactionsInnerAmount(value=2, currency="EUR")]
@@ -31,3 +31,31 @@ class TestRateLimitStoreInterface:
         mock.all_for_client.return_value = []
         result = mock.all_for_client("client")
         assert isinstance(result, list)
+
+    def test_window_key(self):
+        assert RateLimitStoreInterface.window_key("second") == "second"
+        assert RateLimitStoreInterface.window_key("day", "getBalance") == "getBalance:day"
+
+    def test_default_records_methods_use_get_and_set(self):
+        class Store(RateLimitStoreInterface):
+            def __init__(self):
+                self.data = {}
+
+            def get(self, client_id, window, operation=None):
+                return self.data.get((client_id, self.window_key(window, operation)))
+
+            def set(self, client_id, window, remaining, timestamp, operation=None):
+                self.data[(client_id, self.window_key(window, operation))] = {
+                    "remaining": remaining, "timestamp": timestamp,
+                }
+
+            def all_for_client(self, client_id):
+                return []
+
+        store = Store()
+        store.set_records("c", {"second": (1, 2), "op:day": (3, 4)})
+        assert store.get("c", "day", operation="op") == {"remaining": 3, "timestamp": 4}
+        store.update_records(
+            "c", ["second"], lambda records: {"second": dict(records["second"], remaining=0)}
+        )
+        assert store.get("c", "second") == {"remaining": 0, "timestamp": 2}
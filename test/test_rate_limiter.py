@@ -2,14 +2,19 @@
 
 """Tests for RateLimiter."""
 
+import threading
 import time
 from unittest.mock import MagicMock
 
 import pytest
 
+from rbczpremiumapi.RateLimit.db_rate_limit_store import DbRateLimitStore
+from rbczpremiumapi.RateLimit.in_memory_rate_limit_store import InMemoryRateLimitStore
+from rbczpremiumapi.RateLimit.json_rate_limit_store import JsonRateLimitStore
 from rbczpremiumapi.RateLimit.rate_limiter import RateLimiter
 from rbczpremiumapi.RateLimit.rate_limit_exceeded_exception import RateLimitExceededException
 from rbczpremiumapi.RateLimit.rate_limit_store_interface import RateLimitStoreInterface
+from rbczpremiumapi.RateLimit.shared_memory_rate_limit_store import SharedMemoryRateLimitStore
 
 
 def _make_store() -> MagicMock:
@@ -25,14 +30,14 @@ class TestRateLimiter:
         limiter = RateLimiter(_make_store(), wait_mode=False)
         assert limiter.is_wait_mode() is False
 
-    def test_handle_rate_limits_calls_store_set(self):
+    def test_handle_rate_limits_calls_store_set_records(self):
         store = _make_store()
         limiter = RateLimiter(store)
         now = int(time.time())
         limiter.handle_rate_limits("client", 1, 2, now)
-        assert store.set.call_count == 2
-        store.set.assert_any_call("client", "second", 1, now)
-        store.set.assert_any_call("client", "day", 2, now)
+        store.set_records.assert_called_once_with(
+            "client", {"second": (1, now), "day": (2, now)}
+        )
 
     def test_check_before_request_does_not_throw(self):
         store = _make_store()
@@ -49,3 +54,186 @@ class TestRateLimiter:
         limiter = RateLimiter(store, wait_mode=False)
         with pytest.raises(RateLimitExceededException):
             limiter.check_before_request("client")
+
+    def test_handle_response_headers_updates_store(self):
+        store = _make_store()
+        limiter = RateLimiter(store)
+        headers = {"X-RateLimit-Remaining-Second": "7", "X-RateLimit-Remaining-Day": "4321"}
+        limiter.handle_response_headers("client", headers, "getBalance", timestamp=1000)
+        # the scoped records and the plain ones read by the PHP library, at once
+        store.set_records.assert_called_once_with("client", {
+            "getBalance:second": (7, 1000000),
+            "getBalance:day": (4321, 1000000),
+            "second": (7, 1000),
+            "day": (4321, 1000),
+        })
+
+    def test_operation_counts_reach_plain_records(self, tmp_path):
+        store = JsonRateLimitStore(str(tmp_path / "rate_limits.json"))
+        limiter = RateLimiter(store)
+        headers = {"X-RateLimit-Remaining-Second": "4", "X-RateLimit-Remaining-Day": "1499"}
+        limiter.handle_response_headers("client", headers, "downloadStatement", timestamp=1000)
+        assert store.get("client", "second") == {"remaining": 4, "timestamp": 1000}
+        assert store.get("client", "day") == {"remaining": 1499, "timestamp": 1000}
+        assert store.get("client", "second", operation="downloadStatement") == {
+            "remaining": 4, "timestamp": 1000000
+        }
+
+    def test_second_window_wait_is_sub_second(self, monkeypatch):
+        store = _make_store()
+        now = time.time()
+        store.get.side_effect = lambda cid, window, operation=None: {
+            "second": {"remaining": 0, "timestamp": int((now - 0.95) * 1000)},
+            "day": None,
+        }[window]
+        sleeps = []
+        monkeypatch.setattr(time, "sleep", sleeps.append)
+        RateLimiter(store).check_before_request("client", "getBalance")
+        assert len(sleeps) == 1
+        assert 0 < sleeps[0] <= 0.06
+
+    def test_requests_are_spaced(self, monkeypatch):
+        store = _make_store()
+        store.get.return_value = None
+        sleeps = []
+        monkeypatch.setattr(time, "sleep", sleeps.append)
+        limiter = RateLimiter(store, spacing=True)
+        limiter.check_before_request("client", "downloadStatement")
+        limiter.check_before_request("client", "downloadStatement")
+        assert len(sleeps) == 1
+        assert 0.15 < sleeps[0] <= 0.2
+
+    def test_check_before_request_reads_operation_windows(self):
+        store = _make_store()
+        store.get.return_value = None
+        limiter = RateLimiter(store)
+        limiter.check_before_request("client", "downloadStatement")
+        store.get.assert_any_call("client", "second", operation="downloadStatement")
+        store.get.assert_any_call("client", "day", operation="downloadStatement")
+
+    def test_exhausted_operation_does_not_block_others(self, tmp_path):
+        store = JsonRateLimitStore(str(tmp_path / "limits.json"))
+        limiter = RateLimiter(store, wait_mode=False)
+        limiter.handle_rate_limits("client", 5, 0, int(time.time()), "downloadStatement")
+        limiter.check_before_request("client", "getBalance")  # should not raise
+        with pytest.raises(RateLimitExceededException):
+            limiter.check_before_request("client", "downloadStatement")
+
+    def test_handle_response_headers_ignores_missing_and_malformed(self):
+        store = _make_store()
+        limiter = RateLimiter(store)
+        limiter.handle_response_headers("client", {"X-RateLimit-Remaining-Second": "n/a"})
+        store.set_many.assert_not_called()
+
+    def test_default_limits_per_operation(self):
+        limiter = RateLimiter(_make_store())
+        assert limiter.get_limits("getBalance") == {"second": 10, "day": 5000}
+        assert limiter.get_limits("downloadStatement") == {"second": 5, "day": 1500}
+
+    def test_limits_learned_from_headers(self):
+        limiter = RateLimiter(_make_store())
+        limiter.handle_response_headers(
+            "client", {"X-RateLimit-Limit-Second": "20"}, "getAccounts"
+        )
+        assert limiter.get_limits("getAccounts") == {"second": 20, "day": 5000}
+        assert limiter.get_limits("getBalance") == {"second": 10, "day": 5000}
+
+
+def _stores(tmp_path):
+    return [
+        InMemoryRateLimitStore(),
+        JsonRateLimitStore(str(tmp_path / "limits.json")),
+        DbRateLimitStore.sqlite(str(tmp_path / "limits.db")),
+        SharedMemoryRateLimitStore(str(tmp_path / "limits.shm")),
+    ]
+
+
+class TestAcquire:
+    def test_concurrent_acquire_never_overspends(self, tmp_path):
+        for store in _stores(tmp_path):
+            limiter = RateLimiter(store, wait_mode=False)
+            limiter.handle_rate_limits("client", 10, 3, time.time(), "getBalance")
+            outcomes = []
+
+            def worker():
+                try:
+                    limiter.acquire("client", "getBalance")
+                    outcomes.append(True)
+                except RateLimitExceededException:
+                    outcomes.append(False)
+
+            threads = [threading.Thread(target=worker) for _ in range(10)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            assert outcomes.count(True) == 3, type(store).__name__
+
+    def test_update_records_in_every_store(self, tmp_path):
+        for store in _stores(tmp_path):
+            name = type(store).__name__
+            store.set_records("client", {"second": (9, 1), "getBalance:day": (5, 2)})
+            assert store.get("client", "second") == {"remaining": 9, "timestamp": 1}, name
+            seen = []
+
+            def fn(records):
+                seen.append(records)
+                return {"second": {"remaining": 8, "timestamp": 3},
+                        "getBalance:second": {"remaining": 1, "timestamp": 4}}
+
+            store.update_records("client", ["second", "getBalance:day", "getBalance:second"], fn)
+            assert seen == [{
+                "second": {"remaining": 9, "timestamp": 1},
+                "getBalance:day": {"remaining": 5, "timestamp": 2},
+                "getBalance:second": None,
+            }], name
+            assert store.get("client", "second") == {"remaining": 8, "timestamp": 3}, name
+            assert store.get("client", "second", operation="getBalance") == {
+                "remaining": 1, "timestamp": 4
+            }, name
+            assert store.update_records("client", ["day"], lambda records: None) is None, name
+            assert store.get("client", "day") is None, name
+
+    def test_acquire_takes_nothing_unless_both_windows_have_room(self):
+        store = InMemoryRateLimitStore()
+        store.set("client", "day", 0, int(time.time() * 1000), operation="getBalance")
+        with pytest.raises(RateLimitExceededException):
+            RateLimiter(store, wait_mode=False).acquire("client", "getBalance")
+        assert store.get("client", "second", operation="getBalance") is None
+
+    def test_acquire_starts_fresh_window_from_limits(self):
+        store = InMemoryRateLimitStore()
+        RateLimiter(store).acquire("client", "downloadStatement", n=2)
+        assert store.get("client", "second", operation="downloadStatement")["remaining"] == 3
+        assert store.get("client", "day", operation="downloadStatement")["remaining"] == 1498
+
+    def test_headers_reconciled_with_requests_in_flight(self):
+        store = InMemoryRateLimitStore()
+        limiter = RateLimiter(store)
+        limiter.acquire("client", "getBalance")
+        limiter.acquire("client", "getBalance")
+        limiter.acquire("client", "getBalance")
+        limiter.handle_response_headers(
+            "client", {"X-RateLimit-Remaining-Second": "8"}, "getBalance"
+        )
+        # two requests are still on their way
+        assert store.get("client", "second", operation="getBalance")["remaining"] == 6
+        limiter.release("client", "getBalance", n=2)
+        limiter.handle_response_headers(
+            "client", {"X-RateLimit-Remaining-Second": "8"}, "getBalance"
+        )
+        assert store.get("client", "second", operation="getBalance")["remaining"] == 8
+
+    def test_acquire_waits_for_second_window(self, monkeypatch):
+        store = InMemoryRateLimitStore()
+        store.set("client", "second", 0, int((time.time() - 0.5) * 1000), operation="getBalance")
+        sleeps = []
+
+        def sleep(seconds):
+            sleeps.append(seconds)
+            store.set("client", "second", 10, 0, operation="getBalance")
+
+        monkeypatch.setattr(time, "sleep", sleep)
+        RateLimiter(store).acquire("client", "getBalance")
+        assert len(sleeps) == 1
+        assert 0.4 < sleeps[0] <= 0.5
@@ -0,0 +1,124 @@
+# coding: utf-8
+
+"""Tests for the read-only records."""
+
+import datetime
+import json
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from rbczpremiumapi.api_client import ApiClient
+from rbczpremiumapi.configuration import Configuration
+from rbczpremiumapi.exceptions import ApiException, ApiValueError
+from rbczpremiumapi.Model import (
+    GetTransactionList200Response,
+    GetTransactionList200ResponseTransactionsInner,
+)
+from rbczpremiumapi.PremiumAPI.download_statement_api import DownloadStatementApi
+from rbczpremiumapi.PremiumAPI.get_account_balance_api import GetAccountBalanceApi
+from rbczpremiumapi.PremiumAPI.get_transaction_list_api import GetTransactionListApi
+from rbczpremiumapi.records import record_converter, record_type
+from rbczpremiumapi.rest import RESTResponse
+
+PAYLOADS = os.path.join(os.path.dirname(__file__), os.pardir, "benchmarks", "payloads")
+
+with open(os.path.join(PAYLOADS, "transaction.json"), encoding="utf-8") as f:
+    TRANSACTION = json.load(f)
+
+PAGE = {"lastPage": True, "transactions": [TRANSACTION, dict(TRANSACTION, entryReference="2")]}
+
+
+class TestRecords:
+    def test_record_type(self):
+        record = record_type(GetTransactionList200ResponseTransactionsInner)
+        assert record.__name__ == "GetTransactionList200ResponseTransactionsInnerRecord"
+        assert record._fields == tuple(GetTransactionList200ResponseTransactionsInner.model_fields)
+        assert record_type(GetTransactionList200ResponseTransactionsInner) is record
+
+    def test_same_values_as_models(self):
+        page = record_converter(GetTransactionList200Response)(json.loads(json.dumps(PAGE)))
+        model = GetTransactionList200Response.from_dict(PAGE)
+        assert page.last_page is True
+        assert isinstance(page.transactions, tuple)
+        transaction, expected = page.transactions[0], model.transactions[0]
+        assert transaction.entry_reference == expected.entry_reference
+        assert transaction.amount.value == expected.amount.value
+        assert transaction.booking_date == expected.booking_date
+        assert isinstance(transaction.booking_date, datetime.datetime)
+        account = transaction.entry_details.transaction_details.related_parties.counter_party.account
+        assert account.iban == "CZ0801000000192000145399"
+        assert transaction.entry_details.transaction_details.references.end_to_end_identification == \
+            expected.entry_details.transaction_details.references.end_to_end_identification
+
+    def test_read_only(self):
+        page = record_converter(GetTransactionList200Response)({"transactions": [TRANSACTION]})
+        with pytest.raises(AttributeError):
+            page.last_page = False
+        assert not hasattr(page.transactions[0], "__dict__")
+
+    def test_missing_and_null_fields(self):
+        page = record_converter(GetTransactionList200Response)({"transactions": [None, {}]})
+        assert page.last_page is None
+        assert page.transactions[0] is None
+        assert page.transactions[1].amount is None
+
+    def test_values_are_shared(self):
+        converter = record_converter(GetTransactionList200Response)
+        first, second = converter(json.loads(json.dumps(PAGE))).transactions
+        assert first.amount.currency is second.amount.currency
+        assert first.booking_date is second.booking_date
+
+
+def _client(status=200, body=b""):
+    raw = MagicMock(status=status, reason="OK", data=body,
+                    headers={"content-type": "application/json"})
+    client = ApiClient(Configuration(host="https://api.test"))
+    client.rest_client = MagicMock()
+    client.rest_client.request.return_value = RESTResponse(raw)
+    return client
+
+
+def _get_transactions(client, **kwargs):
+    return GetTransactionListApi(client).get_transaction_list(
+        "client-id", "req-1", "1234567890", "CZK",
+        datetime.date(2024, 1, 1), datetime.date(2024, 1, 31), **kwargs
+    )
+
+
+class TestResponseMode:
+    def test_records(self):
+        client = _client(body=json.dumps(PAGE).encode("utf-8"))
+        page = _get_transactions(client, _response_mode="records")
+        assert type(page).__name__ == "GetTransactionList200ResponseRecord"
+        assert [t.entry_reference for t in page.transactions] == ["3887196517", "2"]
+
+    def test_models_by_default(self):
+        client = _client(body=json.dumps(PAGE).encode("utf-8"))
+        assert isinstance(_get_transactions(client), GetTransactionList200Response)
+
+    def test_errors_are_models(self):
+        client = _client(400, b'{"error": "INVALID_DATE", "error_description": "bad"}')
+        client.configuration.retry_policy = None
+        with pytest.raises(ApiException) as info:
+            _get_transactions(client, _response_mode="records")
+        assert info.value.data.error == "INVALID_DATE"
+
+    def test_invalid_mode(self):
+        client = _client(204)
+        with pytest.raises(ApiValueError):
+            _get_transactions(client, _response_mode="dict")
+        client.rest_client.request.assert_not_called()
+
+    def test_list_operations_only(self):
+        client = _client(204)
+        with pytest.raises(ApiValueError, match="getBalance"):
+            GetAccountBalanceApi(client).get_balance(
+                "client-id", "req-1", "1234567890", _response_mode="records"
+            )
+        with pytest.raises(ApiValueError, match="downloadStatement"):
+            DownloadStatementApi(client).download_statement(
+                "client-id", "req-1", "cs", {}, _response_mode="lazy"
+            )
+        client.rest_client.request.assert_not_called()
@@ -0,0 +1,51 @@
+# coding: utf-8
+
+"""Tests for RetryPolicy."""
+
+import email.utils
+import time
+
+from rbczpremiumapi.retry import RetryPolicy
+
+
+class TestRetryPolicy:
+    def test_retry_after_seconds(self):
+        assert RetryPolicy().delay(0, {"Retry-After": "3"}) == 3.0
+
+    def test_retry_after_http_date(self):
+        date = email.utils.formatdate(time.time() + 5, usegmt=True)
+        assert 3 < RetryPolicy().delay(0, {"Retry-After": date}) <= 5
+
+    def test_exhausted_second_window(self):
+        delay = RetryPolicy(backoff_base=0.5).delay(0, {"X-RateLimit-Remaining-Second": "0"})
+        assert 1.0 <= delay <= 1.25
+
+    def test_exhausted_day_window_gives_up(self):
+        assert RetryPolicy().delay(0, {"X-RateLimit-Remaining-Day": "0"}) is None
+
+    def test_jittered_exponential_backoff(self):
+        policy = RetryPolicy(backoff_base=0.5, backoff_max=3.0)
+        assert all(0 <= policy.delay(1) <= 1.0 for _ in range(50))
+        assert all(0 <= policy.delay(10) <= 3.0 for _ in range(50))
+
+    def test_state_respects_limits(self):
+        state = RetryPolicy(max_retries=1).start()
+        assert state.next_delay("POST", 503, {}) is None
+        assert state.next_delay("GET", 404, {}) is None
+        assert state.next_delay("GET", 503, {"Retry-After": "0"}) == 0.0
+        assert state.next_delay("GET", 503, {"Retry-After": "0"}) is None
+
+    def test_state_respects_deadline(self):
+        state = RetryPolicy(deadline=2.0).start()
+        assert state.next_delay("GET", 429, {"Retry-After": "5"}) is None
+        assert state.next_delay("GET", 429, {"Retry-After": "1"}) == 1.0
+
+    def test_state_caps_timeouts_at_deadline(self):
+        state = RetryPolicy(deadline=2.0).start()
+        assert 1 < state.timeout(None) <= 2
+        assert 1 < state.timeout(10) <= 2
+        assert state.timeout(0.5) == 0.5
+        connect, read = state.timeout((0.5, None))
+        assert connect == 0.5 and 1 < read <= 2
+        state.deadline = 0
+        assert state.timeout(10) > 0
@@ -0,0 +1,109 @@
+# coding: utf-8
+
+"""Tests for SharedMemoryRateLimitStore."""
+
+import json
+import multiprocessing
+import time
+
+import pytest
+
+from rbczpremiumapi.RateLimit.shared_memory_rate_limit_store import (
+    _SEQ,
+    SharedMemoryRateLimitStore,
+    _encode_key,
+)
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "rate_limits.shm")
+
+
+def _child(path, n):
+    store = SharedMemoryRateLimitStore(path)
+    store.set_many(f"client{n}", {"second": (n, 1000), "day": (n, 1000)})
+    store.close()
+
+
+class TestSharedMemoryRateLimitStore:
+    def test_get_returns_none_when_empty(self, path):
+        store = SharedMemoryRateLimitStore(path)
+        assert store.get("client", "second") is None
+        store.close()
+
+    def test_set_and_get(self, path):
+        store = SharedMemoryRateLimitStore(path)
+        store.set("client", "second", 9, 1000)
+        store.set("client", "second", 8, 1001)
+        store.set("client", "second", 4, 1001, operation="downloadStatement")
+        assert store.get("client", "second") == {"remaining": 8, "timestamp": 1001}
+        assert store.get("client", "second", operation="downloadStatement") == {
+            "remaining": 4, "timestamp": 1001
+        }
+        assert store.all_for_client("client") == {
+            "second": {"remaining": 8, "timestamp": 1001},
+            "downloadStatement:second": {"remaining": 4, "timestamp": 1001},
+        }
+        store.close()
+
+    def test_shared_between_processes(self, path):
+        store = SharedMemoryRateLimitStore(path, capacity=64)
+        ctx = multiprocessing.get_context("fork")
+        processes = [ctx.Process(target=_child, args=(path, n)) for n in range(8)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        assert all(store.get(f"client{n}", "day")["remaining"] == n for n in range(8))
+        store.close()
+
+    def test_capacity_of_existing_table_is_kept(self, path):
+        SharedMemoryRateLimitStore(path, capacity=4).close()
+        store = SharedMemoryRateLimitStore(path, capacity=1024)
+        now = int(time.time())
+        store.set_many("client", {"a": (1, now), "b": (2, now), "c": (3, now), "d": (4, now)})
+        assert store.get("client", "d") == {"remaining": 4, "timestamp": now}
+        with pytest.raises(OSError):
+            store.set("client", "e", 5, now)
+        with pytest.raises(OSError):
+            store.update("client", "e", lambda record: record)
+        assert store.get("client", "e") is None
+        store.close()
+
+    def test_full_table_reuses_expired_slot(self, path):
+        store = SharedMemoryRateLimitStore(path, capacity=2)
+        now = int(time.time())
+        store.set_records("client", {"second": (9, now - 2 * 86400), "op:second": (9, now * 1000)})
+        store.set("client", "day", 4999, now)
+        assert store.get("client", "day") == {"remaining": 4999, "timestamp": now}
+        assert store.get("client", "second") is None
+        assert store.get("client", "op:second") == {"remaining": 9, "timestamp": now * 1000}
+        store.close()
+
+    def test_odd_sequence_of_dead_writer_is_recovered(self, path):
+        store = SharedMemoryRateLimitStore(path)
+        store.set("client", "day", 4999, 1714780000)
+        index = store._find(_encode_key("client", "day"))
+        offset = store._offset(index)
+        _SEQ.pack_into(store._mmap, offset, 7)
+        assert store.get("client", "day") == {"remaining": 4999, "timestamp": 1714780000}
+        assert _SEQ.unpack_from(store._mmap, offset)[0] == 8
+        _SEQ.pack_into(store._mmap, offset, 9)
+        store.set("client", "day", 4998, 1714780001)
+        assert _SEQ.unpack_from(store._mmap, offset)[0] == 10
+        assert store.get("client", "day") == {"remaining": 4998, "timestamp": 1714780001}
+        store.close()
+
+    def test_flush_to_json_layout(self, path, tmp_path):
+        json_path = str(tmp_path / "rate_limits.json")
+        store = SharedMemoryRateLimitStore(path, flush_to=json_path, flush_interval=3600)
+        store.set_many("abc123", {"second": (8, 1714780000), "day": (4998, 1714780000)})
+        store.close()
+        with open(json_path) as f:
+            assert json.load(f) == {
+                "abc123": {
+                    "second": {"remaining": 8, "timestamp": 1714780000},
+                    "day": {"remaining": 4998, "timestamp": 1714780000},
+                }
+            }
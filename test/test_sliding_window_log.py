@@ -0,0 +1,49 @@
+# coding: utf-8
+
+"""Tests for SlidingWindowLog."""
+
+from rbczpremiumapi.RateLimit.sliding_window_log import SlidingWindowLog
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestSlidingWindowLog:
+    def test_burst_up_to_limit_then_waits_for_oldest(self):
+        clock = _Clock()
+        log = SlidingWindowLog(3, clock=clock)
+        assert [log.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+        clock.now += 0.25
+        assert log.reserve() == 0.75
+
+    def test_slots_expire_after_window(self):
+        clock = _Clock()
+        log = SlidingWindowLog(2, clock=clock)
+        log.reserve(2)
+        clock.now += 1.0
+        assert log.reserve() == 0.0
+
+    def test_spacing_spreads_requests(self):
+        clock = _Clock()
+        log = SlidingWindowLog(10, spacing=True, clock=clock)
+        assert log.reserve() == 0.0
+        assert abs(log.reserve() - 0.1) < 1e-9
+        assert abs(log.reserve() - 0.2) < 1e-9
+
+    def test_reserve_many_returns_wait_for_last(self):
+        clock = _Clock()
+        log = SlidingWindowLog(2, clock=clock)
+        assert log.reserve(3) == 1.0
+
+    def test_set_limit(self):
+        clock = _Clock()
+        log = SlidingWindowLog(1, clock=clock)
+        log.reserve()
+        log.set_limit(2)
+        assert log.limit == 2
+        assert log.reserve() == 0.0
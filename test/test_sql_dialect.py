@@ -5,7 +5,7 @@
 import time
 from unittest.mock import MagicMock
 
-from rbczpremiumapi.RateLimit.sql_dialect import SqlDialect
+from rbczpremiumapi.RateLimit.sql_dialect import MySqlDialect, PostgresDialect, SqlDialect, SqliteDialect
 
 
 class TestSqlDialect:
@@ -18,3 +18,24 @@ class TestSqlDialect:
         mock = MagicMock(spec=SqlDialect)
         mock.placeholder.return_value = ":test"
         assert isinstance(mock.placeholder("test"), str)
+
+    def test_sqlite_upsert(self):
+        sql = SqliteDialect().upsert("t", ["a", "b"], ["c"])
+        assert sql == (
+            "INSERT INTO t (a, b, c) VALUES (:a, :b, :c)"
+            " ON CONFLICT (a, b) DO UPDATE SET c = excluded.c"
+        )
+
+    def test_postgres_upsert(self):
+        sql = PostgresDialect().upsert("t", ["a"], ["b"])
+        assert sql == (
+            "INSERT INTO t (a, b) VALUES (%(a)s, %(b)s)"
+            " ON CONFLICT (a) DO UPDATE SET b = excluded.b"
+        )
+
+    def test_mysql_upsert(self):
+        sql = MySqlDialect().upsert("t", ["a"], ["b", "c"])
+        assert sql == (
+            "INSERT INTO t (a, b, c) VALUES (%(a)s, %(b)s, %(c)s)"
+            " ON DUPLICATE KEY UPDATE b = VALUES(b), c = VALUES(c)"
+        )
@@ -0,0 +1,116 @@
+# coding: utf-8
+
+"""Tests for TransactionFrame."""
+
+import datetime
+from types import SimpleNamespace
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from rbczpremiumapi.transaction_frame import TransactionFrame
+
+
+def _record(reference, value, indication="CRDT", booking="2024-01-05T10:30:00.0+01:00",
+            variable=None, iban=None, account_number=None):
+    record = {
+        "entryReference": reference,
+        "amount": {"value": value, "currency": "CZK"},
+        "creditDebitIndication": indication,
+        "bookingDate": booking,
+        "valueDate": "2024-01-05",
+        "bankTransactionCode": {"code": "10000101000"},
+        "entryDetails": {"transactionDetails": {
+            "remittanceInformation": {"creditorReferenceInformation": {"variable": variable}},
+        }},
+    }
+    if iban or account_number:
+        record["entryDetails"]["transactionDetails"]["relatedParties"] = {"counterParty": {
+            "account": {"iban": iban, "accountNumberPrefix": "19",
+                        "accountNumber": account_number},
+        }}
+    return record
+
+
+PAGES = [
+    {"lastPage": False, "transactions": [
+        _record("a", 100.0, variable="1", iban="CZ01"),
+        _record("b", -40.0, "DBIT", variable="2", account_number="123"),
+    ]},
+    {"lastPage": True, "transactions": [
+        _record("c", 60.0, booking=None, iban="CZ01"),
+    ]},
+    None,
+]
+
+
+class TestTransactionFrame:
+    def test_from_pages(self):
+        frame = TransactionFrame.from_pages(PAGES)
+        assert len(frame) == 3
+        assert list(frame["entry_reference"]) == ["a", "b", "c"]
+        assert frame["amount"].dtype == np.float64
+        assert list(frame["credit"]) == [True, False, True]
+        assert frame["booking_date"][0] == np.datetime64("2024-01-05T09:30:00.000")
+        assert np.isnat(frame["booking_date"][2])
+        assert frame["value_date"][0] == np.datetime64("2024-01-05T00:00:00.000")
+        assert list(frame["counterparty_account"]) == ["CZ01", "19-123", "CZ01"]
+        assert list(frame["variable_symbol"]) == ["1", "2", None]
+
+    def test_from_transactions(self):
+        transaction = SimpleNamespace(
+            entry_reference="a",
+            amount=SimpleNamespace(value=5.0, currency="EUR"),
+            credit_debit_indication="DBIT",
+            booking_date=datetime.datetime(2024, 1, 5, 10, tzinfo=datetime.timezone.utc),
+            value_date=None,
+            entry_details=None,
+        )
+        frame = TransactionFrame.from_transactions([transaction])
+        assert frame["currency"][0] == "EUR"
+        assert not frame["credit"][0]
+        assert frame["booking_date"][0] == np.datetime64("2024-01-05T10:00")
+        assert frame["counterparty_account"][0] is None
+
+    def test_vectorized_operations(self):
+        frame = TransactionFrame.from_pages(PAGES)
+        assert frame.sum() == 120.0
+        credits = frame.filter(frame["credit"])
+        assert list(credits["entry_reference"]) == ["a", "c"]
+        assert credits.sum() == 160.0
+        assert frame.group_sum("counterparty_account") == {"CZ01": 160.0, "19-123": -40.0}
+        assert frame.group_sum("variable_symbol") == {"1": 100.0, "2": -40.0}
+        assert frame.group_sum("credit") == {False: -40.0, True: 160.0}
+
+    def test_concat(self):
+        frame = TransactionFrame.from_pages(PAGES)
+        joined = TransactionFrame.concat([frame, frame.filter([0])])
+        assert list(joined["entry_reference"]) == ["a", "b", "c", "a"]
+        assert len(TransactionFrame.concat([])) == 0
+
+    def test_empty(self):
+        frame = TransactionFrame.from_pages([{"transactions": []}])
+        assert len(frame) == 0
+        assert frame.sum() == 0.0
+        assert frame.group_sum("currency") == {}
+
+    def test_columns_are_validated(self):
+        with pytest.raises(ValueError):
+            TransactionFrame({"amount": [1.0]})
+
+    def test_to_arrow(self):
+        pyarrow = pytest.importorskip("pyarrow")
+        table = TransactionFrame.from_pages(PAGES).to_arrow()
+        assert table.num_rows == 3
+        assert table.schema.field("amount").type == pyarrow.float64()
+        assert table.schema.field("booking_date").type == pyarrow.timestamp("ms")
+        assert table.column("booking_date").null_count == 1
+        assert table.column("variable_symbol").to_pylist() == ["1", "2", None]
+
+    def test_to_pandas(self):
+        pytest.importorskip("pandas")
+        frame = TransactionFrame.from_pages(PAGES)
+        df = frame.to_pandas()
+        assert list(df.columns) == list(TransactionFrame.COLUMNS)
+        assert df["amount"].sum() == 120.0
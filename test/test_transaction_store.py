@@ -0,0 +1,132 @@
+# coding: utf-8
+
+"""Tests for TransactionStore."""
+
+import datetime
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from rbczpremiumapi.transaction_store import TransactionStore
+
+
+def _transaction(reference, day, amount=100.0, variable=None, iban=None):
+    return SimpleNamespace(
+        entry_reference=reference,
+        amount=SimpleNamespace(value=amount, currency="CZK"),
+        credit_debit_indication="CRDT",
+        booking_date=datetime.datetime(2024, 1, day, 10, 30),
+        value_date=datetime.datetime(2024, 1, day),
+        bank_transaction_code=SimpleNamespace(code="10000101000"),
+        entry_details=SimpleNamespace(transaction_details=SimpleNamespace(
+            references=SimpleNamespace(end_to_end_identification=f"e2e-{reference}"),
+            remittance_information=SimpleNamespace(
+                unstructured="invoice",
+                originator_message=None,
+                creditor_reference_information=SimpleNamespace(
+                    variable=variable, constant="0308", specific=None
+                ),
+            ),
+            related_parties=SimpleNamespace(counter_party=SimpleNamespace(
+                name="ACME s.r.o.",
+                account=SimpleNamespace(iban=iban, account_number="19-123"),
+                organisation_identification=SimpleNamespace(bank_code="0100"),
+            )),
+        )),
+    )
+
+
+@pytest.fixture
+def store():
+    store = TransactionStore()
+    yield store
+    store.close()
+
+
+class TestTransactionStore:
+    def test_flattened_row(self, store):
+        assert store.add("123", "czk", [_transaction("a", 5, variable="42", iban="CZ65")]) == 1
+        assert store.find() == [{
+            "account_number": "123",
+            "currency_code": "CZK",
+            "entry_reference": "a",
+            "amount": 100.0,
+            "currency": "CZK",
+            "credit_debit_indication": "CRDT",
+            "booking_date": "2024-01-05T10:30:00",
+            "value_date": "2024-01-05T00:00:00",
+            "bank_transaction_code": "10000101000",
+            "end_to_end_identification": "e2e-a",
+            "variable_symbol": "42",
+            "constant_symbol": "0308",
+            "specific_symbol": None,
+            "remittance_information": "invoice",
+            "originator_message": None,
+            "counterparty_name": "ACME s.r.o.",
+            "counterparty_iban": "CZ65",
+            "counterparty_account_number": "19-123",
+            "counterparty_bank_code": "0100",
+        }]
+
+    def test_missing_details(self, store):
+        transaction = _transaction("a", 5)
+        transaction.entry_details = None
+        store.add("123", "CZK", [transaction])
+        row = store.find()[0]
+        assert row["variable_symbol"] is None
+        assert row["counterparty_iban"] is None
+
+    def test_upsert(self, store):
+        store.add("123", "CZK", [_transaction("a", 5), _transaction("b", 6)])
+        store.add("123", "CZK", [_transaction("a", 5, amount=7.0)])
+        assert [(r["entry_reference"], r["amount"]) for r in store.find()] == [
+            ("a", 7.0), ("b", 100.0)
+        ]
+
+    def test_find(self, store):
+        store.add("123", "CZK", [
+            _transaction("a", 3, variable="1"),
+            _transaction("b", 1, variable="2", iban="CZ01"),
+            _transaction("c", 9, variable="1"),
+        ])
+        store.add("456", "CZK", [_transaction("d", 2, variable="1")])
+
+        def references(**criteria):
+            return [r["entry_reference"] for r in store.find(**criteria)]
+
+        assert references() == ["b", "d", "a", "c"]
+        assert references(account_number="123", variable_symbol="1") == ["a", "c"]
+        assert references(counterparty_iban="CZ01") == ["b"]
+        assert references(entry_reference="d") == ["d"]
+        assert references(var_from=datetime.date(2024, 1, 2),
+                          to=datetime.date(2024, 1, 3)) == ["d", "a"]
+        assert references(to=datetime.datetime(2024, 1, 3, 10)) == ["b", "d"]
+
+    def test_indexes(self, store):
+        plan = store._conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM transactions WHERE variable_symbol = ?", ("1",)
+        ).fetchall()
+        assert "transactions_variable_symbol" in str(plan)
+
+    def test_persistent(self, tmp_path):
+        path = str(tmp_path / "transactions.db")
+        store = TransactionStore(path)
+        store.add("123", "CZK", [_transaction("a", 5)])
+        store.close()
+        store = TransactionStore(path)
+        assert len(store.find()) == 1
+        store.close()
+
+    def test_concurrent_adds(self, store):
+        threads = [
+            threading.Thread(target=store.add, args=(
+                "123", "CZK", [_transaction(f"{n}-{i}", 1 + i % 28) for i in range(50)]
+            ))
+            for n in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(store.find()) == 400
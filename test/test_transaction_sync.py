@@ -0,0 +1,124 @@
+# coding: utf-8
+
+"""Tests for TransactionSync."""
+
+import datetime
+import json
+from types import SimpleNamespace
+from typing import Optional
+from unittest.mock import MagicMock
+
+from pydantic import BaseModel
+
+from rbczpremiumapi.transaction_sync import TransactionSync
+
+
+class Transaction(BaseModel):
+    entry_reference: str
+    booking_date: Optional[datetime.datetime] = None
+    amount: float = 1.0
+
+
+class FakeApi:
+    """Lists the transactions booked in the requested range as one page."""
+
+    def __init__(self, transactions=()):
+        self.transactions = list(transactions)
+        self.ranges = []
+        self.api_client = MagicMock()
+        self.api_client.configuration.rate_limiter = None
+
+    def get_transaction_list(self, x_ibm_client_id, x_request_id, account_number,
+                             currency_code, var_from, to, psu_ip_address=None, page=None):
+        self.ranges.append((var_from, to))
+        return SimpleNamespace(
+            transactions=[t for t in self.transactions
+                          if var_from <= t.booking_date.date() <= to],
+            last_page=True,
+        )
+
+
+def _transaction(reference, day, amount=1.0):
+    return Transaction(entry_reference=reference, amount=amount,
+                       booking_date=datetime.datetime(2024, 3, day, 10))
+
+
+TODAY = datetime.date(2024, 3, 20)
+
+
+class TestTransactionSync:
+    def test_first_sync_lists_history(self):
+        api = FakeApi([_transaction("a", 1), _transaction("b", 10)])
+        sync = TransactionSync(api, "cid", window=datetime.timedelta(days=90))
+        assert [t.entry_reference for t in sync.sync("123", "CZK", to=TODAY)] == ["a", "b"]
+        assert api.ranges == [(TODAY - datetime.timedelta(days=89), TODAY)]
+        assert sync.watermark("123", "czk") == datetime.datetime(2024, 3, 10, 10)
+
+    def test_next_sync_starts_at_watermark_minus_overlap(self):
+        api = FakeApi([_transaction("a", 1), _transaction("b", 10)])
+        sync = TransactionSync(api, "cid", overlap=datetime.timedelta(days=2),
+                               window=datetime.timedelta(days=90))
+        sync.sync("123", "CZK", to=TODAY)
+        api.transactions.append(_transaction("c", 15))
+        api.ranges.clear()
+
+        assert [t.entry_reference for t in sync.sync("123", "CZK", to=TODAY)] == ["c"]
+        assert api.ranges == [(datetime.date(2024, 3, 8), TODAY)]
+        assert sync.sync("123", "CZK", to=TODAY) == []
+
+    def test_changed_transaction_is_returned_again(self):
+        api = FakeApi([_transaction("a", 10)])
+        sync = TransactionSync(api, "cid")
+        sync.sync("123", "CZK", to=TODAY)
+        api.transactions = [_transaction("a", 10, amount=2.0)]
+
+        assert [t.amount for t in sync.sync("123", "CZK", to=TODAY)] == [2.0]
+
+    def test_accounts_are_independent(self):
+        api = FakeApi([_transaction("a", 10)])
+        sync = TransactionSync(api, "cid")
+        assert len(sync.sync("123", "CZK", to=TODAY)) == 1
+        assert len(sync.sync("123", "EUR", to=TODAY)) == 1
+        assert sync.watermark("456", "CZK") is None
+
+    def test_index_keeps_only_overlap(self):
+        api = FakeApi([_transaction("old", 1), _transaction("new", 10)])
+        sync = TransactionSync(api, "cid", overlap=datetime.timedelta(days=2))
+        sync.sync("123", "CZK", to=TODAY)
+        assert list(sync._state["123/CZK"]["seen"]) == ["new"]
+
+    def test_state_survives_restart(self, tmp_path):
+        path = str(tmp_path / "sync.json")
+        api = FakeApi([_transaction("a", 10)])
+        TransactionSync(api, "cid", path=path).sync("123", "CZK", to=TODAY)
+        with open(path) as fh:
+            assert json.load(fh)["123/CZK"]["watermark"] == "2024-03-10T10:00:00"
+
+        sync = TransactionSync(api, "cid", path=path)
+        assert sync.watermark("123", "CZK") == datetime.datetime(2024, 3, 10, 10)
+        assert sync.sync("123", "CZK", to=TODAY) == []
+
+    def test_stale_watermark_is_clamped(self):
+        api = FakeApi([_transaction("a", 10)])
+        sync = TransactionSync(api, "cid", window=datetime.timedelta(days=90))
+        sync.sync("123", "CZK", to=TODAY)
+        api.ranges.clear()
+        later = TODAY + datetime.timedelta(days=200)
+        sync.sync("123", "CZK", to=later)
+        assert api.ranges[0][0] == later - datetime.timedelta(days=89)
+
+    def test_reset(self):
+        api = FakeApi([_transaction("a", 10)])
+        sync = TransactionSync(api, "cid")
+        sync.sync("123", "CZK", to=TODAY)
+        sync.reset("123", "CZK")
+        assert sync.watermark("123", "CZK") is None
+        assert len(sync.sync("123", "CZK", to=TODAY)) == 1
+
+    def test_changed_transactions_are_stored(self):
+        api = FakeApi([_transaction("a", 10)])
+        store = MagicMock()
+        sync = TransactionSync(api, "cid", store=store)
+        changed = sync.sync("123", "CZK", to=TODAY)
+        sync.sync("123", "CZK", to=TODAY)
+        store.add.assert_called_once_with("123", "CZK", changed)
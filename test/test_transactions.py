@@ -0,0 +1,272 @@
+# coding: utf-8
+
+"""Tests for the transaction paging helpers."""
+
+import datetime
+import io
+import json
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from rbczpremiumapi.api_client import ApiClient
+from rbczpremiumapi.configuration import Configuration
+from rbczpremiumapi.exceptions import ApiException
+from rbczpremiumapi.RateLimit.in_memory_rate_limit_store import InMemoryRateLimitStore
+from rbczpremiumapi.RateLimit.rate_limiter import RateLimiter
+from rbczpremiumapi.transactions import (
+    MAX_WINDOW, get_transaction_history, iter_transactions, split_range, stream_transactions,
+)
+
+
+class FakeApi:
+    """Serves *pages* lists of transactions, the last one flagged."""
+
+    def __init__(self, pages, rate_limiter=None, delay=0.0):
+        self.pages = pages
+        self.delay = delay
+        self.requested = []
+        self.request_ids = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self.api_client = MagicMock()
+        self.api_client.configuration.rate_limiter = rate_limiter
+
+    def get_transaction_list(self, x_ibm_client_id, x_request_id, account_number,
+                             currency_code, var_from, to, psu_ip_address=None, page=None):
+        with self._lock:
+            self.requested.append(page)
+            self.request_ids.append(x_request_id)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        if page > len(self.pages):
+            return None
+        return SimpleNamespace(
+            transactions=self.pages[page - 1], last_page=page == len(self.pages)
+        )
+
+
+def _pages(count, size=3):
+    return [[f"t{p}-{i}" for i in range(size)] for p in range(1, count + 1)]
+
+
+class TestIterTransactions:
+    def test_yields_pages_in_order(self):
+        api = FakeApi(_pages(6), delay=0.01)
+        result = list(iter_transactions(api, "cid", "123", "CZK", "2024-01-01", "2024-01-31",
+                                        prefetch=3))
+        assert result == [t for page in _pages(6) for t in page]
+        assert sorted(api.requested)[:6] == [1, 2, 3, 4, 5, 6]
+        # at most *prefetch* pages are requested past the last one
+        assert len(api.requested) <= 6 + 3
+
+    def test_pages_are_fetched_concurrently(self):
+        api = FakeApi(_pages(8), delay=0.05)
+        list(iter_transactions(api, "cid", "123", "CZK", "from", "to", prefetch=3))
+        assert api.max_in_flight == 4
+
+    def test_without_prefetch_pages_are_sequential(self):
+        api = FakeApi(_pages(3))
+        result = list(iter_transactions(api, "cid", "123", "CZK", "from", "to", prefetch=0))
+        assert len(result) == 9
+        assert api.requested == [1, 2, 3]
+        assert api.max_in_flight == 1
+
+    def test_prefetch_is_bounded_by_second_limit(self):
+        limiter = RateLimiter(InMemoryRateLimitStore())
+        limiter.get_limits = MagicMock(return_value={"second": 2, "day": 5000})
+        api = FakeApi(_pages(6), rate_limiter=limiter, delay=0.05)
+        list(iter_transactions(api, "cid", "123", "CZK", "from", "to", prefetch=5))
+        limiter.get_limits.assert_called_with("getTransactionList")
+        assert api.max_in_flight <= 2
+
+    def test_no_content_ends_iteration(self):
+        api = FakeApi([])
+        assert list(iter_transactions(api, "cid", "123", "CZK", "from", "to")) == []
+
+    def test_request_ids(self):
+        api = FakeApi(_pages(2))
+        list(iter_transactions(api, "cid", "123", "CZK", "from", "to", prefetch=0,
+                               x_request_id="sync-1"))
+        assert api.request_ids == ["sync-1-1", "sync-1-2"]
+
+    def test_closing_stops_fetching(self):
+        api = FakeApi(_pages(50), delay=0.01)
+        transactions = iter_transactions(api, "cid", "123", "CZK", "from", "to", prefetch=2)
+        assert next(transactions) == "t1-0"
+        transactions.close()
+        time.sleep(0.05)
+        assert len(api.requested) <= 4
+
+    def test_negative_prefetch(self):
+        with pytest.raises(ValueError):
+            next(iter_transactions(FakeApi([]), "cid", "123", "CZK", "from", "to", prefetch=-1))
+
+
+class TestSplitRange:
+    def test_dates(self):
+        windows = split_range(datetime.date(2024, 1, 1), datetime.date(2024, 1, 20))
+        assert windows == [
+            (datetime.date(2024, 1, 1), datetime.date(2024, 1, 7)),
+            (datetime.date(2024, 1, 8), datetime.date(2024, 1, 14)),
+            (datetime.date(2024, 1, 15), datetime.date(2024, 1, 20)),
+        ]
+
+    def test_single_day(self):
+        day = datetime.date(2024, 1, 1)
+        assert split_range(day, day, datetime.timedelta(days=1)) == [(day, day)]
+
+    def test_datetimes_share_boundaries(self):
+        start = datetime.datetime(2024, 1, 1, 12)
+        windows = split_range(start, start + datetime.timedelta(hours=30),
+                              datetime.timedelta(hours=12))
+        assert [end - begin for begin, end in windows] == [
+            datetime.timedelta(hours=12), datetime.timedelta(hours=12),
+            datetime.timedelta(hours=6),
+        ]
+        assert windows[0][1] == windows[1][0]
+
+    def test_windows_are_capped(self):
+        windows = split_range(datetime.date(2024, 1, 1), datetime.date(2024, 12, 31),
+                              datetime.timedelta(days=365))
+        assert all(end - start < MAX_WINDOW for start, end in windows)
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            split_range(datetime.date(2024, 2, 1), datetime.date(2024, 1, 1))
+        with pytest.raises(ValueError):
+            split_range(datetime.date(2024, 1, 1), datetime.datetime(2024, 2, 1))
+
+
+class HistoryApi(FakeApi):
+    """Serves the transactions of the requested window as one page."""
+
+    def __init__(self, transactions, delay=0.0):
+        super().__init__([], delay=delay)
+        self.transactions = transactions
+        self.windows = []
+
+    def get_transaction_list(self, x_ibm_client_id, x_request_id, account_number,
+                             currency_code, var_from, to, psu_ip_address=None, page=None):
+        super().get_transaction_list(x_ibm_client_id, x_request_id, account_number,
+                                     currency_code, var_from, to, psu_ip_address, page)
+        self.windows.append((var_from, to))
+        return SimpleNamespace(
+            transactions=[t for t in self.transactions
+                          if var_from <= t.booking_date.date() <= to],
+            last_page=True,
+        )
+
+
+def _transaction(reference, day, hour=12):
+    return SimpleNamespace(
+        entry_reference=reference,
+        booking_date=datetime.datetime(2024, 1, day, hour),
+    )
+
+
+class TestGetTransactionHistory:
+    def test_merges_windows_in_booking_order(self):
+        transactions = [_transaction(f"r{day}-{hour}", day, hour)
+                        for day in range(1, 21) for hour in (15, 9)]
+        api = HistoryApi(transactions, delay=0.01)
+        result = get_transaction_history(
+            api, "cid", "123", "CZK", datetime.date(2024, 1, 1), datetime.date(2024, 1, 20),
+            window=datetime.timedelta(days=5),
+        )
+        assert result == sorted(transactions, key=lambda t: t.booking_date)
+        assert sorted(set(api.windows)) == [
+            (datetime.date(2024, 1, d), datetime.date(2024, 1, d + 4)) for d in (1, 6, 11, 16)
+        ]
+        assert api.max_in_flight > 1
+
+    def test_duplicates_are_dropped(self):
+        first = _transaction("same", 3)
+        api = HistoryApi([first, _transaction("same", 3), _transaction("other", 2)])
+        result = get_transaction_history(
+            api, "cid", "123", "CZK", datetime.date(2024, 1, 1), datetime.date(2024, 1, 5),
+        )
+        assert [t.entry_reference for t in result] == ["other", "same"]
+        assert result[1] is first
+
+    def test_max_workers(self):
+        api = HistoryApi([], delay=0.01)
+        get_transaction_history(
+            api, "cid", "123", "CZK", datetime.date(2024, 1, 1), datetime.date(2024, 1, 20),
+            window=datetime.timedelta(days=2), max_workers=1,
+        )
+        assert api.max_in_flight == 1
+
+
+class StreamResponse(io.BytesIO):
+    """Unread urllib3 response serving *body*."""
+
+    def __init__(self, status, body=b"", headers=None):
+        super().__init__(body)
+        self.status = status
+        self.reason = "reason"
+        self.headers = headers or {}
+        self.data = body
+        self.released = False
+
+    def drain_conn(self):
+        self.read()
+
+    def release_conn(self):
+        self.released = True
+
+
+class StreamApi:
+    def __init__(self, responses):
+        self.responses = responses
+        self.calls = []
+        self.api_client = ApiClient(Configuration(host="https://api.test"))
+
+    def get_transaction_list(self, x_ibm_client_id, x_request_id, account_number,
+                             currency_code, var_from, to, psu_ip_address=None, page=None,
+                             _preload_content=True):
+        self.calls.append((page, _preload_content))
+        return self.responses[page - 1]
+
+
+def _page(references, last_page):
+    return StreamResponse(200, json.dumps({
+        "lastPage": last_page,
+        "transactions": [{"entryReference": r} for r in references],
+    }).encode())
+
+
+class TestStreamTransactions:
+    def test_pages_are_streamed(self):
+        responses = [_page(["a", "b"], False), _page(["c"], True)]
+        api = StreamApi(responses)
+        records = list(stream_transactions(api, "cid", "123", "CZK", "from", "to", chunk_size=5))
+        assert [r["entryReference"] for r in records] == ["a", "b", "c"]
+        assert api.calls == [(1, False), (2, False)]
+        assert all(r.released for r in responses)
+
+    def test_no_content(self):
+        api = StreamApi([StreamResponse(204)])
+        assert list(stream_transactions(api, "cid", "123", "CZK", "from", "to")) == []
+
+    def test_error_status_raises(self):
+        api = StreamApi([StreamResponse(400, b'{"error": "invalid"}',
+                                        {"content-type": "application/json"})])
+        with pytest.raises(ApiException) as exc_info:
+            list(stream_transactions(api, "cid", "123", "CZK", "from", "to"))
+        assert exc_info.value.status == 400
+
+    def test_closing_early_closes_connection(self):
+        response = _page(["a", "b"], True)
+        transactions = stream_transactions(StreamApi([response]), "cid", "123", "CZK", "f", "t")
+        assert next(transactions) == {"entryReference": "a"}
+        transactions.close()
+        assert response.closed
+        assert not response.released